@@ -1,11 +1,26 @@
 from __future__ import annotations
 
 import json
+import logging
+import time
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import Any, Protocol, Sequence
 
 import requests
 
+logger = logging.getLogger(__name__)
+
+_SYSTEM_PROMPT = (
+    "You are a crypto momentum risk analyst. "
+    "Respond only valid JSON with keys: "
+    "narrative_score, risk_comment, action_hint, confidence, reasons."
+)
+_BATCH_SYSTEM_PROMPT = (
+    "You are a crypto momentum risk analyst. "
+    'Respond only valid JSON of the form {"results": [...]} with one object per candidate, '
+    "each with keys: index, narrative_score, risk_comment, action_hint, confidence, reasons."
+)
+
 
 def _clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
@@ -39,6 +54,7 @@ class AnalyzerOutput:
     action_hint: str
     confidence: float
     reasons: list[str]
+    cache_hit: bool = False
 
 
 class Analyzer(Protocol):
@@ -49,12 +65,21 @@ class Analyzer(Protocol):
         ...
 
 
+class BatchAnalyzer(Analyzer, Protocol):
+    def analyze_batch(self, payloads: Sequence[AnalyzerInput]) -> list[AnalyzerOutput | AnalyzerError]:
+        """One result per payload, in order; failures are returned in place rather than raised."""
+        ...
+
+
 @dataclass(slots=True)
 class MockAnalyzer:
     provider: str = "mock"
     model: str = "mock-v1"
+    latency_seconds: float = 0.0
 
     def analyze(self, payload: AnalyzerInput) -> AnalyzerOutput:
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
         txns_term = payload.txns_h1 // 8
         h1_change = int(payload.price_change_h1 or 0.0)
         seed = (
@@ -107,6 +132,48 @@ class DeepSeekAnalyzer:
         self.session = requests.Session()
 
     def analyze(self, payload: AnalyzerInput) -> AnalyzerOutput:
+        content = self._complete(_SYSTEM_PROMPT, _build_user_prompt(payload))
+        parsed = _parse_json_payload(content)
+        return _normalize_output(parsed)
+
+    def analyze_batch(self, payloads: Sequence[AnalyzerInput]) -> list[AnalyzerOutput | AnalyzerError]:
+        """Analyze all payloads in one chat completion.
+
+        Elements missing from the reply or failing `_normalize_output` are re-requested one by
+        one; if the whole reply is unusable every payload falls back to `analyze`.
+        """
+        if len(payloads) <= 1:
+            return [self._analyze_or_error(payload) for payload in payloads]
+
+        try:
+            content = self._complete(_BATCH_SYSTEM_PROMPT, _build_batch_prompt(payloads))
+            items = _parse_batch_payload(content, len(payloads))
+        except AnalyzerError as exc:
+            logger.warning(
+                "Batch analyzer reply unusable, falling back to per-item calls | size=%s error=%s",
+                len(payloads),
+                exc,
+            )
+            items = [None] * len(payloads)
+
+        results: list[AnalyzerOutput | AnalyzerError] = []
+        for payload, item in zip(payloads, items):
+            if item is not None:
+                try:
+                    results.append(_normalize_output(item))
+                    continue
+                except AnalyzerError as exc:
+                    logger.warning("Batch item invalid for %s, retrying alone: %s", payload.token_address, exc)
+            results.append(self._analyze_or_error(payload))
+        return results
+
+    def _analyze_or_error(self, payload: AnalyzerInput) -> AnalyzerOutput | AnalyzerError:
+        try:
+            return self.analyze(payload)
+        except AnalyzerError as exc:
+            return exc
+
+    def _complete(self, system_prompt: str, user_prompt: str) -> str:
         url = f"{self.base_url}/chat/completions"
         headers = {"Authorization": f"Bearer {self.api_key}"}
         request_payload = {
@@ -116,15 +183,11 @@ class DeepSeekAnalyzer:
             "messages": [
                 {
                     "role": "system",
-                    "content": (
-                        "You are a crypto momentum risk analyst. "
-                        "Respond only valid JSON with keys: "
-                        "narrative_score, risk_comment, action_hint, confidence, reasons."
-                    ),
+                    "content": system_prompt,
                 },
                 {
                     "role": "user",
-                    "content": _build_user_prompt(payload),
+                    "content": user_prompt,
                 },
             ],
         }
@@ -141,9 +204,7 @@ class DeepSeekAnalyzer:
         except (requests.RequestException, ValueError) as exc:
             raise AnalyzerError(f"DeepSeek request failed: {exc}") from exc
 
-        content = _extract_message_content(body)
-        parsed = _parse_json_payload(content)
-        return _normalize_output(parsed)
+        return _extract_message_content(body)
 
 
 def build_market_snapshot(
@@ -181,6 +242,29 @@ def _build_user_prompt(payload: AnalyzerInput) -> str:
     )
 
 
+def _build_batch_prompt(payloads: Sequence[AnalyzerInput]) -> str:
+    lines = [f"Evaluate these {len(payloads)} meme token candidates independently:"]
+    for index, payload in enumerate(payloads):
+        risk_flags_text = ", ".join(payload.risk_flags) if payload.risk_flags else "none"
+        lines.append(
+            f"[{index}] chain={payload.chain_id}; token={payload.token_symbol} ({payload.token_address}); "
+            f"pair={payload.pair_address} on {payload.dex_id}; rule_score={payload.rule_score:.2f}; "
+            f"risk_flags={risk_flags_text}; market_snapshot={payload.market_snapshot}"
+        )
+    lines.extend(
+        [
+            'Return JSON {"results": [...]} with exactly one object per candidate, each with:',
+            "- index (the number in brackets)",
+            "- narrative_score (0-100)",
+            "- risk_comment (short string)",
+            "- action_hint (short string)",
+            "- confidence (0-1)",
+            "- reasons (array of concise strings)",
+        ]
+    )
+    return "\n".join(lines) + "\n"
+
+
 def _extract_message_content(body: dict[str, Any]) -> str:
     choices = body.get("choices")
     if not isinstance(choices, list) or not choices:
@@ -207,6 +291,34 @@ def _parse_json_payload(content: str) -> dict[str, Any]:
     return parsed
 
 
+def _parse_batch_payload(content: str, expected: int) -> list[dict[str, Any] | None]:
+    """Elements of a batch reply in payload order; `None` where the model skipped a candidate."""
+    raw = content
+    if "```" in raw:
+        raw = raw.replace("```json", "").replace("```", "").strip()
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise AnalyzerError(f"Invalid batch analyzer JSON payload: {exc}") from exc
+    if isinstance(parsed, dict):
+        parsed = parsed.get("results")
+    if not isinstance(parsed, list):
+        raise AnalyzerError("Batch analyzer payload must be a JSON array or {\"results\": [...]}")
+
+    items: list[dict[str, Any] | None] = [None] * expected
+    indexed = all(isinstance(item, dict) and isinstance(item.get("index"), int) for item in parsed)
+    if indexed:
+        for item in parsed:
+            if 0 <= item["index"] < expected and items[item["index"]] is None:
+                items[item["index"]] = item
+    elif len(parsed) == expected:
+        # No usable indexes: trust positions only when the counts line up.
+        items = [item if isinstance(item, dict) else None for item in parsed]
+    else:
+        raise AnalyzerError(f"Batch analyzer returned {len(parsed)} unindexed results for {expected} candidates")
+    return items
+
+
 def _normalize_output(payload: dict[str, Any]) -> AnalyzerOutput:
     try:
         narrative_score = float(payload.get("narrative_score"))
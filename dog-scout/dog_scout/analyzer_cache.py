@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Sequence
+
+from dog_scout.analyzer import Analyzer, AnalyzerError, AnalyzerInput, AnalyzerOutput
+from dog_scout.clients.cache import CacheStats
+from dog_scout.storage import Database
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CacheKeyPrecision:
+    """How coarsely market fields are bucketed before hashing.
+
+    Two sightings whose snapshots land in the same buckets reuse one analysis, so coarser
+    buckets mean more hits and staler narratives.
+    """
+
+    usd_significant_digits: int = 2
+    pct_step: float = 1.0
+    txns_step: int = 5
+    score_step: float = 1.0
+
+
+def _bucket(value: float | None, step: float) -> float | None:
+    if value is None:
+        return None
+    if step <= 0:
+        return round(value, 6)
+    return round(round(value / step) * step, 6)
+
+
+def _significant(value: float, digits: int) -> float:
+    if digits <= 0:
+        return round(value, 6)
+    return float(f"{value:.{digits}g}")
+
+
+def analysis_cache_key(payload: AnalyzerInput, precision: CacheKeyPrecision, provider: str, model: str) -> str:
+    """SHA-256 over the identity, bucketed market snapshot, rule score and sorted risk flags."""
+    normalized = {
+        "provider": provider,
+        "model": model,
+        "chain_id": payload.chain_id.lower(),
+        "token_address": payload.token_address.lower(),
+        "pair_address": payload.pair_address.lower(),
+        "dex_id": payload.dex_id.lower(),
+        "liquidity_usd": _significant(payload.liquidity_usd, precision.usd_significant_digits),
+        "volume_h24": _significant(payload.volume_h24, precision.usd_significant_digits),
+        "txns_h1": _bucket(payload.txns_h1, precision.txns_step),
+        "price_change_h1": _bucket(payload.price_change_h1, precision.pct_step),
+        "price_change_h24": _bucket(payload.price_change_h24, precision.pct_step),
+        "rule_score": _bucket(payload.rule_score, precision.score_step),
+        "risk_flags": sorted(set(payload.risk_flags)),
+    }
+    encoded = json.dumps(normalized, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CachingAnalyzer:
+    """Wraps any `Analyzer`, persisting outputs in `llm_cache` keyed by `analysis_cache_key`.
+
+    Failures are never cached; the wrapped analyzer's `AnalyzerError` propagates unchanged.
+    Expired rows are ignored on read and purged at most once per `prune_interval_seconds`.
+    """
+
+    def __init__(
+        self,
+        inner: Analyzer,
+        db: Database,
+        ttl_seconds: float,
+        precision: CacheKeyPrecision | None = None,
+        prune_interval_seconds: float = 300.0,
+    ) -> None:
+        self.inner = inner
+        self.db = db
+        self.ttl_seconds = ttl_seconds
+        self.precision = precision or CacheKeyPrecision()
+        self.prune_interval_seconds = prune_interval_seconds
+        self.stats = CacheStats()
+        self._last_prune = time.monotonic()
+
+    @property
+    def provider(self) -> str:
+        return self.inner.provider
+
+    @property
+    def model(self) -> str:
+        return self.inner.model
+
+    def cache_key(self, payload: AnalyzerInput) -> str:
+        return analysis_cache_key(payload, self.precision, self.provider, self.model)
+
+    def analyze(self, payload: AnalyzerInput) -> AnalyzerOutput:
+        key = self.cache_key(payload)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        self.stats.record("misses")
+        output = self.inner.analyze(payload)
+        self._store(key, output)
+        return output
+
+    def analyze_batch(self, payloads: Sequence[AnalyzerInput]) -> list[AnalyzerOutput | AnalyzerError]:
+        """Serve hits from the cache and send only the misses to the wrapped analyzer."""
+        keys = [self.cache_key(payload) for payload in payloads]
+        results: list[AnalyzerOutput | AnalyzerError | None] = [self._lookup(key) for key in keys]
+        misses = [index for index, result in enumerate(results) if result is None]
+        if misses:
+            for _ in misses:
+                self.stats.record("misses")
+            fresh = self._analyze_misses([payloads[index] for index in misses])
+            for index, output in zip(misses, fresh):
+                if isinstance(output, AnalyzerOutput):
+                    self._store(keys[index], output)
+                results[index] = output
+        return results
+
+    def _analyze_misses(self, payloads: list[AnalyzerInput]) -> list[AnalyzerOutput | AnalyzerError]:
+        analyze_batch = getattr(self.inner, "analyze_batch", None)
+        if analyze_batch is not None:
+            return analyze_batch(payloads)
+        results: list[AnalyzerOutput | AnalyzerError] = []
+        for payload in payloads:
+            try:
+                results.append(self.inner.analyze(payload))
+            except AnalyzerError as exc:
+                results.append(exc)
+        return results
+
+    def _lookup(self, key: str) -> AnalyzerOutput | None:
+        row = self.db.get_llm_cache(key)
+        if row is None:
+            return None
+        try:
+            output = AnalyzerOutput(**json.loads(row["output_json"]))
+        except (TypeError, ValueError) as exc:
+            logger.warning("Discarding unreadable llm_cache row %s: %s", key[:12], exc)
+            return None
+        self.stats.record("hits")
+        return replace(output, cache_hit=True)
+
+    def _store(self, key: str, output: AnalyzerOutput) -> None:
+        stored = asdict(output)
+        stored.pop("cache_hit", None)
+        self.db.put_llm_cache(
+            key,
+            provider=self.provider,
+            model=self.model,
+            output_json=json.dumps(stored, ensure_ascii=False),
+            ttl_seconds=self.ttl_seconds,
+        )
+        self._maybe_prune()
+
+    def _maybe_prune(self) -> None:
+        now = time.monotonic()
+        if now - self._last_prune < self.prune_interval_seconds:
+            return
+        self._last_prune = now
+        deleted = self.db.prune_llm_cache()
+        if deleted:
+            logger.info("Pruned expired llm_cache rows | deleted=%s", deleted)
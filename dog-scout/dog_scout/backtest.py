@@ -0,0 +1,548 @@
+"""Replay historical `pairs_raw` through filters/scoring/selection under alternative Settings.
+
+Reads only (via `Database.reader()`), streams rows in `fetched_at` order and keeps state
+bounded by the cooldown window and the alerts still waiting for rechecks.
+
+    python -m dog_scout.backtest --set min_liquidity_usd=30000 --set rule_weight=0.8
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import itertools
+import json
+import logging
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+from dotenv import load_dotenv
+
+from dog_scout.analyzer import AnalyzerOutput
+from dog_scout.config import Settings, apply_setting_overrides
+from dog_scout.dedup import RecentAlertIndex
+from dog_scout.filters import apply_hard_filters
+from dog_scout.logging_config import setup_logging
+from dog_scout.models import Candidate, PairSnapshot, RiskAssessment
+from dog_scout.recheck import classify_recheck_status
+from dog_scout.retention import iter_archive_records
+from dog_scout.scoring import merge_with_analyzer, score_pair
+from dog_scout.selector import select_top_candidates
+from dog_scout.storage import Database
+
+logger = logging.getLogger(__name__)
+
+NO_DATA = "NO_DATA"
+PENDING = "PENDING"
+
+
+def parse_ts(raw: str) -> datetime:
+    """ISO timestamp (stored or from the CLI) as an aware UTC datetime; naive values are taken as UTC."""
+    parsed = datetime.fromisoformat(raw)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _optional_float(value: Any) -> float | None:
+    return None if value is None else float(value)
+
+
+def check_replayable(settings: Settings) -> None:
+    """Reject settings whose live scores a replay cannot reproduce.
+
+    Trend scoring needs the rolling per-pair state of the live `FeatureEngine`; replays score each
+    row without it, so their scores would drift from the stored live ones.
+    """
+    if settings.trend_weight > 0:
+        raise ValueError(
+            f"trend_weight={settings.trend_weight} cannot be replayed (no trend features); use --set trend_weight=0"
+        )
+
+
+@dataclass(slots=True)
+class ReplayRow:
+    pair_raw_id: int
+    fetched_at: datetime
+    pair: PairSnapshot
+    risk: RiskAssessment
+    llm_output: AnalyzerOutput | None
+    is_recheck: bool
+
+
+@dataclass(slots=True)
+class SimulatedAlert:
+    alerted_at: datetime
+    chain_id: str
+    token_address: str
+    token_symbol: str
+    pair_address: str
+    final_score: float
+    rule_score: float | None
+    llm_score: float | None
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["alerted_at"] = self.alerted_at.isoformat()
+        return payload
+
+
+@dataclass(slots=True)
+class BacktestReport:
+    rows_read: int = 0
+    recheck_rows: int = 0
+    cycles: int = 0
+    candidates_passed: int = 0
+    alerts: int = 0
+    unique_tokens: int = 0
+    recheck_status: dict[str, int] = field(default_factory=dict)
+    live_alerts: int = 0
+    matched_live_alerts: int = 0
+    replay_only_alerts: int = 0
+    live_only_alerts: int = 0
+    feedback_matched: int = 0
+    feedback_wins: int = 0
+    feedback_avg_pnl_pct: float | None = None
+    first_fetched_at: str | None = None
+    last_fetched_at: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class _AlertState:
+    alerted_at: datetime
+    token_address: str
+    pair_address: str
+    initial_score: float
+    previous_score: float | None = None
+    remaining: int = 0
+
+
+def pair_from_record(record: Mapping[str, Any]) -> PairSnapshot:
+    """Rebuild a PairSnapshot from a pairs_raw row (numeric columns win over raw_json)."""
+    raw_json = record["raw_json"]
+    try:
+        raw = json.loads(raw_json) if isinstance(raw_json, str) else dict(raw_json or {})
+    except ValueError:
+        raw = {}
+    if not isinstance(raw, dict):
+        raw = {}
+    base = raw.get("baseToken") or {}
+    quote = raw.get("quoteToken") or {}
+    price_change = raw.get("priceChange") or {}
+    pair_created_at = record["pair_created_at"]
+
+    return PairSnapshot(
+        chain_id=str(record["chain_id"]),
+        pair_address=str(record["pair_address"]),
+        dex_id=str(record["dex_id"] or "unknown"),
+        base_token_address=str(record["token_address"]),
+        base_token_symbol=str(base.get("symbol") or "").strip() or "UNKNOWN",
+        quote_token_symbol=str(quote.get("symbol") or "").strip() or "UNKNOWN",
+        price_usd=float(record["price_usd"] or 0.0),
+        liquidity_usd=float(record["liquidity_usd"] or 0.0),
+        volume_h24=float(record["volume_h24"] or 0.0),
+        txns_h1_buys=int(record["txns_h1_buys"] or 0),
+        txns_h1_sells=int(record["txns_h1_sells"] or 0),
+        price_change_h1=_optional_float(price_change.get("h1")),
+        price_change_h24=_optional_float(price_change.get("h24")),
+        pair_created_at=parse_ts(pair_created_at) if pair_created_at else None,
+        raw=raw,
+    )
+
+
+def replay_row_from_record(record: Mapping[str, Any]) -> ReplayRow:
+    risk_flags_raw = record["risk_flags"]
+    risk_flags = json.loads(risk_flags_raw) if isinstance(risk_flags_raw, str) else list(risk_flags_raw or [])
+    llm_score = record["llm_score"]
+    llm_output = None
+    if llm_score is not None:
+        llm_output = AnalyzerOutput(
+            narrative_score=float(llm_score),
+            risk_comment="replay",
+            action_hint="replay",
+            confidence=float(record["llm_confidence"] or 0.0),
+            reasons=["recorded_llm_score"],
+        )
+    fetched_at = record["fetched_at"]
+    return ReplayRow(
+        pair_raw_id=int(record["id"]),
+        fetched_at=fetched_at if isinstance(fetched_at, datetime) else parse_ts(str(fetched_at)),
+        pair=pair_from_record(record),
+        risk=RiskAssessment(
+            is_honeypot="honeypot" in risk_flags,
+            risk_flags=[flag for flag in risk_flags if flag != "denylisted_token"],
+            holders=None if record["holders"] is None else int(record["holders"]),
+            top10_concentration=_optional_float(record["top10_concentration"]),
+            metadata={"provider": "replay"},
+        ),
+        llm_output=llm_output,
+        is_recheck=bool(record["is_recheck"]),
+    )
+
+
+def iter_db_replay_rows(
+    db: Database,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    chunk_size: int = 5_000,
+) -> Iterator[ReplayRow]:
+    for record in db.iter_replay_rows(start=start, end=end, chunk_size=chunk_size):
+        yield replay_row_from_record(record)
+
+
+def iter_archive_replay_rows(
+    archive_dir: str | Path,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> Iterator[ReplayRow]:
+    """Replay rows from `dog_scout.retention` archives (all older than anything still in the DB)."""
+    for record in iter_archive_records(archive_dir, start=start, end=end):
+        yield replay_row_from_record(record)
+
+
+class _ReplayDedupStore:
+    """DedupStore adapter whose clock is the replay time, not wall time."""
+
+    def __init__(self, index: RecentAlertIndex) -> None:
+        self.index = index
+        self.now: datetime | None = None
+
+    def has_recent_alert(self, token_address: str, pair_address: str, cooldown_minutes: int) -> bool:
+        return self.index.has_recent_alert(token_address, pair_address, cooldown_minutes, now=self.now)
+
+
+class BacktestEngine:
+    """Feed ReplayRows in fetched_at order, then call `finish()` for the report.
+
+    Rows within `cycle_window_seconds` of the first row of a cycle form one scan cycle.
+    Rows written by live rechecks only serve as market observations for simulated rechecks.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        recheck_minutes: Sequence[int] | None = None,
+        cycle_window_seconds: float = 60.0,
+        alert_sink: Callable[[SimulatedAlert], None] | None = None,
+        live_alerts: Iterable[Mapping[str, Any]] = (),
+        feedback: Iterable[Mapping[str, Any]] = (),
+    ) -> None:
+        self.settings = settings
+        if recheck_minutes is None:
+            recheck_minutes = settings.recheck_minutes
+        self.recheck_minutes = tuple(sorted(int(minute) for minute in recheck_minutes))
+        self.cycle_window = timedelta(seconds=cycle_window_seconds)
+        self.alert_sink = alert_sink
+        self.report = BacktestReport()
+
+        self._cooldown = timedelta(minutes=settings.dedup_cooldown_minutes)
+        self._dedup = _ReplayDedupStore(RecentAlertIndex(ttl_minutes=settings.dedup_cooldown_minutes))
+        self._cycle: list[ReplayRow] = []
+        self._cycle_start: datetime | None = None
+        self._tokens: set[str] = set()
+        self._status: Counter[str] = Counter()
+
+        self._due: list[tuple[datetime, int, int, int]] = []
+        self._seq = 0
+        self._alerts: dict[int, _AlertState] = {}
+        self._watched: Counter[str] = Counter()
+        self._latest: dict[str, ReplayRow] = {}
+
+        self._live: dict[str, list[tuple[datetime, int]]] = {}
+        self._matched_live: set[int] = set()
+        for live in live_alerts:
+            self._live.setdefault(str(live["pair_address"]), []).append(
+                (parse_ts(str(live["created_at"])), int(live["id"]))
+            )
+        self.report.live_alerts = sum(len(items) for items in self._live.values())
+
+        self._feedback: dict[str, list[tuple[datetime, float | None]]] = {}
+        for row in feedback:
+            self._feedback.setdefault(str(row["pair_address"]), []).append(
+                (parse_ts(str(row["alert_created_at"])), _optional_float(row["pnl_pct"]))
+            )
+        self._pnl_total = 0.0
+        self._pnl_count = 0
+
+    def run(self, rows: Iterable[ReplayRow]) -> BacktestReport:
+        for row in rows:
+            self.feed(row)
+        return self.finish()
+
+    def feed(self, row: ReplayRow) -> None:
+        if self.report.first_fetched_at is None:
+            self.report.first_fetched_at = row.fetched_at.isoformat()
+        self.report.last_fetched_at = row.fetched_at.isoformat()
+        self.report.rows_read += 1
+
+        if self._cycle_start is not None and row.fetched_at - self._cycle_start > self.cycle_window:
+            self._flush_cycle()
+        if self._cycle_start is None:
+            self._cycle_start = row.fetched_at
+        self._cycle.append(row)
+
+    def finish(self) -> BacktestReport:
+        self._flush_cycle()
+        if self.report.last_fetched_at is not None:
+            self._resolve_due(parse_ts(self.report.last_fetched_at))
+        self._status[PENDING] += len(self._due)
+        self._due.clear()
+
+        self.report.unique_tokens = len(self._tokens)
+        self.report.recheck_status = dict(sorted(self._status.items()))
+        self.report.matched_live_alerts = len(self._matched_live)
+        self.report.live_only_alerts = self.report.live_alerts - len(self._matched_live)
+        if self._pnl_count:
+            self.report.feedback_avg_pnl_pct = round(self._pnl_total / self._pnl_count, 4)
+        return self.report
+
+    def _flush_cycle(self) -> None:
+        rows, self._cycle, self._cycle_start = self._cycle, [], None
+        if not rows:
+            return
+        self.report.cycles += 1
+        now = rows[-1].fetched_at
+
+        for row in rows:
+            if self._watched[row.pair.pair_address] > 0:
+                self._latest[row.pair.pair_address] = row
+        self._resolve_due(now)
+
+        candidates: list[Candidate] = []
+        for row in rows:
+            if row.is_recheck:
+                self.report.recheck_rows += 1
+                continue
+            candidate = self._evaluate(row)
+            if candidate.filter_outcome.passed:
+                candidates.append(candidate)
+        self.report.candidates_passed += len(candidates)
+
+        self._dedup.now = now
+        selected = select_top_candidates(
+            candidates=candidates,
+            top_n=self.settings.top_n,
+            cooldown_minutes=self.settings.dedup_cooldown_minutes,
+            dedup_store=self._dedup,
+        )
+        for candidate in selected:
+            self._emit_alert(candidate, now)
+
+    def _evaluate(self, row: ReplayRow) -> Candidate:
+        risk = row.risk
+        if row.pair.base_token_address.lower() in self.settings.denylist_tokens:
+            risk = RiskAssessment(
+                is_honeypot=True,
+                risk_flags=[*risk.risk_flags, "denylisted_token"],
+                holders=risk.holders,
+                top10_concentration=risk.top10_concentration,
+                metadata=risk.metadata,
+            )
+        filter_outcome = apply_hard_filters(row.pair, risk, self.settings)
+        score = merge_with_analyzer(
+            rule_breakdown=score_pair(row.pair, self.settings),
+            analyzer_output=row.llm_output,
+            settings=self.settings,
+            analyzer_provider="replay" if row.llm_output is not None else None,
+        )
+        return Candidate(
+            pair=row.pair,
+            risk=risk,
+            filter_outcome=filter_outcome,
+            score=score,
+            pair_raw_id=row.pair_raw_id,
+        )
+
+    def _emit_alert(self, candidate: Candidate, now: datetime) -> None:
+        pair = candidate.pair
+        self._dedup.index.record(pair.base_token_address, pair.pair_address, now)
+        self._tokens.add(pair.base_token_address)
+        self.report.alerts += 1
+
+        alert = SimulatedAlert(
+            alerted_at=now,
+            chain_id=pair.chain_id,
+            token_address=pair.base_token_address,
+            token_symbol=pair.base_token_symbol,
+            pair_address=pair.pair_address,
+            final_score=candidate.score.final_score,
+            rule_score=candidate.score.rule_score,
+            llm_score=candidate.score.llm_score,
+        )
+        self._match_live_and_feedback(alert)
+        if self.alert_sink is not None:
+            self.alert_sink(alert)
+
+        if not self.recheck_minutes:
+            return
+        alert_key = self.report.alerts
+        self._alerts[alert_key] = _AlertState(
+            alerted_at=now,
+            token_address=pair.base_token_address,
+            pair_address=pair.pair_address,
+            initial_score=candidate.score.final_score,
+            remaining=len(self.recheck_minutes),
+        )
+        self._watched[pair.pair_address] += 1
+        for minute in self.recheck_minutes:
+            self._seq += 1
+            heapq.heappush(self._due, (now + timedelta(minutes=minute), self._seq, alert_key, minute))
+
+    def _match_live_and_feedback(self, alert: SimulatedAlert) -> None:
+        for created_at, live_id in self._live.get(alert.pair_address, ()):
+            if abs(created_at - alert.alerted_at) <= self._cooldown and live_id not in self._matched_live:
+                self._matched_live.add(live_id)
+                break
+        else:
+            self.report.replay_only_alerts += 1
+
+        closest: tuple[timedelta, float | None] | None = None
+        for created_at, pnl_pct in self._feedback.get(alert.pair_address, ()):
+            distance = abs(created_at - alert.alerted_at)
+            if distance <= self._cooldown and (closest is None or distance < closest[0]):
+                closest = (distance, pnl_pct)
+        if closest is None:
+            return
+        self.report.feedback_matched += 1
+        pnl_pct = closest[1]
+        if pnl_pct is not None:
+            self._pnl_total += pnl_pct
+            self._pnl_count += 1
+            if pnl_pct > 0:
+                self.report.feedback_wins += 1
+
+    def _resolve_due(self, now: datetime) -> None:
+        while self._due and self._due[0][0] <= now:
+            due_at, _, alert_key, _minute = heapq.heappop(self._due)
+            state = self._alerts[alert_key]
+            observation = self._latest.get(state.pair_address)
+            if observation is None or observation.fetched_at <= state.alerted_at:
+                self._status[NO_DATA] += 1
+            else:
+                candidate = self._evaluate(observation)
+                status = classify_recheck_status(
+                    passed_filters=candidate.filter_outcome.passed,
+                    initial_score=state.initial_score,
+                    previous_score=state.previous_score,
+                    current_score=candidate.score.final_score,
+                )
+                state.previous_score = candidate.score.final_score
+                self._status[status] += 1
+                # Live rechecks write an alert row, which extends the dedup cooldown.
+                self._dedup.index.record(state.token_address, state.pair_address, due_at)
+
+            state.remaining -= 1
+            if state.remaining <= 0:
+                del self._alerts[alert_key]
+                self._watched[state.pair_address] -= 1
+                if self._watched[state.pair_address] <= 0:
+                    del self._watched[state.pair_address]
+                    self._latest.pop(state.pair_address, None)
+
+
+def run_backtest(
+    db: Database,
+    settings: Settings,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    cycle_window_seconds: float = 60.0,
+    alert_sink: Callable[[SimulatedAlert], None] | None = None,
+    rows: Iterable[ReplayRow] | None = None,
+) -> BacktestReport:
+    check_replayable(settings)
+    engine = BacktestEngine(
+        settings=settings,
+        recheck_minutes=settings.recheck_minutes,
+        cycle_window_seconds=cycle_window_seconds,
+        alert_sink=alert_sink,
+        live_alerts=db.list_initial_alerts(start=start, end=end),
+        feedback=db.list_trade_feedback(),
+    )
+    return engine.run(rows if rows is not None else iter_db_replay_rows(db, start=start, end=end))
+
+
+def parse_overrides(items: Sequence[str]) -> dict[str, str]:
+    overrides: dict[str, str] = {}
+    for item in items:
+        name, sep, value = item.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"Override must look like name=value: {item!r}")
+        overrides[name.strip()] = value
+    return overrides
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay pairs_raw under alternative Settings")
+    parser.add_argument("--db-path", default=None, help="Override sqlite db path")
+    parser.add_argument("--start", default=None, help="ISO timestamp (UTC) lower bound on fetched_at")
+    parser.add_argument("--end", default=None, help="ISO timestamp (UTC) upper bound on fetched_at")
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Settings override, e.g. --set min_liquidity_usd=30000 (repeatable)",
+    )
+    parser.add_argument("--cycle-window-seconds", type=float, default=60.0)
+    parser.add_argument("--alerts-out", default=None, help="Write simulated alerts as JSONL")
+    parser.add_argument(
+        "--archive-dir",
+        default=None,
+        help="Also replay pairs_raw archives written by dog_scout.retention (read before the live DB)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    load_dotenv()
+    setup_logging()
+    args = parse_args(argv)
+
+    settings = Settings.from_env()
+    if args.db_path:
+        settings = apply_setting_overrides(settings, {"db_path": args.db_path})
+    settings = apply_setting_overrides(settings, parse_overrides(args.overrides))
+    start = parse_ts(args.start) if args.start else None
+    end = parse_ts(args.end) if args.end else None
+
+    db = Database.from_settings(settings)
+    alerts_file = open(args.alerts_out, "w", encoding="utf-8") if args.alerts_out else None
+    try:
+        sink = None
+        if alerts_file is not None:
+            sink = lambda alert: alerts_file.write(json.dumps(alert.to_dict(), ensure_ascii=False) + "\n")  # noqa: E731
+        rows = None
+        if args.archive_dir:
+            rows = itertools.chain(
+                iter_archive_replay_rows(args.archive_dir, start=start, end=end),
+                iter_db_replay_rows(db, start=start, end=end),
+            )
+        report = run_backtest(
+            db,
+            settings,
+            start=start,
+            end=end,
+            cycle_window_seconds=args.cycle_window_seconds,
+            alert_sink=sink,
+            rows=rows,
+        )
+    finally:
+        if alerts_file is not None:
+            alerts_file.close()
+        db.close()
+
+    payload = report.to_dict()
+    payload["overrides"] = parse_overrides(args.overrides)
+    json.dump(payload, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""End-to-end scan benchmark against a seeded synthetic market served by a local fake upstream.
+
+Runs real `ScoutPipeline` cycles (HTTP clients, scoring, analyzer, notifier, SQLite) and
+reports cycle latency, per-stage latency, database growth and rows written per second as JSON:
+
+    python -m dog_scout.bench --tokens 100 --cycles 20 --latency-ms 40 --error-rate 0.02 \\
+        --output bench.json --baseline previous.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from dotenv import load_dotenv
+
+from dog_scout.backtest import parse_overrides
+from dog_scout.config import Settings, apply_setting_overrides, scan_chain_ids
+from dog_scout.logging_config import setup_logging
+from dog_scout.metrics import QUANTILES, RollingSummary
+from dog_scout.outbox import OutboxSender
+from dog_scout.pipeline import ScoutPipeline
+from dog_scout.storage import Database
+from dog_scout.synthetic import FakeService, FakeUpstream, SyntheticMarket
+
+logger = logging.getLogger(__name__)
+
+# Compared against `--baseline`; for all of them lower is better except rows/sec.
+_COMPARED = {
+    "cycle_latency_ms.p50": False,
+    "cycle_latency_ms.p95": False,
+    "db.growth_bytes_per_cycle": False,
+    "rows.per_second": True,
+}
+
+
+def bench_settings(settings: Settings, upstream: FakeUpstream, market: SyntheticMarket, llm: bool = True) -> Settings:
+    """Point every upstream at the fake server and size the scan to the synthetic market.
+
+    Client-side rate limits are off: cycles run back to back instead of `loop_interval_seconds`
+    apart, so buckets that would refill between real cycles would dominate the timings.
+    """
+    return replace(
+        settings,
+        use_mock_data=False,
+        dry_run=False,
+        chain_ids=set(market.chain_ids),
+        max_new_tokens=market.tokens_per_chain,
+        dexscreener_base_url=upstream.base_url,
+        telegram_enabled=True,
+        telegram_base_url=upstream.base_url,
+        telegram_bot_token=settings.telegram_bot_token or "bench",
+        telegram_chat_id=settings.telegram_chat_id or "bench",
+        llm_enabled=llm,
+        llm_provider="deepseek",
+        llm_base_url=upstream.base_url,
+        llm_api_key=settings.llm_api_key or "bench",
+        risk_provider="mock",
+        http_cache_enabled=False,
+        fetch_rate_limit_per_second=0.0,
+        telegram_rate_limit_per_second=0.0,
+        metrics_jsonl_path="",
+    )
+
+
+def run_bench(
+    settings: Settings,
+    market: SyntheticMarket,
+    upstream: FakeUpstream,
+    cycles: int,
+    interval_seconds: float = 120.0,
+) -> dict[str, Any]:
+    """Run `cycles` scans against `upstream` (already started) and return the JSON report.
+
+    The market advances `interval_seconds` of simulated time between cycles; the wall clock
+    does not, so rechecks never come due here.
+    """
+    db = Database.from_settings(settings)
+    db.ensure_initialized()
+    pipeline = ScoutPipeline(settings=settings, db=db)
+    sender = OutboxSender.from_settings(db, pipeline.notifier, settings) if settings.notify_mode == "outbox" else None
+    latency = RollingSummary(window=max(cycles, 1))
+    per_cycle: list[dict[str, Any]] = []
+    written: dict[str, int] = {}
+    busy_seconds = 0.0
+    try:
+        initial_bytes = _db_bytes(db)
+        counts = _row_counts(db)
+        for cycle in range(cycles):
+            if cycle:
+                market.advance(interval_seconds)
+            started = time.perf_counter()
+            result = pipeline.run_once()
+            if sender is not None:
+                sender.run_once()
+            elapsed = time.perf_counter() - started
+            busy_seconds += elapsed
+            latency.observe(elapsed * 1000.0)
+
+            after = _row_counts(db)
+            rows = {table: after[table] - counts.get(table, 0) for table in after}
+            rows = {table: added for table, added in rows.items() if added}
+            for table, added in rows.items():
+                written[table] = written.get(table, 0) + added
+            counts = after
+            per_cycle.append(
+                {
+                    "cycle": cycle,
+                    "latency_ms": round(elapsed * 1000.0, 3),
+                    "fetched_pairs": result.fetched_pairs,
+                    "passed_filters": result.passed_filters,
+                    "selected": result.selected,
+                    "rows_written": sum(rows.values()),
+                    "db_bytes": _db_bytes(db),
+                }
+            )
+        final_bytes = _db_bytes(db)
+        stages = pipeline.metrics.snapshot().get("dog_scout_stage_seconds", [])
+    finally:
+        pipeline.close()
+        db.close()
+
+    total_rows = sum(written.values())
+    return {
+        "config": {
+            "cycles": cycles,
+            "chains": market.chain_ids,
+            "tokens_per_chain": market.tokens_per_chain,
+            "turnover": market.turnover,
+            "interval_seconds": interval_seconds,
+            "llm_enabled": settings.llm_enabled,
+            "notify_mode": settings.notify_mode,
+            "services": {name: _service_dict(service) for name, service in upstream.services.items()},
+        },
+        "cycle_latency_ms": {
+            "mean": round(latency.total / latency.count, 3) if latency.count else None,
+            **{f"p{round(q * 100)}": _round(latency.quantile(q)) for q in QUANTILES},
+            "max": max((cycle["latency_ms"] for cycle in per_cycle), default=None),
+        },
+        "stage_latency_ms": {
+            stage["labels"]["stage"]: {
+                key: round(float(value) * 1000.0, 3) for key, value in stage.items() if key.startswith("p")
+            }
+            for stage in stages
+        },
+        "db": {
+            "initial_bytes": initial_bytes,
+            "final_bytes": final_bytes,
+            "growth_bytes": final_bytes - initial_bytes,
+            "growth_bytes_per_cycle": round((final_bytes - initial_bytes) / cycles, 1) if cycles else 0.0,
+        },
+        "rows": {
+            "written": dict(sorted(written.items())),
+            "total": total_rows,
+            "per_second": round(total_rows / busy_seconds, 1) if busy_seconds > 0 else 0.0,
+        },
+        "upstream": upstream.stats(),
+        "cycles": per_cycle,
+    }
+
+
+def compare_reports(baseline: Mapping[str, Any], current: Mapping[str, Any]) -> dict[str, dict[str, Any]]:
+    """Relative change of the headline metrics; `regressed` when it moved the wrong way by >10%."""
+    comparison: dict[str, dict[str, Any]] = {}
+    for path, higher_is_better in _COMPARED.items():
+        before, after = _lookup(baseline, path), _lookup(current, path)
+        if not isinstance(before, (int, float)) or not isinstance(after, (int, float)) or before == 0:
+            continue
+        change = (after - before) / abs(before)
+        comparison[path] = {
+            "baseline": before,
+            "current": after,
+            "change_pct": round(change * 100.0, 1),
+            "regressed": (change < -0.1) if higher_is_better else (change > 0.1),
+        }
+    return comparison
+
+
+def _row_counts(db: Database) -> dict[str, int]:
+    with db.reader() as conn:
+        tables = [
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+            )
+        ]
+        return {table: int(conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]) for table in tables}
+
+
+def _db_bytes(db: Database) -> int:
+    # Logical size as a reader sees it, so pages still sitting in the WAL count and checkpoints don't.
+    with db.reader() as conn:
+        row = conn.execute("SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size()").fetchone()
+    return int(row[0])
+
+
+def _lookup(report: Mapping[str, Any], path: str) -> Any:
+    value: Any = report
+    for key in path.split("."):
+        value = value.get(key) if isinstance(value, Mapping) else None
+    return value
+
+
+def _round(value: float) -> float | None:
+    return None if value != value else round(value, 3)  # NaN when no cycle ran
+
+
+def _service_dict(service: FakeService) -> dict[str, float]:
+    return {
+        "latency_seconds": service.latency_seconds,
+        "jitter_seconds": service.jitter_seconds,
+        "error_rate": service.error_rate,
+    }
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark scan cycles against a synthetic market")
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--tokens", type=int, default=30, help="Latest tokens listed per chain and cycle")
+    parser.add_argument("--chains", default="base", help="Comma-separated chain ids")
+    parser.add_argument("--turnover", type=float, default=0.3, help="Share of fresh tokens per cycle")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--interval-seconds", type=float, default=120.0, help="Simulated market time per cycle")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fake Dexscreener/Telegram latency")
+    parser.add_argument("--llm-latency-ms", type=float, default=None, help="Fake DeepSeek latency (default: same)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform extra latency per request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of fake requests answered with 500")
+    parser.add_argument("--no-llm", action="store_true", help="Skip the DeepSeek analyzer")
+    parser.add_argument("--db-path", default=None, help="Keep the benchmark database here (default: temp dir)")
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Settings override, e.g. --set fetch_concurrency=20 (repeatable)",
+    )
+    parser.add_argument("--output", default=None, help="Write the JSON report here as well as to stdout")
+    parser.add_argument("--baseline", default=None, help="Earlier --output report to compare against")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    load_dotenv()
+    setup_logging(logging.WARNING)
+    args = parse_args(argv)
+
+    market = SyntheticMarket(
+        seed=args.seed,
+        chain_ids=[chain.strip().lower() for chain in args.chains.split(",") if chain.strip()] or ["base"],
+        tokens_per_chain=args.tokens,
+        turnover=args.turnover,
+    )
+    llm_latency_ms = args.llm_latency_ms if args.llm_latency_ms is not None else args.latency_ms
+    upstream = FakeUpstream(
+        market,
+        dexscreener=FakeService(args.latency_ms / 1000.0, args.jitter_ms / 1000.0, args.error_rate),
+        telegram=FakeService(args.latency_ms / 1000.0, args.jitter_ms / 1000.0, args.error_rate),
+        deepseek=FakeService(llm_latency_ms / 1000.0, args.jitter_ms / 1000.0, args.error_rate),
+        seed=args.seed,
+    )
+    with tempfile.TemporaryDirectory() as tmpdir, upstream:
+        settings = bench_settings(Settings.from_env(), upstream, market, llm=not args.no_llm)
+        settings = apply_setting_overrides(settings, {"db_path": args.db_path or str(Path(tmpdir) / "bench.db")})
+        settings = apply_setting_overrides(settings, parse_overrides(args.overrides))
+        logger.warning("bench | chains=%s cycles=%s", ",".join(scan_chain_ids(settings)), args.cycles)
+        report = run_bench(settings, market, upstream, args.cycles, interval_seconds=args.interval_seconds)
+
+    report["overrides"] = parse_overrides(args.overrides)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            report["comparison"] = compare_reports(json.load(handle), report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, ensure_ascii=False, indent=2)
+            handle.write("\n")
+    json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    payload: Any
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def age_seconds(self, now: float | None = None) -> float:
+        return (now if now is not None else time.time()) - self.stored_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def refreshed(self, now: float | None = None) -> "CachedResponse":
+        return replace(self, stored_at=now if now is not None else time.time())
+
+
+class ResponseCache(Protocol):
+    def get(self, key: str) -> CachedResponse | None:
+        ...
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        ...
+
+
+class CacheStats:
+    """Thread-safe counters: fresh hits, 304 revalidations, misses (full downloads)."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "revalidated": self.revalidated, "misses": self.misses}
+
+
+class MemoryResponseCache:
+    """Bounded LRU of responses, shared by the fetch threads."""
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self.max_entries = max(max_entries, 1)
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteResponseCache:
+    """On-disk tier so validators and payloads survive restarts (separate file from the app DB)."""
+
+    def __init__(self, path: Path, max_age_seconds: float = 86_400.0) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL
+            )
+            """
+        )
+        self.prune(max_age_seconds)
+
+    def get(self, key: str) -> CachedResponse | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, etag, last_modified, stored_at FROM http_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            payload = json.loads(row[0])
+        except ValueError:
+            logger.warning("Dropping undecodable cache entry: %s", key)
+            return None
+        return CachedResponse(payload=payload, etag=row[1], last_modified=row[2], stored_at=float(row[3]))
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        payload = json.dumps(entry.payload, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO http_cache (key, payload, etag, last_modified, stored_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    payload = excluded.payload,
+                    etag = excluded.etag,
+                    last_modified = excluded.last_modified,
+                    stored_at = excluded.stored_at
+                """,
+                (key, payload, entry.etag, entry.last_modified, entry.stored_at),
+            )
+
+    def prune(self, max_age_seconds: float) -> int:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM http_cache WHERE stored_at < ?",
+                (time.time() - max_age_seconds,),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class TieredResponseCache:
+    """Memory first, then disk; disk hits are promoted into memory."""
+
+    def __init__(self, memory: MemoryResponseCache, disk: SQLiteResponseCache) -> None:
+        self.memory = memory
+        self.disk = disk
+
+    def get(self, key: str) -> CachedResponse | None:
+        entry = self.memory.get(key)
+        if entry is not None:
+            return entry
+        entry = self.disk.get(key)
+        if entry is not None:
+            self.memory.put(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        self.memory.put(key, entry)
+        self.disk.put(key, entry)
+
+
+def build_response_cache(max_entries: int, path: str | Path | None = None) -> ResponseCache:
+    memory = MemoryResponseCache(max_entries=max_entries)
+    if not path:
+        return memory
+    return TieredResponseCache(memory, SQLiteResponseCache(Path(path).expanduser()))
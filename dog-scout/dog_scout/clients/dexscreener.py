@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Mapping, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from dog_scout.models import PairSnapshot
+from dog_scout.clients.cache import CachedResponse, CacheStats, ResponseCache
+from dog_scout.models import PairSnapshot, TokenProfile
+from dog_scout.ratelimit import HostRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -16,16 +23,64 @@ class DexscreenerClient:
 
     base_url = "https://api.dexscreener.com"
 
-    def __init__(self, timeout_seconds: int = 10) -> None:
+    TOKEN_PAIRS = "token-pairs"
+    TOKEN_PROFILES = "token-profiles"
+
+    def __init__(
+        self,
+        timeout_seconds: int = 10,
+        max_concurrency: int = 8,
+        rate_limit_per_second: float = 0.0,
+        rate_limit_burst: int = 1,
+        base_url: str | None = None,
+        cache: ResponseCache | None = None,
+        cache_ttl_seconds: Mapping[str, float] | None = None,
+        chain_count: int = 1,
+    ) -> None:
         self.timeout_seconds = timeout_seconds
+        self.max_concurrency = max(max_concurrency, 1)
+        if base_url:
+            self.base_url = base_url.rstrip("/")
+        self.rate_limiter = HostRateLimiter(rate_limit_per_second, rate_limit_burst)
+        # Per-endpoint freshness; stale entries with validators are revalidated (304) instead.
+        self.cache = cache
+        self.cache_ttl_seconds = dict(cache_ttl_seconds or {})
+        self.cache_stats = CacheStats()
         self.session = requests.Session()
+        # Default urllib3 pool keeps 10 connections; size it to the fan-out width (per chain, all chains at once).
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(self.max_concurrency * max(chain_count, 1), 10))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
-    def _get_json(self, path: str) -> Any:
+    def _get_json(
+        self,
+        path: str,
+        endpoint: str | None = None,
+        cache_key: str | None = None,
+        max_age_seconds: float | None = None,
+    ) -> Any:
         url = f"{self.base_url}{path}"
+        cache = self.cache if endpoint and cache_key else None
+        cached = cache.get(cache_key) if cache is not None else None
+        if max_age_seconds is None:
+            max_age_seconds = self.cache_ttl_seconds.get(endpoint, 0.0)
+        if cached is not None and cached.age_seconds() < max_age_seconds:
+            self.cache_stats.record("hits")
+            return cached.payload
+
+        self.rate_limiter.acquire_for_url(url)
         try:
-            response = self.session.get(url, timeout=self.timeout_seconds)
+            response = self.session.get(
+                url,
+                timeout=self.timeout_seconds,
+                headers=cached.conditional_headers() if cached is not None else None,
+            )
+            if response.status_code == 304 and cached is not None:
+                self.cache_stats.record("revalidated")
+                cache.put(cache_key, cached.refreshed())
+                return cached.payload
             response.raise_for_status()
-            return response.json()
+            payload = response.json()
         except requests.RequestException as exc:
             logger.warning("Dexscreener request failed: %s (%s)", url, exc)
             return None
@@ -33,31 +88,70 @@ class DexscreenerClient:
             logger.warning("Dexscreener JSON decode failed: %s (%s)", url, exc)
             return None
 
-    def fetch_latest_base_tokens(self, max_tokens: int) -> list[str]:
-        payload = self._get_json("/token-profiles/latest/v1")
+        if cache is not None:
+            self.cache_stats.record("misses")
+            cache.put(
+                cache_key,
+                CachedResponse(
+                    payload=payload,
+                    stored_at=time.time(),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                ),
+            )
+        return payload
+
+    def fetch_latest_profiles(self, chain_ids: Sequence[str], max_tokens: int) -> dict[str, list[TokenProfile]]:
+        """Latest token profiles grouped by chain, up to `max_tokens` per chain, from one request."""
+        wanted = [chain_id.lower() for chain_id in chain_ids]
+        profiles_by_chain: dict[str, list[TokenProfile]] = {chain_id: [] for chain_id in wanted}
+        payload = self._get_json(
+            "/token-profiles/latest/v1",
+            endpoint=self.TOKEN_PROFILES,
+            cache_key="token-profiles:latest",
+        )
         if not isinstance(payload, list):
-            return []
+            return profiles_by_chain
 
-        token_addresses: list[str] = []
-        seen: set[str] = set()
+        seen: set[tuple[str, str]] = set()
         for item in payload:
             if not isinstance(item, dict):
                 continue
             chain_id = str(item.get("chainId", "")).lower()
             token_address = str(item.get("tokenAddress", "")).strip()
-            if chain_id != "base" or not token_address:
+            profiles = profiles_by_chain.get(chain_id)
+            if profiles is None or not token_address or len(profiles) >= max_tokens:
                 continue
-            token_address_lc = token_address.lower()
-            if token_address_lc in seen:
+            key = (chain_id, token_address.lower())
+            if key in seen:
                 continue
-            seen.add(token_address_lc)
-            token_addresses.append(token_address)
-            if len(token_addresses) >= max_tokens:
-                break
-        return token_addresses
-
-    def fetch_token_pairs(self, chain_id: str, token_address: str) -> list[PairSnapshot]:
-        payload = self._get_json(f"/token-pairs/v1/{chain_id}/{token_address}")
+            seen.add(key)
+            fingerprint = hashlib.sha1(json.dumps(item, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+            profiles.append(TokenProfile(chain_id=chain_id, token_address=token_address, fingerprint=fingerprint))
+        return profiles_by_chain
+
+    def fetch_latest_tokens(self, chain_ids: Sequence[str], max_tokens: int) -> dict[str, list[str]]:
+        return {
+            chain_id: [profile.token_address for profile in profiles]
+            for chain_id, profiles in self.fetch_latest_profiles(chain_ids, max_tokens).items()
+        }
+
+    def fetch_latest_base_tokens(self, max_tokens: int) -> list[str]:
+        return self.fetch_latest_tokens(["base"], max_tokens)["base"]
+
+    def fetch_token_pairs(
+        self,
+        chain_id: str,
+        token_address: str,
+        max_age_seconds: float | None = None,
+    ) -> list[PairSnapshot]:
+        """`max_age_seconds` overrides the endpoint TTL (`0` always asks the server, conditionally)."""
+        payload = self._get_json(
+            f"/token-pairs/v1/{chain_id}/{token_address}",
+            endpoint=self.TOKEN_PAIRS,
+            cache_key=f"token-pairs:{chain_id.lower()}:{token_address.lower()}",
+            max_age_seconds=max_age_seconds,
+        )
         if not isinstance(payload, list):
             return []
 
@@ -68,28 +162,82 @@ class DexscreenerClient:
                 parsed.append(parsed_pair)
         return parsed
 
-    def fetch_new_pairs(self, chain_id: str, max_tokens: int) -> list[PairSnapshot]:
-        if chain_id.lower() != "base":
-            logger.warning("Day-1 client is Base-focused; requested chain=%s", chain_id)
-
-        token_addresses = self.fetch_latest_base_tokens(max_tokens=max_tokens)
+    def fetch_pairs_for_tokens(
+        self,
+        chain_id: str,
+        token_addresses: Sequence[str],
+    ) -> list[list[PairSnapshot]]:
+        """Fetch pairs for many tokens with bounded concurrency, preserving input order."""
         if not token_addresses:
-            logger.warning("No latest base token profiles returned from Dexscreener")
             return []
+        if self.max_concurrency <= 1 or len(token_addresses) == 1:
+            return [
+                self.fetch_token_pairs(chain_id=chain_id, token_address=token_address)
+                for token_address in token_addresses
+            ]
 
-        output: list[PairSnapshot] = []
-        for token_address in token_addresses:
-            pairs = self.fetch_token_pairs(chain_id=chain_id, token_address=token_address)
-            if not pairs:
-                continue
-            newest = sorted(
-                pairs,
-                key=lambda p: p.pair_created_at or datetime.min.replace(tzinfo=timezone.utc),
-                reverse=True,
-            )[0]
-            output.append(newest)
+        workers = min(self.max_concurrency, len(token_addresses))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dexscreener") as executor:
+            return list(
+                executor.map(
+                    lambda token_address: self.fetch_token_pairs(
+                        chain_id=chain_id,
+                        token_address=token_address,
+                    ),
+                    token_addresses,
+                )
+            )
+
+    def fetch_new_pairs(self, chain_id: str, max_tokens: int) -> list[PairSnapshot]:
+        return self.fetch_new_pairs_by_chain([chain_id], max_tokens)[chain_id.lower()]
+
+    def fetch_new_pairs_by_chain(
+        self,
+        chain_ids: Sequence[str],
+        max_tokens: int,
+    ) -> dict[str, list[PairSnapshot]]:
+        """Newest pair per latest token for each chain, tokens without pairs dropped."""
+        tokens_by_chain = self.fetch_latest_tokens(chain_ids, max_tokens=max_tokens)
+        for chain_id, token_addresses in tokens_by_chain.items():
+            if not token_addresses:
+                logger.warning("No latest token profiles returned from Dexscreener | chain=%s", chain_id)
+        return {
+            chain_id: [pair for pair in pairs if pair is not None]
+            for chain_id, pairs in self.fetch_newest_pairs_by_chain(tokens_by_chain).items()
+        }
+
+    def fetch_newest_pairs_by_chain(
+        self,
+        tokens_by_chain: Mapping[str, Sequence[str]],
+    ) -> dict[str, list[PairSnapshot | None]]:
+        """Newest pair for each token (None when it has none), aligned with the input lists.
+
+        Chains fetch in parallel, each with its own `max_concurrency` budget, sharing the
+        session, cache and host rate limit.
+        """
+        if len(tokens_by_chain) <= 1:
+            output = {
+                chain_id: self._newest_pairs(chain_id, token_addresses)
+                for chain_id, token_addresses in tokens_by_chain.items()
+            }
+        else:
+            workers = len(tokens_by_chain)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dexscreener-chain") as executor:
+                futures = {
+                    chain_id: executor.submit(self._newest_pairs, chain_id, token_addresses)
+                    for chain_id, token_addresses in tokens_by_chain.items()
+                }
+                output = {chain_id: future.result() for chain_id, future in futures.items()}
+        if self.cache is not None:
+            logger.info("Dexscreener cache | %s", " ".join(f"{k}={v}" for k, v in self.cache_stats.snapshot().items()))
         return output
 
+    def _newest_pairs(self, chain_id: str, token_addresses: Sequence[str]) -> list[PairSnapshot | None]:
+        return [
+            max(pairs, key=lambda p: p.pair_created_at or datetime.min.replace(tzinfo=timezone.utc)) if pairs else None
+            for pairs in self.fetch_pairs_for_tokens(chain_id=chain_id, token_addresses=token_addresses)
+        ]
+
     @staticmethod
     def _parse_pair(payload: Any) -> PairSnapshot | None:
         if not isinstance(payload, dict):
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from dog_scout.models import RiskAssessment
+
+logger = logging.getLogger(__name__)
+
+# EVM chain ids used by the token-security APIs, keyed by Dexscreener chainId.
+EVM_CHAIN_IDS = {
+    "ethereum": "1",
+    "bsc": "56",
+    "polygon": "137",
+    "base": "8453",
+    "arbitrum": "42161",
+    "avalanche": "43114",
+}
+
+
+class RiskBackendError(RuntimeError):
+    pass
+
+
+class _JsonBackend:
+    name = "backend"
+    base_url = ""
+
+    def __init__(self, timeout_seconds: float = 4.0, base_url: str | None = None, pool_size: int = 8) -> None:
+        self.timeout_seconds = timeout_seconds
+        if base_url:
+            self.base_url = base_url.rstrip("/")
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(pool_size, 1))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _get_json(self, path: str, params: dict[str, str]) -> Any:
+        try:
+            response = self.session.get(f"{self.base_url}{path}", params=params, timeout=self.timeout_seconds)
+            response.raise_for_status()
+            return response.json()
+        except (requests.RequestException, ValueError) as exc:
+            raise RiskBackendError(f"{self.name} request failed: {exc}") from exc
+
+
+class HoneypotIsBackend(_JsonBackend):
+    """honeypot.is `IsHoneypot`: simulated buy/sell verdict, flags and holder count."""
+
+    name = "honeypot_is"
+    base_url = "https://api.honeypot.is"
+
+    def assess(self, token_address: str, chain_id: str) -> RiskAssessment | None:
+        chain_number = EVM_CHAIN_IDS.get(chain_id.lower())
+        if chain_number is None:
+            return None
+        payload = self._get_json("/v2/IsHoneypot", {"address": token_address, "chainID": chain_number})
+        if not isinstance(payload, dict):
+            raise RiskBackendError(f"{self.name} returned {type(payload).__name__}")
+
+        result = payload.get("honeypotResult") or {}
+        summary = payload.get("summary") or {}
+        flags = [f"honeypot_is:{flag}" for flag in summary.get("flags") or [] if isinstance(flag, str)]
+        is_honeypot = bool(result.get("isHoneypot"))
+        if is_honeypot:
+            flags.append("honeypot")
+        holders = (payload.get("token") or {}).get("totalHolders")
+        return RiskAssessment(
+            is_honeypot=is_honeypot,
+            risk_flags=flags,
+            holders=int(holders) if isinstance(holders, (int, float)) else None,
+            metadata={"risk": summary.get("risk")},
+        )
+
+
+class GoPlusBackend(_JsonBackend):
+    """GoPlus `token_security`: holder count and the largest holders' shares."""
+
+    name = "goplus"
+    base_url = "https://api.gopluslabs.io"
+
+    def assess(self, token_address: str, chain_id: str) -> RiskAssessment | None:
+        chain_number = EVM_CHAIN_IDS.get(chain_id.lower())
+        if chain_number is None:
+            return None
+        payload = self._get_json(
+            f"/api/v1/token_security/{chain_number}",
+            {"contract_addresses": token_address},
+        )
+        results = payload.get("result") if isinstance(payload, dict) else None
+        if not isinstance(results, dict):
+            raise RiskBackendError(f"{self.name} returned no result")
+        security = results.get(token_address.lower()) or {}
+        if not security:
+            return None
+
+        flags = [
+            f"goplus:{field}"
+            for field in ("is_mintable", "hidden_owner", "can_take_back_ownership", "cannot_sell_all")
+            if security.get(field) == "1"
+        ]
+        is_honeypot = security.get("is_honeypot") == "1"
+        if is_honeypot:
+            flags.append("honeypot")
+        holders = security.get("holders") or []
+        top10 = None
+        if holders:
+            top10 = round(sum(_to_float(holder.get("percent")) for holder in holders[:10]), 6)
+        holder_count = security.get("holder_count")
+        return RiskAssessment(
+            is_honeypot=is_honeypot,
+            risk_flags=flags,
+            holders=int(holder_count) if str(holder_count or "").isdigit() else None,
+            top10_concentration=top10,
+        )
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+RISK_BACKENDS = {backend.name: backend for backend in (HoneypotIsBackend, GoPlusBackend)}
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
+from typing import Any, Mapping
 
 
 def _get_bool(name: str, default: bool) -> bool:
@@ -32,6 +33,17 @@ def _get_float(name: str, default: float) -> float:
         return default
 
 
+def _get_int_tuple(name: str, default: tuple[int, ...]) -> tuple[int, ...]:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        values = tuple(sorted({int(item) for item in raw.split(",") if item.strip()}))
+    except ValueError:
+        return default
+    return values if values and values[0] > 0 else default
+
+
 def _get_csv_set(name: str) -> set[str]:
     raw = os.getenv(name, "")
     values = {item.strip().lower() for item in raw.split(",") if item.strip()}
@@ -74,6 +86,90 @@ class Settings:
     telegram_bot_token: str
     telegram_chat_id: str
 
+    fetch_concurrency: int = 10
+    fetch_rate_limit_per_second: float = 5.0
+    fetch_rate_limit_burst: int = 40
+
+    db_cache_size_kib: int = 16_384
+    db_mmap_size_mb: int = 256
+    db_statement_cache_size: int = 256
+
+    http_cache_enabled: bool = True
+    http_cache_max_entries: int = 2048
+    http_cache_path: str = ""
+    # 0 = every cycle revalidates (ETag/Last-Modified); a TTL near loop_interval_seconds scores stale data.
+    http_cache_ttl_token_pairs_seconds: float = 0.0
+    http_cache_ttl_token_profiles_seconds: float = 0.0
+
+    recheck_mode: str = "inline"
+    recheck_concurrency: int = 4
+    recheck_poll_seconds: float = 5.0
+
+    metrics_port: int = 0
+    metrics_jsonl_path: str = ""
+    metrics_window: int = 1024
+
+    llm_max_in_flight: int = 4
+    llm_cycle_deadline_seconds: float = 45.0
+    llm_gate: str = "all"
+    llm_top_k: int = 10
+    llm_batch_size: int = 1
+
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_seconds: float = 900.0
+    llm_cache_usd_significant_digits: int = 2
+    llm_cache_pct_step: float = 1.0
+    llm_cache_txns_step: int = 5
+    llm_cache_score_step: float = 1.0
+
+    retention_days: int = 0
+    retention_archive_dir: str = "./archive"
+    retention_format: str = "jsonl"
+    retention_chunk_rows: int = 2000
+    retention_interval_seconds: float = 3600.0
+    retention_vacuum_pages: int = 2000
+
+    trend_weight: float = 0.0
+    trend_halflife_seconds: float = 600.0
+    trend_max_age_seconds: float = 3600.0
+
+    # Empty scans just `chain_id`; otherwise every listed chain, each with its own fetch_concurrency.
+    chain_ids: set[str] = field(default_factory=set)
+    # 0 disables the seen-token index (every listed token is fetched every cycle).
+    seen_token_refetch_seconds: float = 0.0
+
+    notify_mode: str = "inline"
+    notify_coalesce: bool = False
+    notify_max_attempts: int = 5
+    notify_backoff_seconds: float = 2.0
+    notify_backoff_max_seconds: float = 300.0
+    notify_poll_seconds: float = 1.0
+    telegram_rate_limit_per_second: float = 1.0
+    telegram_rate_limit_burst: int = 1
+
+    risk_provider: str = "mock"
+    risk_backends: set[str] = field(default_factory=set)
+    risk_max_workers: int = 8
+    risk_cache_ttl_seconds: float = 900.0
+    risk_cache_max_entries: int = 4096
+    risk_honeypot_is_base_url: str = ""
+    risk_honeypot_is_timeout_seconds: float = 4.0
+    risk_goplus_base_url: str = ""
+    risk_goplus_timeout_seconds: float = 4.0
+    # Empty keeps the public endpoints; set to point at a proxy or `dog_scout.bench`'s fake upstream.
+    dexscreener_base_url: str = ""
+    telegram_base_url: str = ""
+    # Minutes after an alert at which it is rechecked, e.g. (1, 5, 15, 60).
+    recheck_minutes: tuple[int, ...] = (5, 15)
+    # How thread/worker recheck modes find due jobs: "timer" (min-heap, wakes at due_at) or "poll".
+    recheck_scheduler: str = "timer"
+    recheck_resync_seconds: float = 300.0
+    # A claimed job whose worker has not finished within the lease is returned to pending by the reaper.
+    recheck_lease_seconds: float = 300.0
+    recheck_max_attempts: int = 3
+    recheck_backoff_seconds: float = 30.0
+    recheck_backoff_max_seconds: float = 600.0
+
     @classmethod
     def from_env(cls) -> "Settings":
         db_path = Path(os.getenv("DOG_SCOUT_DB_PATH", "./dog_scout.db")).expanduser()
@@ -105,4 +201,107 @@ class Settings:
             telegram_enabled=_get_bool("DOG_SCOUT_TELEGRAM_ENABLED", False),
             telegram_bot_token=os.getenv("DOG_SCOUT_TELEGRAM_BOT_TOKEN", "").strip(),
             telegram_chat_id=os.getenv("DOG_SCOUT_TELEGRAM_CHAT_ID", "").strip(),
+            fetch_concurrency=_get_int("DOG_SCOUT_FETCH_CONCURRENCY", 10),
+            fetch_rate_limit_per_second=_get_float("DOG_SCOUT_FETCH_RATE_LIMIT_PER_SECOND", 5.0),
+            fetch_rate_limit_burst=_get_int("DOG_SCOUT_FETCH_RATE_LIMIT_BURST", 40),
+            db_cache_size_kib=_get_int("DOG_SCOUT_DB_CACHE_SIZE_KIB", 16_384),
+            db_mmap_size_mb=_get_int("DOG_SCOUT_DB_MMAP_SIZE_MB", 256),
+            db_statement_cache_size=_get_int("DOG_SCOUT_DB_STATEMENT_CACHE_SIZE", 256),
+            http_cache_enabled=_get_bool("DOG_SCOUT_HTTP_CACHE_ENABLED", True),
+            http_cache_max_entries=_get_int("DOG_SCOUT_HTTP_CACHE_MAX_ENTRIES", 2048),
+            http_cache_path=os.getenv("DOG_SCOUT_HTTP_CACHE_PATH", "").strip(),
+            http_cache_ttl_token_pairs_seconds=_get_float("DOG_SCOUT_HTTP_CACHE_TTL_TOKEN_PAIRS_SECONDS", 0.0),
+            http_cache_ttl_token_profiles_seconds=_get_float(
+                "DOG_SCOUT_HTTP_CACHE_TTL_TOKEN_PROFILES_SECONDS", 0.0
+            ),
+            recheck_mode=os.getenv("DOG_SCOUT_RECHECK_MODE", "inline").strip().lower(),
+            recheck_concurrency=_get_int("DOG_SCOUT_RECHECK_CONCURRENCY", 4),
+            recheck_poll_seconds=_get_float("DOG_SCOUT_RECHECK_POLL_SECONDS", 5.0),
+            metrics_port=_get_int("DOG_SCOUT_METRICS_PORT", 0),
+            metrics_jsonl_path=os.getenv("DOG_SCOUT_METRICS_JSONL_PATH", "").strip(),
+            metrics_window=_get_int("DOG_SCOUT_METRICS_WINDOW", 1024),
+            llm_max_in_flight=_get_int("DOG_SCOUT_LLM_MAX_IN_FLIGHT", 4),
+            llm_cycle_deadline_seconds=_get_float("DOG_SCOUT_LLM_CYCLE_DEADLINE_SECONDS", 45.0),
+            llm_gate=os.getenv("DOG_SCOUT_LLM_GATE", "all").strip().lower(),
+            llm_top_k=_get_int("DOG_SCOUT_LLM_TOP_K", 10),
+            llm_batch_size=_get_int("DOG_SCOUT_LLM_BATCH_SIZE", 1),
+            llm_cache_enabled=_get_bool("DOG_SCOUT_LLM_CACHE_ENABLED", True),
+            llm_cache_ttl_seconds=_get_float("DOG_SCOUT_LLM_CACHE_TTL_SECONDS", 900.0),
+            llm_cache_usd_significant_digits=_get_int("DOG_SCOUT_LLM_CACHE_USD_SIGNIFICANT_DIGITS", 2),
+            llm_cache_pct_step=_get_float("DOG_SCOUT_LLM_CACHE_PCT_STEP", 1.0),
+            llm_cache_txns_step=_get_int("DOG_SCOUT_LLM_CACHE_TXNS_STEP", 5),
+            llm_cache_score_step=_get_float("DOG_SCOUT_LLM_CACHE_SCORE_STEP", 1.0),
+            retention_days=_get_int("DOG_SCOUT_RETENTION_DAYS", 0),
+            retention_archive_dir=os.getenv("DOG_SCOUT_RETENTION_ARCHIVE_DIR", "./archive").strip(),
+            retention_format=os.getenv("DOG_SCOUT_RETENTION_FORMAT", "jsonl").strip().lower(),
+            retention_chunk_rows=_get_int("DOG_SCOUT_RETENTION_CHUNK_ROWS", 2000),
+            retention_interval_seconds=_get_float("DOG_SCOUT_RETENTION_INTERVAL_SECONDS", 3600.0),
+            retention_vacuum_pages=_get_int("DOG_SCOUT_RETENTION_VACUUM_PAGES", 2000),
+            trend_weight=_get_float("DOG_SCOUT_TREND_WEIGHT", 0.0),
+            trend_halflife_seconds=_get_float("DOG_SCOUT_TREND_HALFLIFE_SECONDS", 600.0),
+            trend_max_age_seconds=_get_float("DOG_SCOUT_TREND_MAX_AGE_SECONDS", 3600.0),
+            chain_ids=_get_csv_set("DOG_SCOUT_CHAIN_IDS"),
+            seen_token_refetch_seconds=_get_float("DOG_SCOUT_SEEN_TOKEN_REFETCH_SECONDS", 0.0),
+            notify_mode=os.getenv("DOG_SCOUT_NOTIFY_MODE", "inline").strip().lower(),
+            notify_coalesce=_get_bool("DOG_SCOUT_NOTIFY_COALESCE", False),
+            notify_max_attempts=_get_int("DOG_SCOUT_NOTIFY_MAX_ATTEMPTS", 5),
+            notify_backoff_seconds=_get_float("DOG_SCOUT_NOTIFY_BACKOFF_SECONDS", 2.0),
+            notify_backoff_max_seconds=_get_float("DOG_SCOUT_NOTIFY_BACKOFF_MAX_SECONDS", 300.0),
+            notify_poll_seconds=_get_float("DOG_SCOUT_NOTIFY_POLL_SECONDS", 1.0),
+            telegram_rate_limit_per_second=_get_float("DOG_SCOUT_TELEGRAM_RATE_LIMIT_PER_SECOND", 1.0),
+            telegram_rate_limit_burst=_get_int("DOG_SCOUT_TELEGRAM_RATE_LIMIT_BURST", 1),
+            risk_provider=os.getenv("DOG_SCOUT_RISK_PROVIDER", "mock").strip().lower(),
+            risk_backends=_get_csv_set("DOG_SCOUT_RISK_BACKENDS"),
+            risk_max_workers=_get_int("DOG_SCOUT_RISK_MAX_WORKERS", 8),
+            risk_cache_ttl_seconds=_get_float("DOG_SCOUT_RISK_CACHE_TTL_SECONDS", 900.0),
+            risk_cache_max_entries=_get_int("DOG_SCOUT_RISK_CACHE_MAX_ENTRIES", 4096),
+            risk_honeypot_is_base_url=os.getenv("DOG_SCOUT_RISK_HONEYPOT_IS_BASE_URL", "").strip(),
+            risk_honeypot_is_timeout_seconds=_get_float("DOG_SCOUT_RISK_HONEYPOT_IS_TIMEOUT_SECONDS", 4.0),
+            risk_goplus_base_url=os.getenv("DOG_SCOUT_RISK_GOPLUS_BASE_URL", "").strip(),
+            risk_goplus_timeout_seconds=_get_float("DOG_SCOUT_RISK_GOPLUS_TIMEOUT_SECONDS", 4.0),
+            dexscreener_base_url=os.getenv("DOG_SCOUT_DEXSCREENER_BASE_URL", "").strip(),
+            telegram_base_url=os.getenv("DOG_SCOUT_TELEGRAM_BASE_URL", "").strip(),
+            recheck_minutes=_get_int_tuple("DOG_SCOUT_RECHECK_MINUTES", (5, 15)),
+            recheck_scheduler=os.getenv("DOG_SCOUT_RECHECK_SCHEDULER", "timer").strip().lower(),
+            recheck_resync_seconds=_get_float("DOG_SCOUT_RECHECK_RESYNC_SECONDS", 300.0),
+            recheck_lease_seconds=_get_float("DOG_SCOUT_RECHECK_LEASE_SECONDS", 300.0),
+            recheck_max_attempts=_get_int("DOG_SCOUT_RECHECK_MAX_ATTEMPTS", 3),
+            recheck_backoff_seconds=_get_float("DOG_SCOUT_RECHECK_BACKOFF_SECONDS", 30.0),
+            recheck_backoff_max_seconds=_get_float("DOG_SCOUT_RECHECK_BACKOFF_MAX_SECONDS", 600.0),
         )
+
+
+def scan_chain_ids(settings: Settings) -> list[str]:
+    """Chains one scan cycle covers, in a stable order."""
+    return sorted(settings.chain_ids) or [settings.chain_id]
+
+
+def apply_setting_overrides(settings: Settings, overrides: Mapping[str, Any]) -> Settings:
+    """Return a copy of `settings` with string/raw overrides coerced to each field's type."""
+    known = {item.name for item in fields(Settings)}
+    changes: dict[str, Any] = {}
+    for name, raw in overrides.items():
+        if name not in known:
+            raise ValueError(f"Unknown setting: {name}")
+        current = getattr(settings, name)
+        changes[name] = _coerce_like(current, raw)
+    return replace(settings, **changes)
+
+
+def _coerce_like(current: Any, raw: Any) -> Any:
+    if not isinstance(raw, str):
+        return raw
+    value = raw.strip()
+    if isinstance(current, bool):
+        return value.lower() in {"1", "true", "yes", "on"}
+    if isinstance(current, int):
+        return int(value)
+    if isinstance(current, float):
+        return float(value)
+    if isinstance(current, Path):
+        return Path(value).expanduser()
+    if isinstance(current, set):
+        return {item.strip().lower() for item in value.split(",") if item.strip()}
+    if isinstance(current, tuple):
+        return tuple(sorted({int(item) for item in value.split(",") if item.strip()}))
+    return value
@@ -0,0 +1,3 @@
+-- Joins used when replaying pairs_raw (signal per raw row, recheck rows to exclude).
+CREATE INDEX IF NOT EXISTS idx_signals_pair_raw_id ON signals(pair_raw_id);
+CREATE INDEX IF NOT EXISTS idx_recheck_results_signal_id ON recheck_results(signal_id);
@@ -0,0 +1,13 @@
+-- Content-addressed analyzer outputs (see dog_scout/analyzer_cache.py).
+CREATE TABLE IF NOT EXISTS llm_cache (
+    cache_key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    output_json TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    expires_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_cache_expires_at ON llm_cache(expires_at);
+
+ALTER TABLE signals ADD COLUMN llm_cache_hit INTEGER NOT NULL DEFAULT 0;
@@ -0,0 +1,31 @@
+-- Compact numeric time series per pair (see dog_scout/snapshots.py).
+-- WITHOUT ROWID clusters rows by (pair_address, fetched_at), so one pair's history is a single range scan.
+CREATE TABLE IF NOT EXISTS pair_snapshots (
+    pair_address TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    chain_id TEXT NOT NULL,
+    liquidity_usd REAL NOT NULL,
+    price_usd REAL NOT NULL,
+    volume_h24 REAL NOT NULL,
+    txns_h1_buys INTEGER NOT NULL,
+    txns_h1_sells INTEGER NOT NULL,
+    price_change_h1 REAL,
+    price_change_h24 REAL,
+    PRIMARY KEY (pair_address, fetched_at)
+) WITHOUT ROWID;
+
+-- Backfill from the raw payloads once; new rows are written alongside pairs_raw.
+INSERT OR IGNORE INTO pair_snapshots (
+    pair_address, fetched_at, chain_id,
+    liquidity_usd, price_usd, volume_h24, txns_h1_buys, txns_h1_sells,
+    price_change_h1, price_change_h24
+)
+SELECT
+    pair_address,
+    CAST(strftime('%s', fetched_at) AS REAL),
+    chain_id,
+    liquidity_usd, price_usd, volume_h24, txns_h1_buys, txns_h1_sells,
+    json_extract(raw_json, '$.priceChange.h1'),
+    json_extract(raw_json, '$.priceChange.h24')
+FROM pairs_raw
+WHERE json_valid(raw_json);
@@ -0,0 +1,18 @@
+-- Durable queue between the scan and Telegram (see dog_scout/outbox.py).
+-- status: pending -> sending -> sent | dry_run | failed; a failed send goes back to pending with a later next_attempt_at.
+CREATE TABLE IF NOT EXISTS notification_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    alert_id INTEGER,
+    chat_id TEXT NOT NULL,
+    batch_key TEXT,
+    message TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at TEXT NOT NULL,
+    last_error TEXT,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    sent_at TEXT,
+    FOREIGN KEY(alert_id) REFERENCES alerts(id)
+);
+CREATE INDEX IF NOT EXISTS idx_notification_outbox_due
+    ON notification_outbox(status, next_attempt_at);
@@ -0,0 +1,8 @@
+-- Lease-based recheck claims (see Database.claim_due_recheck_jobs / reap_expired_recheck_leases).
+-- status: pending -> running (until lease_until) -> done | failed; a failed attempt goes back to
+-- pending with a later due_at, and an expired lease is returned to pending by the reaper.
+ALTER TABLE recheck_jobs ADD COLUMN lease_until TEXT;
+-- Jobs left running by a process that predates leases get an already-expired lease.
+UPDATE recheck_jobs SET lease_until = CURRENT_TIMESTAMP WHERE status = 'running';
+CREATE INDEX IF NOT EXISTS idx_recheck_jobs_lease
+    ON recheck_jobs(status, lease_until);
@@ -0,0 +1,12 @@
+-- Composite/covering indexes for the lookups in storage.py; tests/test_query_plans.py checks every
+-- storage query with EXPLAIN QUERY PLAN.
+-- has_recent_alert: each side of the token/pair OR seeks straight into the cooldown window and
+-- answers from the index alone. The composites supersede the single-column indexes.
+CREATE INDEX IF NOT EXISTS idx_alerts_token_created ON alerts(token_address, created_at);
+CREATE INDEX IF NOT EXISTS idx_alerts_pair_created ON alerts(pair_address, created_at);
+DROP INDEX IF EXISTS idx_alerts_token_address;
+DROP INDEX IF EXISTS idx_alerts_pair_address;
+-- load_recheck_context reads each alert's recheck scores without touching the table.
+CREATE INDEX IF NOT EXISTS idx_recheck_results_alert_score
+    ON recheck_results(source_alert_id, scheduled_minutes, current_score);
+DROP INDEX IF EXISTS idx_recheck_results_alert;
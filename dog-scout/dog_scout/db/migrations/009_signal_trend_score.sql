@@ -0,0 +1,2 @@
+-- Trend component blended into final_score (NULL when trend scoring was off or the pair had no history).
+ALTER TABLE signals ADD COLUMN trend_score REAL;
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class RecentAlertIndex:
+    """In-process TTL index of the latest alert time per token and per pair.
+
+    Answers the same question as `Database.has_recent_alert` (token OR pair alerted
+    within the cooldown) with two dict lookups. Entries older than `ttl_minutes` are
+    swept lazily, so memory stays proportional to alerts inside the window.
+    """
+
+    def __init__(self, ttl_minutes: int) -> None:
+        self.ttl = timedelta(minutes=max(ttl_minutes, 0))
+        self._by_token: dict[str, datetime] = {}
+        self._by_pair: dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._next_sweep_at: datetime | None = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._by_token) + len(self._by_pair)
+
+    def covers(self, cooldown_minutes: int) -> bool:
+        return timedelta(minutes=cooldown_minutes) <= self.ttl
+
+    def record(self, token_address: str, pair_address: str, created_at: datetime | None = None) -> None:
+        created_at = created_at or _utc_now()
+        with self._lock:
+            for index, key in ((self._by_token, token_address), (self._by_pair, pair_address)):
+                previous = index.get(key)
+                if previous is None or created_at > previous:
+                    index[key] = created_at
+            if self._next_sweep_at is None:
+                self._next_sweep_at = created_at + self.ttl
+            elif created_at >= self._next_sweep_at:
+                self._sweep(created_at)
+
+    def has_recent_alert(
+        self,
+        token_address: str,
+        pair_address: str,
+        cooldown_minutes: int,
+        now: datetime | None = None,
+    ) -> bool:
+        cutoff = (now or _utc_now()) - timedelta(minutes=cooldown_minutes)
+        with self._lock:
+            token_at = self._by_token.get(token_address)
+            if token_at is not None and token_at >= cutoff:
+                return True
+            pair_at = self._by_pair.get(pair_address)
+            return pair_at is not None and pair_at >= cutoff
+
+    def prune(self, now: datetime | None = None) -> None:
+        with self._lock:
+            self._sweep(now or _utc_now())
+
+    def _sweep(self, now: datetime) -> None:
+        cutoff = now - self.ttl
+        for index in (self._by_token, self._by_pair):
+            expired = [key for key, created_at in index.items() if created_at < cutoff]
+            for key in expired:
+                del index[key]
+        self._next_sweep_at = now + self.ttl
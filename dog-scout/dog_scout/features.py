@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+
+from dog_scout.models import PairSnapshot, TrendFeatures
+from dog_scout.storage import Database
+
+logger = logging.getLogger(__name__)
+
+# Stale pairs are swept out every this many updates, so the sweep cost is amortized O(1).
+_SWEEP_EVERY = 1024
+
+
+@dataclass(slots=True)
+class _PairState:
+    last_ts: float
+    liquidity: float
+    txns_h1: float
+    price_ewma: float
+    price: float
+    buy_sell_imbalance: float
+    liquidity_slope: float = 0.0
+    txn_acceleration: float = 0.0
+    samples: int = 1
+
+    def features(self) -> TrendFeatures:
+        return TrendFeatures(
+            samples=self.samples,
+            liquidity_slope=self.liquidity_slope,
+            txn_acceleration=self.txn_acceleration,
+            buy_sell_imbalance=self.buy_sell_imbalance,
+            price_ewma=self.price_ewma,
+            price_vs_ewma=(self.price / self.price_ewma - 1.0) if self.price_ewma > 0 else 0.0,
+        )
+
+
+def _imbalance(buys: int, sells: int) -> float:
+    total = max(buys, 0) + max(sells, 0)
+    return 0.0 if total == 0 else (max(buys, 0) - max(sells, 0)) / total
+
+
+class FeatureEngine:
+    """Per-pair rolling trend state, updated in O(1) per snapshot.
+
+    Smoothing uses a time-based decay, alpha = 1 - 2^(-dt / halflife), so irregular scan
+    intervals weigh observations by elapsed time rather than by count. A pair unseen for
+    longer than `max_age_seconds` starts over.
+    """
+
+    def __init__(self, halflife_seconds: float = 600.0, max_age_seconds: float = 3600.0) -> None:
+        self.halflife_seconds = max(halflife_seconds, 1.0)
+        self.max_age_seconds = max_age_seconds
+        self._states: dict[str, _PairState] = {}
+        self._lock = threading.Lock()
+        self._updates = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._states)
+
+    def update(self, pair: PairSnapshot, ts: float | None = None) -> TrendFeatures:
+        return self.observe(
+            pair.pair_address,
+            ts if ts is not None else time.time(),
+            liquidity_usd=pair.liquidity_usd,
+            price_usd=pair.price_usd,
+            txns_h1_buys=pair.txns_h1_buys,
+            txns_h1_sells=pair.txns_h1_sells,
+        )
+
+    def observe(
+        self,
+        pair_address: str,
+        ts: float,
+        liquidity_usd: float,
+        price_usd: float,
+        txns_h1_buys: int,
+        txns_h1_sells: int,
+    ) -> TrendFeatures:
+        txns_h1 = float(max(txns_h1_buys, 0) + max(txns_h1_sells, 0))
+        imbalance = _imbalance(txns_h1_buys, txns_h1_sells)
+        with self._lock:
+            state = self._states.get(pair_address)
+            dt = ts - state.last_ts if state is not None else 0.0
+            if state is None or dt > self.max_age_seconds:
+                state = _PairState(
+                    last_ts=ts,
+                    liquidity=liquidity_usd,
+                    txns_h1=txns_h1,
+                    price_ewma=price_usd,
+                    price=price_usd,
+                    buy_sell_imbalance=imbalance,
+                )
+                self._states[pair_address] = state
+            elif dt > 0:
+                alpha = 1.0 - math.exp(-dt * math.log(2.0) / self.halflife_seconds)
+                minutes = dt / 60.0
+                liquidity_rate = (liquidity_usd - state.liquidity) / max(state.liquidity, 1.0) / minutes
+                txn_rate = (txns_h1 - state.txns_h1) / minutes
+                if state.samples == 1:
+                    state.liquidity_slope = liquidity_rate
+                    state.txn_acceleration = txn_rate
+                else:
+                    state.liquidity_slope += alpha * (liquidity_rate - state.liquidity_slope)
+                    state.txn_acceleration += alpha * (txn_rate - state.txn_acceleration)
+                state.price_ewma += alpha * (price_usd - state.price_ewma)
+                state.last_ts = ts
+                state.liquidity = liquidity_usd
+                state.txns_h1 = txns_h1
+                state.price = price_usd
+                state.buy_sell_imbalance = imbalance
+                state.samples += 1
+            # dt <= 0: duplicate or out-of-order snapshot, state unchanged.
+
+            self._updates += 1
+            if self._updates % _SWEEP_EVERY == 0:
+                self._sweep(ts)
+            return state.features()
+
+    def get(self, pair_address: str) -> TrendFeatures | None:
+        with self._lock:
+            state = self._states.get(pair_address)
+            return state.features() if state is not None else None
+
+    def _sweep(self, now: float) -> None:
+        cutoff = now - self.max_age_seconds
+        stale = [key for key, state in self._states.items() if state.last_ts < cutoff]
+        for key in stale:
+            del self._states[key]
+
+    def rebuild(self, db: Database, now: float | None = None) -> int:
+        """Replay `pair_snapshots` from the last `max_age_seconds` into fresh state; returns rows read."""
+        now = now if now is not None else time.time()
+        with self._lock:
+            self._states.clear()
+        rows = 0
+        for pair_address, fetched_at, liquidity, price, buys, sells in db.iter_pair_snapshots_since(
+            now - self.max_age_seconds
+        ):
+            self.observe(pair_address, fetched_at, liquidity, price, buys, sells)
+            rows += 1
+        logger.info("trend features rebuilt | pairs=%s snapshots=%s", len(self), rows)
+        return rows
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, Mapping
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class StageTimings:
+    """Wall-clock seconds per pipeline stage for one cycle; repeated stages accumulate."""
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def as_dict(self) -> dict[str, float]:
+        return {name: round(value, 6) for name, value in self.seconds.items()}
+
+
+class RollingSummary:
+    """Quantiles over the last `window` observations plus lifetime count/sum."""
+
+    def __init__(self, window: int = 1024) -> None:
+        self._samples: deque[float] = deque(maxlen=max(window, 1))
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self._samples.append(value)
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float:
+        if not self._samples:
+            return math.nan
+        ordered = sorted(self._samples)
+        # Nearest-rank, so every reported value is an actual observation.
+        return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+class MetricsRegistry:
+    """Thread-safe named summaries with optional labels (e.g. `stage="fetch"`)."""
+
+    def __init__(self, window: int = 1024) -> None:
+        self.window = window
+        self._summaries: dict[tuple[str, tuple[tuple[str, str], ...]], RollingSummary] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float, labels: Mapping[str, str] | None = None) -> None:
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is None:
+                summary = RollingSummary(self.window)
+                self._summaries[key] = summary
+            summary.observe(value)
+
+    def observe_stages(self, timings: Mapping[str, float]) -> None:
+        for stage, seconds in timings.items():
+            self.observe("dog_scout_stage_seconds", seconds, {"stage": stage})
+
+    def snapshot(self) -> dict[str, list[dict[str, object]]]:
+        with self._lock:
+            payload: dict[str, list[dict[str, object]]] = {}
+            for (name, labels), summary in sorted(self._summaries.items()):
+                payload.setdefault(name, []).append(
+                    {
+                        "labels": dict(labels),
+                        "count": summary.count,
+                        "sum": round(summary.total, 6),
+                        **{f"p{round(q * 100)}": round(summary.quantile(q), 6) for q in QUANTILES},
+                    }
+                )
+            return payload
+
+    def render_prometheus(self) -> str:
+        lines: list[str] = []
+        current: str | None = None
+        with self._lock:
+            for (name, labels), summary in sorted(self._summaries.items()):
+                if name != current:
+                    lines.append(f"# TYPE {name} summary")
+                    current = name
+                base = [f'{key}="{value}"' for key, value in labels]
+                for q in QUANTILES:
+                    quantile_labels = ",".join([*base, f'quantile="{q}"'])
+                    lines.append(f"{name}{{{quantile_labels}}} {summary.quantile(q):.6f}")
+                suffix = f"{{{','.join(base)}}}" if base else ""
+                lines.append(f"{name}_sum{suffix} {summary.total:.6f}")
+                lines.append(f"{name}_count{suffix} {summary.count}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """Serves `GET /metrics` in Prometheus text format from a daemon thread."""
+
+    def __init__(self, registry: MetricsRegistry, port: int, host: str = "127.0.0.1") -> None:
+        self.registry = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):  # noqa: A002, ANN001
+                return
+
+            def do_GET(self) -> None:  # noqa: N802
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return int(self._server.server_address[1])
+
+    def start(self) -> "MetricsServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True)
+        self._thread.start()
+        logger.info("metrics endpoint listening | port=%s", self.port)
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class JsonlMetricsWriter:
+    """Appends one JSON line per scan cycle (raw stage timings + counts)."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def write(self, record: Mapping[str, object]) -> None:
+        line = json.dumps(
+            {"ts": datetime.now(timezone.utc).isoformat(), **record},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        with self._lock, self.path.open("a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
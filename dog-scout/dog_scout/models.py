@@ -24,6 +24,27 @@ class PairSnapshot:
     raw: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class TokenProfile:
+    """One entry of the latest token-profiles feed; `fingerprint` changes whenever the entry does."""
+
+    chain_id: str
+    token_address: str
+    fingerprint: str
+
+
+@dataclass(slots=True)
+class TrendFeatures:
+    """Rolling per-pair features from successive snapshots (see dog_scout.features)."""
+
+    samples: int
+    liquidity_slope: float  # fractional liquidity change per minute, EW-smoothed
+    txn_acceleration: float  # change of 1h txn count per minute, EW-smoothed
+    buy_sell_imbalance: float  # (buys - sells) / (buys + sells) in the latest snapshot, -1..1
+    price_ewma: float
+    price_vs_ewma: float  # latest price / EWMA - 1
+
+
 @dataclass(slots=True)
 class RiskAssessment:
     is_honeypot: bool
@@ -55,6 +76,8 @@ class ScoreBreakdown:
     llm_action_hint: str | None = None
     llm_reasons: list[str] = field(default_factory=list)
     llm_failed: bool = False
+    llm_cache_hit: bool = False
+    trend_score: float | None = None
 
 
 @dataclass(slots=True)
@@ -82,8 +105,55 @@ class RecheckJob:
     attempts: int
 
 
+@dataclass(slots=True)
+class OutboxMessage:
+    id: int
+    alert_id: int | None
+    chat_id: str
+    batch_key: str | None
+    message: str
+    attempts: int
+
+
 @dataclass(slots=True)
 class ScoreTimeline:
     initial_score: float
-    score_5m: float | None = None
-    score_15m: float | None = None
+    # Recheck minute -> final score at that recheck.
+    scores: dict[int, float] = field(default_factory=dict)
+    # Schedule shown in the timeline line, including rechecks that have not run yet.
+    minutes: tuple[int, ...] = (5, 15)
+
+    @property
+    def score_5m(self) -> float | None:
+        return self.scores.get(5)
+
+    @property
+    def score_15m(self) -> float | None:
+        return self.scores.get(15)
+
+    def points(self) -> list[tuple[int, float | None]]:
+        """`(minute, score)` for every scheduled or recorded recheck, in minute order."""
+        return [(minute, self.scores.get(minute)) for minute in sorted(set(self.minutes) | set(self.scores))]
+
+
+@dataclass(slots=True)
+class RecheckContext:
+    """Stored state a recheck job builds on, loaded for a whole claimed batch at once."""
+
+    job_id: int
+    scheduled_minutes: int
+    # Shared by every job of the same alert in the batch; the dispatchers run those jobs one after
+    # another in schedule order, so later jobs see earlier results.
+    timeline: ScoreTimeline
+    # A result row already exists (an earlier attempt died before marking the job done).
+    has_result: bool = False
+
+    @property
+    def initial_score(self) -> float:
+        return self.timeline.initial_score
+
+    @property
+    def previous_score(self) -> float | None:
+        """Score of the latest recheck scheduled before this one, if it has run."""
+        earlier = [minute for minute in self.timeline.scores if minute < self.scheduled_minutes]
+        return self.timeline.scores[max(earlier)] if earlier else None
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from typing import Sequence
 
 import requests
 
@@ -15,25 +16,33 @@ logger = logging.getLogger(__name__)
 class NotificationResult:
     sent: bool
     status: str
+    # Seconds Telegram asked us to wait (HTTP 429 `parameters.retry_after`).
+    retry_after: float | None = None
 
 
 class TelegramNotifier:
-    def __init__(self, settings: Settings) -> None:
+    base_url = "https://api.telegram.org"
+
+    def __init__(self, settings: Settings, base_url: str | None = None) -> None:
         self.settings = settings
+        base_url = base_url or settings.telegram_base_url
+        if base_url:
+            self.base_url = base_url.rstrip("/")
         self.session = requests.Session()
 
-    def send_message(self, message: str) -> NotificationResult:
+    def send_message(self, message: str, chat_id: str | None = None) -> NotificationResult:
         if self.settings.dry_run or not self.settings.telegram_enabled:
             print(message)
             return NotificationResult(sent=False, status="dry_run")
 
-        if not self.settings.telegram_bot_token or not self.settings.telegram_chat_id:
+        chat_id = chat_id or self.settings.telegram_chat_id
+        if not self.settings.telegram_bot_token or not chat_id:
             logger.error("Telegram enabled but token/chat id missing")
             return NotificationResult(sent=False, status="config_error")
 
-        url = f"https://api.telegram.org/bot{self.settings.telegram_bot_token}/sendMessage"
+        url = f"{self.base_url}/bot{self.settings.telegram_bot_token}/sendMessage"
         payload = {
-            "chat_id": self.settings.telegram_chat_id,
+            "chat_id": chat_id,
             "text": message,
             "disable_web_page_preview": True,
         }
@@ -44,6 +53,10 @@ class TelegramNotifier:
                 json=payload,
                 timeout=self.settings.request_timeout_seconds,
             )
+            if response.status_code == 429:
+                retry_after = _retry_after(response)
+                logger.warning("Telegram rate limited | chat=%s retry_after=%ss", chat_id, retry_after)
+                return NotificationResult(sent=False, status="rate_limited", retry_after=retry_after)
             response.raise_for_status()
             return NotificationResult(sent=True, status="sent")
         except requests.RequestException as exc:
@@ -51,14 +64,27 @@ class TelegramNotifier:
             return NotificationResult(sent=False, status="send_failed")
 
 
-def format_telegram_message(rank: int, candidate: Candidate) -> str:
+def _retry_after(response: requests.Response) -> float | None:
+    try:
+        value = (response.json().get("parameters") or {}).get("retry_after")
+    except (ValueError, AttributeError):
+        value = None
+    if value is None:
+        value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def format_telegram_message(rank: int, candidate: Candidate, recheck_minutes: Sequence[int] = (5, 15)) -> str:
     pair = candidate.pair
     score = candidate.score
     risk_flags = "、".join(candidate.risk.risk_flags) if candidate.risk.risk_flags else "无"
     price_move = "n/a" if pair.price_change_h1 is None else f"{pair.price_change_h1:.2f}%"
     txns_h1 = pair.txns_h1_buys + pair.txns_h1_sells
     timeline_line = format_score_timeline_line(
-        ScoreTimeline(initial_score=score.rule_score or score.final_score)
+        ScoreTimeline(initial_score=score.rule_score or score.final_score, minutes=tuple(recheck_minutes))
     )
 
     if score.final_score >= 85:
@@ -103,10 +129,10 @@ def format_recheck_summary_message(
 
 
 def format_score_timeline_line(timeline: ScoreTimeline) -> str:
-    return (
-        "首发分 -> 5m分 -> 15m分："
-        f"{_fmt_score(timeline.initial_score)} -> {_fmt_score(timeline.score_5m)} -> {_fmt_score(timeline.score_15m)}"
-    )
+    points = timeline.points()
+    labels = " -> ".join(["首发分", *(f"{minute}m分" for minute, _ in points)])
+    scores = " -> ".join([_fmt_score(timeline.initial_score), *(_fmt_score(score) for _, score in points)])
+    return f"{labels}：{scores}"
 
 
 def _fmt_score(score: float | None) -> str:
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from typing import Iterator
+
+from dog_scout.config import Settings
+from dog_scout.models import OutboxMessage
+from dog_scout.notifier import NotificationResult, TelegramNotifier
+from dog_scout.ratelimit import HostRateLimiter
+from dog_scout.storage import Database
+
+logger = logging.getLogger(__name__)
+
+# Telegram rejects longer texts; coalesced batches are split below this.
+TELEGRAM_MAX_MESSAGE_CHARS = 4096
+_COALESCE_SEPARATOR = "\n\n"
+
+
+class OutboxSender:
+    """Delivers `notification_outbox` rows off the scan path.
+
+    Sends are paced per chat with a token bucket. A 429 pauses that chat for Telegram's
+    `retry_after` without spending an attempt; other failures back off exponentially and
+    give up after `max_attempts`. With `coalesce`, rows sharing a `batch_key` (one scan
+    cycle) go out as one message, split only where Telegram's length limit requires.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        notifier: TelegramNotifier,
+        rate_limit_per_second: float = 1.0,
+        rate_limit_burst: int = 1,
+        coalesce: bool = False,
+        max_attempts: int = 5,
+        backoff_seconds: float = 2.0,
+        backoff_max_seconds: float = 300.0,
+        poll_seconds: float = 1.0,
+        batch_size: int = 50,
+    ) -> None:
+        self.db = db
+        self.notifier = notifier
+        self.rate_limiter = HostRateLimiter(rate_limit_per_second, rate_limit_burst)
+        self.coalesce = coalesce
+        self.max_attempts = max(max_attempts, 1)
+        self.backoff_seconds = backoff_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.poll_seconds = max(poll_seconds, 0.1)
+        self.batch_size = max(batch_size, 1)
+        self._paused_until: dict[str, float] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def from_settings(cls, db: Database, notifier: TelegramNotifier, settings: Settings) -> "OutboxSender":
+        return cls(
+            db,
+            notifier,
+            rate_limit_per_second=settings.telegram_rate_limit_per_second,
+            rate_limit_burst=settings.telegram_rate_limit_burst,
+            coalesce=settings.notify_coalesce,
+            max_attempts=settings.notify_max_attempts,
+            backoff_seconds=settings.notify_backoff_seconds,
+            backoff_max_seconds=settings.notify_backoff_max_seconds,
+            poll_seconds=settings.notify_poll_seconds,
+        )
+
+    def run_once(self) -> int:
+        """Deliver every row due now; returns the number of messages posted."""
+        posted = 0
+        while True:
+            rows = self.db.claim_due_notifications(limit=self.batch_size)
+            if not rows:
+                return posted
+            for group in self._groups(rows):
+                posted += self._deliver(group)
+
+    def run_forever(self) -> None:
+        released = self.db.release_claimed_notifications()
+        logger.info("outbox sender started | coalesce=%s released=%s", self.coalesce, released)
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:  # noqa: BLE001 - keep the sender alive; rows stay queued
+                logger.exception("outbox sender pass failed")
+            self._stop.wait(self.poll_seconds)
+        logger.info("outbox sender stopped")
+
+    def start(self) -> threading.Thread:
+        """Run `run_forever` on a daemon thread (loop mode with `DOG_SCOUT_NOTIFY_MODE=outbox`)."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="outbox-sender", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _groups(self, rows: list[OutboxMessage]) -> Iterator[list[OutboxMessage]]:
+        if not self.coalesce:
+            for row in rows:
+                yield [row]
+            return
+
+        by_key: dict[tuple[str, str | int], list[OutboxMessage]] = {}
+        for row in rows:
+            by_key.setdefault((row.chat_id, row.batch_key or row.id), []).append(row)
+        for group in by_key.values():
+            chunk: list[OutboxMessage] = []
+            length = 0
+            for row in group:
+                added = len(row.message) + (len(_COALESCE_SEPARATOR) if chunk else 0)
+                if chunk and length + added > TELEGRAM_MAX_MESSAGE_CHARS:
+                    yield chunk
+                    chunk, length, added = [], 0, len(row.message)
+                chunk.append(row)
+                length += added
+            yield chunk
+
+    def _deliver(self, group: list[OutboxMessage]) -> int:
+        chat_id = group[0].chat_id
+        ids = [row.id for row in group]
+        paused_for = self._paused_until.get(chat_id, 0.0) - time.monotonic()
+        if paused_for > 0:
+            self.db.retry_notifications(ids, _whole_seconds(paused_for), "chat paused after 429", count_attempt=False)
+            return 0
+
+        self.rate_limiter.acquire(chat_id)
+        text = _COALESCE_SEPARATOR.join(row.message for row in group)
+        result = self.notifier.send_message(text, chat_id=chat_id or None)
+        return self._record(group, ids, result)
+
+    def _record(self, group: list[OutboxMessage], ids: list[int], result: NotificationResult) -> int:
+        chat_id = group[0].chat_id
+        if result.status in {"sent", "dry_run"}:
+            self.db.complete_notifications(ids, status=result.status, sent=result.sent)
+            return int(result.sent)
+        if result.status == "config_error":
+            self.db.fail_notifications(ids, "telegram token/chat id missing")
+            return 0
+        if result.status == "rate_limited":
+            delay = result.retry_after if result.retry_after is not None else self.backoff_seconds
+            self._paused_until[chat_id] = time.monotonic() + delay
+            self.db.retry_notifications(ids, _whole_seconds(delay), "rate limited (429)", count_attempt=False)
+            return 0
+
+        attempts = max(row.attempts for row in group) + 1
+        if attempts >= self.max_attempts:
+            logger.warning("outbox giving up | ids=%s attempts=%s", ids, attempts)
+            self.db.fail_notifications(ids, result.status)
+            return 0
+        delay = min(self.backoff_seconds * 2 ** (attempts - 1), self.backoff_max_seconds)
+        self.db.retry_notifications(ids, _whole_seconds(delay), result.status)
+        return 0
+
+
+def _whole_seconds(delay: float) -> float:
+    # `next_attempt_at` has second resolution; rounding up keeps a retry out of the current pass.
+    return float(max(math.ceil(delay), 1))
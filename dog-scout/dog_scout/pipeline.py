@@ -1,35 +1,63 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, replace
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
+from typing import Sequence
 
 from dog_scout.analyzer import (
     Analyzer,
     AnalyzerError,
     AnalyzerInput,
+    AnalyzerOutput,
     DeepSeekAnalyzer,
     MockAnalyzer,
     build_market_snapshot,
 )
+from dog_scout.analyzer_cache import CacheKeyPrecision, CachingAnalyzer
+from dog_scout.clients.cache import build_response_cache
 from dog_scout.clients.dexscreener import DexscreenerClient
-from dog_scout.config import Settings
+from dog_scout.config import Settings, scan_chain_ids
+from dog_scout.features import FeatureEngine
 from dog_scout.filters import apply_hard_filters
-from dog_scout.models import Candidate, PairSnapshot, RecheckJob, ScoreBreakdown, ScoreTimeline
+from dog_scout.metrics import JsonlMetricsWriter, MetricsRegistry, StageTimings
+from dog_scout.models import (
+    Candidate,
+    FilterOutcome,
+    PairSnapshot,
+    RecheckContext,
+    RecheckJob,
+    RiskAssessment,
+    ScoreBreakdown,
+    TokenProfile,
+    TrendFeatures,
+)
 from dog_scout.notifier import (
+    NotificationResult,
     TelegramNotifier,
     format_recheck_summary_message,
     format_telegram_message,
 )
 from dog_scout.recheck import classify_recheck_status
-from dog_scout.risk import MockRiskProvider, RiskProvider
+from dog_scout.risk import RiskProvider, build_risk_provider
 from dog_scout.scoring import merge_with_analyzer, score_pair
+from dog_scout.seen import FETCH, SKIP, SeenTokenIndex
 from dog_scout.selector import select_top_candidates
 from dog_scout.storage import Database
 
 logger = logging.getLogger(__name__)
 
-RECHECK_MINUTES = (5, 15)
+
+@dataclass(slots=True)
+class ChainScanStats:
+    fetched_pairs: int = 0
+    passed_filters: int = 0
+    selected: int = 0
+    rescored_pairs: int = 0
+    skipped_tokens: int = 0
 
 
 @dataclass(slots=True)
@@ -39,6 +67,30 @@ class ScanResult:
     selected: int
     rechecked: int
     messages: list[str]
+    stage_timings: dict[str, float] = field(default_factory=dict)
+    per_chain: dict[str, ChainScanStats] = field(default_factory=dict)
+    rescored_pairs: int = 0
+    skipped_tokens: int = 0
+
+
+@dataclass(slots=True)
+class _FetchedPairs:
+    pairs: list[PairSnapshot] = field(default_factory=list)
+    # Aligned with `pairs` when the seen-token index is on, else empty.
+    profiles: list[TokenProfile] = field(default_factory=list)
+    rescored: set[int] = field(default_factory=set)
+    skipped: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class RecheckOutcome:
+    job_id: int
+    scheduled_minutes: int
+    succeeded: bool
+    lateness_seconds: float
+    message: str | None = None
+    # Set when the attempt failed and the job went back to pending, due again at this time.
+    retry_at: datetime | None = None
 
 
 class ScoutPipeline:
@@ -50,92 +102,234 @@ class ScoutPipeline:
         risk_provider: RiskProvider | None = None,
         notifier: TelegramNotifier | None = None,
         analyzer: Analyzer | None = None,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         self.settings = settings
         self.db = db
-        self.client = client or DexscreenerClient(timeout_seconds=settings.request_timeout_seconds)
-        self.risk_provider = risk_provider or MockRiskProvider(
-            denylist_tokens=settings.denylist_tokens,
+        self.chain_ids = scan_chain_ids(settings)
+        self.client = client or DexscreenerClient(
+            timeout_seconds=settings.request_timeout_seconds,
+            max_concurrency=settings.fetch_concurrency,
+            rate_limit_per_second=settings.fetch_rate_limit_per_second,
+            rate_limit_burst=settings.fetch_rate_limit_burst,
+            cache=(
+                build_response_cache(settings.http_cache_max_entries, settings.http_cache_path)
+                if settings.http_cache_enabled
+                else None
+            ),
+            cache_ttl_seconds={
+                DexscreenerClient.TOKEN_PAIRS: settings.http_cache_ttl_token_pairs_seconds,
+                DexscreenerClient.TOKEN_PROFILES: settings.http_cache_ttl_token_profiles_seconds,
+            },
+            chain_count=len(self.chain_ids),
+            base_url=settings.dexscreener_base_url or None,
         )
+        self.risk_provider = risk_provider or build_risk_provider(settings)
         self.notifier = notifier or TelegramNotifier(settings=settings)
-        self.analyzer = analyzer if analyzer is not None else self._build_default_analyzer()
+        self.analyzer = self._with_analyzer_cache(analyzer if analyzer is not None else self._build_default_analyzer())
+        self.metrics = metrics or MetricsRegistry(window=settings.metrics_window)
+        self._analyzer_pool: ThreadPoolExecutor | None = None
+        self.metrics_writer = JsonlMetricsWriter(settings.metrics_jsonl_path) if settings.metrics_jsonl_path else None
+        self.db.warm_alert_index(settings.dedup_cooldown_minutes)
+        self.features: FeatureEngine | None = None
+        if settings.trend_weight > 0:
+            self.features = FeatureEngine(
+                halflife_seconds=settings.trend_halflife_seconds,
+                max_age_seconds=settings.trend_max_age_seconds,
+            )
+            self.features.rebuild(db)
+        self.seen_tokens: SeenTokenIndex | None = None
+        if settings.seen_token_refetch_seconds > 0 and not settings.use_mock_data:
+            self.seen_tokens = SeenTokenIndex(settings.seen_token_refetch_seconds)
 
     def run_once(self) -> ScanResult:
-        recheck_messages = self._process_due_rechecks()
-
-        pairs = self._fetch_pairs()
+        started = time.perf_counter()
+        timings = StageTimings()
+        # Other modes leave recheck_jobs to a RecheckWorker (in-process thread or `--mode worker`).
+        recheck_messages: list[str] = []
+        if self.settings.recheck_mode == "inline":
+            with timings.stage("rechecks"):
+                recheck_messages = self._process_due_rechecks()
+
+        with timings.stage("fetch"):
+            fetched = self._fetch_pairs()
+        pairs = fetched.pairs
         if not pairs:
             logger.info("No pairs fetched this cycle")
-            return ScanResult(
-                fetched_pairs=0,
-                passed_filters=0,
-                selected=0,
-                rechecked=len(recheck_messages),
-                messages=recheck_messages,
+            return self._finish_cycle(
+                ScanResult(
+                    fetched_pairs=0,
+                    passed_filters=0,
+                    selected=0,
+                    rechecked=len(recheck_messages),
+                    messages=recheck_messages,
+                    per_chain=self._chain_stats(fetched, [], []),
+                    skipped_tokens=sum(fetched.skipped.values()),
+                ),
+                timings,
+                started,
             )
 
-        candidates: list[Candidate] = []
-        for pair in pairs:
-            pair_raw_id = self.db.insert_pair_raw(pair)
-            risk = self.risk_provider.assess_token(pair.base_token_address, pair.chain_id)
-            filter_outcome = apply_hard_filters(pair, risk, self.settings)
-            score = self._score_with_optional_analyzer(pair=pair, risk_flags=risk.risk_flags)
-            signal_id = self.db.insert_signal(pair_raw_id, pair, risk, filter_outcome, score)
-
-            if filter_outcome.passed:
-                candidates.append(
-                    Candidate(
-                        pair=pair,
-                        risk=risk,
-                        filter_outcome=filter_outcome,
-                        score=score,
-                        pair_raw_id=pair_raw_id,
-                        signal_id=signal_id,
-                    )
-                )
-
-        selected = select_top_candidates(
-            candidates=candidates,
-            top_n=self.settings.top_n,
-            cooldown_minutes=self.settings.dedup_cooldown_minutes,
-            dedup_store=self.db,
-        )
-
-        initial_messages: list[str] = []
-        for rank, candidate in enumerate(selected, start=1):
-            message = format_telegram_message(rank=rank, candidate=candidate)
-            result = self.notifier.send_message(message)
-            alert_id = self.db.insert_alert(
-                candidate=candidate,
-                message=message,
-                dry_run=self.settings.dry_run,
-                status=result.status,
-                sent=result.sent,
+        with timings.stage("risk"):
+            risks = self._assess_risks(pairs)
+        with timings.stage("filters"):
+            filter_outcomes = [apply_hard_filters(pair, risk, self.settings) for pair, risk in zip(pairs, risks)]
+        scores = self._score_pairs(pairs, risks, filter_outcomes, timings, stale=fetched.rescored)
+        scanned = [
+            Candidate(
+                pair=pair,
+                risk=risk,
+                filter_outcome=filter_outcome,
+                score=score,
             )
-            self.db.enqueue_recheck_jobs(
-                candidate=candidate,
-                source_alert_id=alert_id,
-                scheduled_minutes=RECHECK_MINUTES,
+            for pair, risk, filter_outcome, score in zip(pairs, risks, filter_outcomes, scores)
+        ]
+        for index in fetched.rescored:
+            # The snapshot is already stored; only a new signal row is written for it.
+            scanned[index].pair_raw_id = self.seen_tokens.get(fetched.profiles[index]).pair_raw_id
+        with timings.stage("db_writes"):
+            self.db.insert_scan_results(scanned)
+        if self.seen_tokens is not None:
+            for profile, candidate in zip(fetched.profiles, scanned):
+                self.seen_tokens.record_outcome(profile, candidate.pair_raw_id, candidate.filter_outcome.passed)
+        candidates = [candidate for candidate in scanned if candidate.filter_outcome.passed]
+
+        with timings.stage("select"):
+            self.db.refresh_alert_index()
+            selected = select_top_candidates(
+                candidates=candidates,
+                top_n=self.settings.top_n,
+                cooldown_minutes=self.settings.dedup_cooldown_minutes,
+                dedup_store=self.db,
             )
-            initial_messages.append(message)
+
+        initial_messages: list[str] = []
+        deliveries: list[tuple[Candidate, str, NotificationResult]] = []
+        with timings.stage("notify"):
+            for rank, candidate in enumerate(selected, start=1):
+                message = format_telegram_message(
+                    rank=rank,
+                    candidate=candidate,
+                    recheck_minutes=self.settings.recheck_minutes,
+                )
+                deliveries.append((candidate, message, self._send_or_queue(message)))
+                initial_messages.append(message)
+
+        batch_key = f"scan-{uuid.uuid4().hex}"
+        with timings.stage("db_writes"), self.db.batch():
+            for candidate, message, result in deliveries:
+                alert_id = self._insert_alert(candidate, message, result, batch_key=batch_key)
+                self.db.enqueue_recheck_jobs(
+                    candidate=candidate,
+                    source_alert_id=alert_id,
+                    scheduled_minutes=self.settings.recheck_minutes,
+                )
 
         messages = recheck_messages + initial_messages
+        result = self._finish_cycle(
+            ScanResult(
+                fetched_pairs=len(pairs),
+                passed_filters=len(candidates),
+                selected=len(selected),
+                rechecked=len(recheck_messages),
+                messages=messages,
+                per_chain=self._chain_stats(fetched, candidates, selected),
+                rescored_pairs=len(fetched.rescored),
+                skipped_tokens=sum(fetched.skipped.values()),
+            ),
+            timings,
+            started,
+        )
         logger.info(
-            "scan complete | fetched=%s passed=%s selected=%s rechecked=%s timestamp=%s",
+            "scan complete | fetched=%s passed=%s selected=%s rechecked=%s rescored=%s skipped=%s chains=%s "
+            "total=%.2fs timestamp=%s",
             len(pairs),
             len(candidates),
             len(selected),
             len(recheck_messages),
+            result.rescored_pairs,
+            result.skipped_tokens,
+            ",".join(
+                f"{chain_id}:{stats.fetched_pairs}/{stats.passed_filters}/{stats.selected}"
+                for chain_id, stats in result.per_chain.items()
+            ),
+            result.stage_timings["total"],
             datetime.now(timezone.utc).isoformat(),
         )
+        return result
+
+    def _finish_cycle(self, result: ScanResult, timings: StageTimings, started: float) -> ScanResult:
+        timings.add("total", time.perf_counter() - started)
+        result.stage_timings = timings.as_dict()
+        self.metrics.observe_stages(result.stage_timings)
+        if self.metrics_writer is not None:
+            self.metrics_writer.write(
+                {
+                    "fetched_pairs": result.fetched_pairs,
+                    "passed_filters": result.passed_filters,
+                    "selected": result.selected,
+                    "rechecked": result.rechecked,
+                    "rescored_pairs": result.rescored_pairs,
+                    "skipped_tokens": result.skipped_tokens,
+                    "stage_seconds": result.stage_timings,
+                    "per_chain": {chain_id: asdict(stats) for chain_id, stats in result.per_chain.items()},
+                }
+            )
+        return result
+
+    def _assess_risks(self, pairs: list[PairSnapshot]) -> list[RiskAssessment]:
+        assess_tokens = getattr(self.risk_provider, "assess_tokens", None)
+        if assess_tokens is not None:
+            return assess_tokens([(pair.base_token_address, pair.chain_id) for pair in pairs])
+        return [self.risk_provider.assess_token(pair.base_token_address, pair.chain_id) for pair in pairs]
 
-        return ScanResult(
-            fetched_pairs=len(pairs),
-            passed_filters=len(candidates),
-            selected=len(selected),
-            rechecked=len(recheck_messages),
-            messages=messages,
+    def _send_or_queue(self, message: str) -> NotificationResult:
+        # In outbox mode the scan only records the message; OutboxSender posts it later.
+        if self.settings.notify_mode == "outbox":
+            return NotificationResult(sent=False, status="queued")
+        return self.notifier.send_message(message)
+
+    def _insert_alert(
+        self,
+        candidate: Candidate,
+        message: str,
+        result: NotificationResult,
+        batch_key: str | None = None,
+    ) -> int:
+        alert_id = self.db.insert_alert(
+            candidate=candidate,
+            message=message,
+            dry_run=self.settings.dry_run,
+            status=result.status,
+            sent=result.sent,
         )
+        if result.status == "queued":
+            self.db.enqueue_notification(
+                chat_id=self.settings.telegram_chat_id,
+                message=message,
+                alert_id=alert_id,
+                batch_key=batch_key,
+            )
+        return alert_id
+
+    def _chain_stats(
+        self,
+        fetched: _FetchedPairs,
+        candidates: list[Candidate],
+        selected: list[Candidate],
+    ) -> dict[str, ChainScanStats]:
+        stats = {chain_id: ChainScanStats() for chain_id in self.chain_ids}
+        for index, pair in enumerate(fetched.pairs):
+            chain_stats = stats.setdefault(pair.chain_id, ChainScanStats())
+            chain_stats.fetched_pairs += 1
+            chain_stats.rescored_pairs += index in fetched.rescored
+        for chain_id, skipped in fetched.skipped.items():
+            stats.setdefault(chain_id, ChainScanStats()).skipped_tokens += skipped
+        for candidate in candidates:
+            stats.setdefault(candidate.pair.chain_id, ChainScanStats()).passed_filters += 1
+        for candidate in selected:
+            stats.setdefault(candidate.pair.chain_id, ChainScanStats()).selected += 1
+        return stats
 
     def _build_default_analyzer(self) -> Analyzer | None:
         if not self.settings.llm_enabled:
@@ -158,8 +352,159 @@ class ScoutPipeline:
         logger.warning("Unsupported LLM provider '%s', fallback to rule-only", provider)
         return None
 
+    def _score_pairs(
+        self,
+        pairs: list[PairSnapshot],
+        risks: list[RiskAssessment],
+        filter_outcomes: list[FilterOutcome],
+        timings: StageTimings,
+        stale: set[int] | None = None,
+    ) -> list[ScoreBreakdown]:
+        """Rule-score every pair, then run the analyzer for the gated subset concurrently."""
+        with timings.stage("rule_score"):
+            rule_breakdowns = [
+                score_pair(pair, self.settings, features)
+                for pair, features in zip(pairs, self._trend_features(pairs, stale))
+            ]
+
+        if not self.settings.llm_enabled or self.analyzer is None:
+            return [self._merge_analyzer_result(rule_breakdown) for rule_breakdown in rule_breakdowns]
+
+        targets = self._analyzer_targets(rule_breakdowns, filter_outcomes)
+        with timings.stage("analyzer"):
+            outputs, failed = self._analyze_concurrently(
+                {
+                    index: self._build_analyzer_input(pairs[index], rule_breakdowns[index], risks[index].risk_flags)
+                    for index in targets
+                }
+            )
+        return [
+            self._merge_analyzer_result(rule_breakdown, outputs.get(index), analyzer_failed=index in failed)
+            for index, rule_breakdown in enumerate(rule_breakdowns)
+        ]
+
+    def _analyzer_targets(
+        self,
+        rule_breakdowns: list[ScoreBreakdown],
+        filter_outcomes: list[FilterOutcome],
+    ) -> list[int]:
+        gate = self.settings.llm_gate
+        if gate == "all":
+            return list(range(len(rule_breakdowns)))
+        passed = [index for index, outcome in enumerate(filter_outcomes) if outcome.passed]
+        if gate == "top_k":
+            ranked = sorted(passed, key=lambda index: rule_breakdowns[index].final_score, reverse=True)
+            return sorted(ranked[: max(self.settings.llm_top_k, 0)])
+        return passed
+
+    def _analyze_concurrently(
+        self,
+        inputs: dict[int, AnalyzerInput],
+    ) -> tuple[dict[int, AnalyzerOutput], set[int]]:
+        """Returns outputs by index plus indexes that failed or missed the cycle deadline."""
+        if not inputs:
+            return {}, set()
+
+        executor = self._analyzer_executor()
+        indexes = list(inputs)
+        batch_size = self.settings.llm_batch_size
+        analyze_batch = getattr(self.analyzer, "analyze_batch", None)
+        if batch_size > 1 and analyze_batch is not None:
+            # Each batch is one request, so it occupies a single in-flight slot.
+            chunks = [indexes[start : start + batch_size] for start in range(0, len(indexes), batch_size)]
+            futures = {executor.submit(analyze_batch, [inputs[index] for index in chunk]): chunk for chunk in chunks}
+        else:
+            futures = {executor.submit(self.analyzer.analyze, inputs[index]): [index] for index in indexes}
+        deadline = self.settings.llm_cycle_deadline_seconds
+        done, not_done = wait(futures, timeout=deadline if deadline > 0 else None)
+
+        failed: set[int] = set()
+        for future in not_done:
+            # Queued calls are dropped; calls already on the wire finish within llm_timeout_seconds.
+            future.cancel()
+            failed.update(futures[future])
+        if not_done:
+            logger.warning("Analyzer deadline reached | pending=%s deadline=%ss", len(not_done), deadline)
+
+        outputs: dict[int, AnalyzerOutput] = {}
+        for future in done:
+            chunk = futures[future]
+            try:
+                result = future.result()
+            except AnalyzerError as exc:
+                logger.warning("Analyzer failed for %s: %s", ",".join(inputs[i].token_address for i in chunk), exc)
+                failed.update(chunk)
+                continue
+            for index, output in zip(chunk, result if isinstance(result, list) else [result]):
+                if isinstance(output, AnalyzerError):
+                    logger.warning("Analyzer failed for %s: %s", inputs[index].token_address, output)
+                    failed.add(index)
+                else:
+                    outputs[index] = output
+        return outputs, failed
+
+    def _analyzer_executor(self) -> ThreadPoolExecutor:
+        # Long-lived so the in-flight cap also covers calls still running from a previous cycle.
+        if self._analyzer_pool is None:
+            self._analyzer_pool = ThreadPoolExecutor(
+                max_workers=max(self.settings.llm_max_in_flight, 1),
+                thread_name_prefix="analyzer",
+            )
+        return self._analyzer_pool
+
+    def close(self) -> None:
+        if self._analyzer_pool is not None:
+            self._analyzer_pool.shutdown(wait=False, cancel_futures=True)
+            self._analyzer_pool = None
+        close_risk_provider = getattr(self.risk_provider, "close", None)
+        if close_risk_provider is not None:
+            close_risk_provider()
+
+    def _with_analyzer_cache(self, analyzer: Analyzer | None) -> Analyzer | None:
+        if analyzer is None or not self.settings.llm_cache_enabled or isinstance(analyzer, CachingAnalyzer):
+            return analyzer
+        return CachingAnalyzer(
+            analyzer,
+            self.db,
+            ttl_seconds=self.settings.llm_cache_ttl_seconds,
+            precision=CacheKeyPrecision(
+                usd_significant_digits=self.settings.llm_cache_usd_significant_digits,
+                pct_step=self.settings.llm_cache_pct_step,
+                txns_step=self.settings.llm_cache_txns_step,
+                score_step=self.settings.llm_cache_score_step,
+            ),
+        )
+
+    def _trend_features(self, pairs: list[PairSnapshot], stale: set[int] | None = None) -> list[TrendFeatures | None]:
+        """`stale` indexes are re-scored cached snapshots; they read the state without adding a sample."""
+        if self.features is None:
+            return [None] * len(pairs)
+        now = time.time()
+        stale = stale or set()
+        return [
+            self.features.get(pair.pair_address) if index in stale else self.features.update(pair, now)
+            for index, pair in enumerate(pairs)
+        ]
+
     def _score_with_optional_analyzer(self, pair: PairSnapshot, risk_flags: list[str]) -> ScoreBreakdown:
-        rule_breakdown = score_pair(pair, self.settings)
+        rule_breakdown = score_pair(pair, self.settings, self._trend_features([pair])[0])
+        if not self.settings.llm_enabled or self.analyzer is None:
+            return self._merge_analyzer_result(rule_breakdown)
+
+        analyzer_input = self._build_analyzer_input(pair, rule_breakdown, risk_flags)
+        try:
+            analyzer_output = self.analyzer.analyze(analyzer_input)
+        except AnalyzerError as exc:
+            logger.warning("Analyzer failed for %s: %s", pair.base_token_address, exc)
+            return self._merge_analyzer_result(rule_breakdown, analyzer_failed=True)
+        return self._merge_analyzer_result(rule_breakdown, analyzer_output)
+
+    def _merge_analyzer_result(
+        self,
+        rule_breakdown: ScoreBreakdown,
+        analyzer_output: AnalyzerOutput | None = None,
+        analyzer_failed: bool = False,
+    ) -> ScoreBreakdown:
         provider_name = self.settings.llm_provider.lower()
         model_name = self.settings.llm_model
 
@@ -173,8 +518,23 @@ class ScoutPipeline:
                 analyzer_failed=bool(self.settings.llm_enabled and self.analyzer is None),
             )
 
+        return merge_with_analyzer(
+            rule_breakdown=rule_breakdown,
+            analyzer_output=analyzer_output,
+            settings=self.settings,
+            analyzer_provider=getattr(self.analyzer, "provider", provider_name),
+            analyzer_model=getattr(self.analyzer, "model", model_name),
+            analyzer_failed=analyzer_failed,
+        )
+
+    @staticmethod
+    def _build_analyzer_input(
+        pair: PairSnapshot,
+        rule_breakdown: ScoreBreakdown,
+        risk_flags: list[str],
+    ) -> AnalyzerInput:
         txns_h1 = max(pair.txns_h1_buys, 0) + max(pair.txns_h1_sells, 0)
-        analyzer_input = AnalyzerInput(
+        return AnalyzerInput(
             chain_id=pair.chain_id,
             token_address=pair.base_token_address,
             token_symbol=pair.base_token_symbol,
@@ -197,86 +557,121 @@ class ScoutPipeline:
             ),
         )
 
-        try:
-            analyzer_output = self.analyzer.analyze(analyzer_input)
-        except AnalyzerError as exc:
-            logger.warning("Analyzer failed for %s: %s", pair.base_token_address, exc)
-            return merge_with_analyzer(
-                rule_breakdown=rule_breakdown,
-                analyzer_output=None,
-                settings=self.settings,
-                analyzer_provider=getattr(self.analyzer, "provider", provider_name),
-                analyzer_model=getattr(self.analyzer, "model", model_name),
-                analyzer_failed=True,
-            )
-
-        return merge_with_analyzer(
-            rule_breakdown=rule_breakdown,
-            analyzer_output=analyzer_output,
-            settings=self.settings,
-            analyzer_provider=getattr(self.analyzer, "provider", provider_name),
-            analyzer_model=getattr(self.analyzer, "model", model_name),
-            analyzer_failed=False,
-        )
-
     def _process_due_rechecks(self) -> list[str]:
-        jobs = self.db.claim_due_recheck_jobs(limit=self.settings.recheck_batch_size)
+        self.reap_recheck_leases()
+        jobs = self.db.claim_due_recheck_jobs(
+            limit=self.settings.recheck_batch_size,
+            lease_seconds=self.settings.recheck_lease_seconds,
+        )
         if not jobs:
             return []
 
+        contexts = self.load_recheck_contexts(jobs)
         messages: list[str] = []
         for job in jobs:
-            try:
-                maybe_message = self._run_single_recheck(job)
-                if maybe_message:
-                    messages.append(maybe_message)
-                self.db.mark_recheck_job_done(job.id)
-            except Exception as exc:  # noqa: BLE001 - keep pipeline resilient
-                logger.exception("Recheck job failed | job_id=%s", job.id)
-                self.db.mark_recheck_job_failed(job.id, str(exc))
+            outcome = self.process_recheck_job(job, contexts.get(job.id))
+            if outcome.message:
+                messages.append(outcome.message)
         return messages
 
-    def _run_single_recheck(self, job: RecheckJob) -> str | None:
+    def reap_recheck_leases(self) -> list[tuple[int, datetime]]:
+        """Requeue jobs whose worker died mid-run; returns `(id, due_at)` of the requeued jobs."""
+        requeued = self.db.reap_expired_recheck_leases(max_attempts=self.settings.recheck_max_attempts)
+        if requeued:
+            logger.warning("recheck leases expired, jobs requeued | job_ids=%s", [job_id for job_id, _ in requeued])
+        return requeued
+
+    def load_recheck_contexts(self, jobs: Sequence[RecheckJob]) -> dict[int, RecheckContext]:
+        """Stored scores for a claimed batch in one round trip, keyed by job id."""
+        return self.db.load_recheck_context([job.id for job in jobs], minutes=self.settings.recheck_minutes)
+
+    def process_recheck_job(self, job: RecheckJob, context: RecheckContext | None = None) -> RecheckOutcome:
+        """Run one claimed job and mark it done, retry it later or fail it; safe to call from worker threads.
+
+        `context` comes from `load_recheck_contexts` for the job's batch; without it the job loads
+        its own. A job whose result was already recorded (by an attempt that died before marking it
+        done) is only marked done, so the summary alert is not sent twice.
+        """
+        started = time.perf_counter()
+        succeeded = True
+        message: str | None = None
+        retry_at: datetime | None = None
+        try:
+            if context is None:
+                context = self.load_recheck_contexts([job]).get(job.id)
+            if context is None:
+                raise RuntimeError(f"Missing source alert {job.source_alert_id}")
+            if not context.has_result:
+                message = self._run_single_recheck(job, context)
+            self.db.mark_recheck_job_done(job.id)
+        except Exception as exc:  # noqa: BLE001 - keep pipeline resilient
+            succeeded = False
+            if job.attempts >= self.settings.recheck_max_attempts:
+                logger.exception("Recheck job failed | job_id=%s attempts=%s", job.id, job.attempts)
+                self.db.mark_recheck_job_failed(job.id, str(exc))
+            else:
+                delay = min(
+                    self.settings.recheck_backoff_seconds * 2 ** (job.attempts - 1),
+                    self.settings.recheck_backoff_max_seconds,
+                )
+                retry_at = self.db.retry_recheck_job(job.id, delay, str(exc))
+                logger.warning(
+                    "Recheck job failed, retrying | job_id=%s attempt=%s/%s delay=%.0fs error=%s",
+                    job.id,
+                    job.attempts,
+                    self.settings.recheck_max_attempts,
+                    delay,
+                    exc,
+                )
+
+        lateness = (datetime.now(timezone.utc) - job.due_at).total_seconds()
+        labels = {"minutes": str(job.scheduled_minutes)}
+        self.metrics.observe("dog_scout_recheck_lateness_seconds", lateness, labels)
+        self.metrics.observe("dog_scout_recheck_seconds", time.perf_counter() - started, labels)
+        logger.info(
+            "recheck processed | job_id=%s minutes=%s ok=%s lateness=%.1fs",
+            job.id,
+            job.scheduled_minutes,
+            succeeded,
+            lateness,
+        )
+        return RecheckOutcome(
+            job_id=job.id,
+            scheduled_minutes=job.scheduled_minutes,
+            succeeded=succeeded,
+            lateness_seconds=lateness,
+            message=message,
+            retry_at=retry_at,
+        )
+
+    def _run_single_recheck(self, job: RecheckJob, context: RecheckContext) -> str | None:
         pair = self._refresh_pair_for_recheck(job)
         if pair is None:
             raise RuntimeError(f"No market data for recheck job {job.id}")
 
-        pair_raw_id = self.db.insert_pair_raw(pair)
         risk = self.risk_provider.assess_token(pair.base_token_address, pair.chain_id)
         filter_outcome = apply_hard_filters(pair, risk, self.settings)
         score = self._score_with_optional_analyzer(pair=pair, risk_flags=risk.risk_flags)
-        signal_id = self.db.insert_signal(pair_raw_id, pair, risk, filter_outcome, score)
         candidate = Candidate(
             pair=pair,
             risk=risk,
             filter_outcome=filter_outcome,
             score=score,
-            pair_raw_id=pair_raw_id,
-            signal_id=signal_id,
         )
+        self.db.insert_scan_results([candidate])
 
-        initial_score = self.db.get_alert_score(job.source_alert_id)
-        if initial_score is None:
-            raise RuntimeError(f"Missing source alert {job.source_alert_id}")
-
-        previous_score = self.db.get_previous_recheck_score(
-            source_alert_id=job.source_alert_id,
-            scheduled_minutes=job.scheduled_minutes,
-        )
+        initial_score = context.initial_score
+        previous_score = context.previous_score
         status = classify_recheck_status(
             passed_filters=filter_outcome.passed,
             initial_score=initial_score,
             previous_score=previous_score,
             current_score=score.final_score,
         )
-
-        timeline = self.db.get_timeline_for_alert(job.source_alert_id) or ScoreTimeline(
-            initial_score=initial_score
+        timeline = replace(
+            context.timeline,
+            scores={**context.timeline.scores, job.scheduled_minutes: score.final_score},
         )
-        if job.scheduled_minutes == 5:
-            timeline.score_5m = score.final_score
-        elif job.scheduled_minutes == 15:
-            timeline.score_15m = score.final_score
 
         base_score = previous_score if previous_score is not None else initial_score
         delta_from_initial = round(score.final_score - initial_score, 2)
@@ -289,30 +684,32 @@ class ScoutPipeline:
             delta_from_initial=delta_from_initial,
             delta_from_previous=delta_from_previous,
         )
-        notify_result = self.notifier.send_message(message)
-        self.db.insert_alert(
-            candidate=candidate,
-            message=message,
-            dry_run=self.settings.dry_run,
-            status=notify_result.status,
-            sent=notify_result.sent,
-        )
-        self.db.insert_recheck_result(
-            job=job,
-            candidate=candidate,
-            status=status,
-            timeline=timeline,
-            delta_from_initial=delta_from_initial,
-            delta_from_previous=delta_from_previous,
-            message=message,
-        )
+        notify_result = self._send_or_queue(message)
+        with self.db.batch():
+            self._insert_alert(candidate, message, notify_result)
+            self.db.insert_recheck_result(
+                job=job,
+                candidate=candidate,
+                status=status,
+                timeline=timeline,
+                delta_from_initial=delta_from_initial,
+                delta_from_previous=delta_from_previous,
+                message=message,
+            )
+        # The alert's later jobs in this batch run after this one (serially) and build on this score.
+        context.timeline.scores[job.scheduled_minutes] = score.final_score
         return message
 
     def _refresh_pair_for_recheck(self, job: RecheckJob) -> PairSnapshot | None:
         if self.settings.use_mock_data:
             return self._mock_recheck_pair(job)
 
-        pairs = self.client.fetch_token_pairs(chain_id=job.chain_id, token_address=job.token_address)
+        # Rechecks need a current snapshot; a stale cached entry is only reused after a 304.
+        pairs = self.client.fetch_token_pairs(
+            chain_id=job.chain_id,
+            token_address=job.token_address,
+            max_age_seconds=0.0,
+        )
         if not pairs:
             return None
 
@@ -359,16 +756,76 @@ class ScoutPipeline:
         pair.raw["mock_recheck_minutes"] = job.scheduled_minutes
         return pair
 
-    def _fetch_pairs(self) -> list[PairSnapshot]:
+    def _fetch_pairs(self) -> _FetchedPairs:
         if self.settings.use_mock_data:
-            return _mock_pairs(self.settings.chain_id)
-        return self.client.fetch_new_pairs(
-            chain_id=self.settings.chain_id,
+            return _FetchedPairs(pairs=[pair for chain_id in self.chain_ids for pair in _mock_pairs(chain_id)])
+        if self.seen_tokens is not None:
+            return self._fetch_unseen_pairs()
+        if len(self.chain_ids) == 1:
+            return _FetchedPairs(
+                pairs=self.client.fetch_new_pairs(
+                    chain_id=self.chain_ids[0],
+                    max_tokens=self.settings.max_new_tokens,
+                )
+            )
+        pairs_by_chain = self.client.fetch_new_pairs_by_chain(
+            chain_ids=self.chain_ids,
             max_tokens=self.settings.max_new_tokens,
         )
+        return _FetchedPairs(pairs=[pair for chain_id in self.chain_ids for pair in pairs_by_chain.get(chain_id, [])])
+
+    def _fetch_unseen_pairs(self) -> _FetchedPairs:
+        """Like the plain fetch, but repeat tokens reuse or skip their cached snapshot (see SeenTokenIndex)."""
+        now = time.time()
+        profiles_by_chain = self.client.fetch_latest_profiles(self.chain_ids, max_tokens=self.settings.max_new_tokens)
+        decisions = {
+            chain_id: [(profile, self.seen_tokens.decide(profile, now)) for profile in profiles]
+            for chain_id, profiles in profiles_by_chain.items()
+        }
+        fresh_by_chain = self.client.fetch_newest_pairs_by_chain(
+            {
+                chain_id: [profile.token_address for profile, decision in items if decision == FETCH]
+                for chain_id, items in decisions.items()
+            }
+        )
+
+        fetched = _FetchedPairs()
+        for chain_id in self.chain_ids:
+            fresh = iter(fresh_by_chain.get(chain_id, []))
+            fetched.skipped[chain_id] = 0
+            for profile, decision in decisions.get(chain_id, []):
+                if decision == SKIP:
+                    fetched.skipped[chain_id] += 1
+                    continue
+                if decision == FETCH:
+                    pair = next(fresh)
+                    if pair is None:
+                        continue
+                    self.seen_tokens.record_fetch(profile, pair, now)
+                else:
+                    pair = self.seen_tokens.get(profile).pair
+                    fetched.rescored.add(len(fetched.pairs))
+                fetched.pairs.append(pair)
+                fetched.profiles.append(profile)
+        return fetched
 
 
 def _mock_pairs(chain_id: str) -> list[PairSnapshot]:
+    pairs = _mock_pair_templates(chain_id)
+    if chain_id == "base":
+        return pairs
+    # Other chains get their own addresses (same trailing letter, which drives mock rechecks).
+    return [
+        replace(
+            pair,
+            pair_address=f"{chain_id}:{pair.pair_address}",
+            base_token_address=f"{chain_id}:{pair.base_token_address}",
+        )
+        for pair in pairs
+    ]
+
+
+def _mock_pair_templates(chain_id: str) -> list[PairSnapshot]:
     now = datetime.now(timezone.utc)
     return [
         PairSnapshot(
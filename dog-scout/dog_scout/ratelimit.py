@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Blocking token bucket; `rate_per_second <= 0` disables limiting."""
+
+    def __init__(self, rate_per_second: float, burst: int = 1) -> None:
+        self.rate_per_second = rate_per_second
+        self.capacity = float(max(burst, 1))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until available. Returns seconds waited."""
+        if self.rate_per_second <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._updated_at = now
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) / self.rate_per_second
+            time.sleep(delay)
+            waited += delay
+
+
+class HostRateLimiter:
+    """One token bucket per host (or any other key), created on first use."""
+
+    def __init__(self, rate_per_second: float, burst: int = 1) -> None:
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str) -> float:
+        if self.rate_per_second <= 0:
+            return 0.0
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.rate_per_second, self.burst)
+                self._buckets[key] = bucket
+        return bucket.acquire()
+
+    def acquire_for_url(self, url: str) -> float:
+        return self.acquire(urlsplit(url).netloc.lower())
@@ -0,0 +1,231 @@
+"""Archive old `pairs_raw` rows into date-partitioned files, delete them in chunks, vacuum.
+
+    python -m dog_scout.retention archive --days 14
+    python -m dog_scout.retention vacuum --enable-incremental
+
+Archives live under `<archive_dir>/pairs_raw/date=YYYY-MM-DD/part-<first_id>-<last_id>.jsonl.gz`
+(`.parquet` with the optional `pyarrow` dependency). Each record carries the same fields as
+`Database.iter_replay_rows`, so `dog_scout.backtest.iter_archive_replay_rows` can replay them.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import logging
+import os
+import sys
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+from dotenv import load_dotenv
+
+from dog_scout.config import Settings, apply_setting_overrides
+from dog_scout.logging_config import setup_logging
+from dog_scout.storage import Database, _to_sqlite_ts
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMATS = ("jsonl", "parquet")
+_SUFFIXES = {"jsonl": ".jsonl.gz", "parquet": ".parquet"}
+
+
+@dataclass(slots=True)
+class RetentionReport:
+    archived_rows: int = 0
+    deleted_rows: int = 0
+    vacuumed_pages: int = 0
+    files: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def _partition_path(archive_dir: Path, day: str, first_id: int, last_id: int, fmt: str) -> Path:
+    return archive_dir / "pairs_raw" / f"date={day}" / f"part-{first_id:012d}-{last_id:012d}{_SUFFIXES[fmt]}"
+
+
+def _write_partition(path: Path, records: list[dict[str, Any]], fmt: str) -> None:
+    # Write-then-rename: a crash leaves either no file or a complete one, and re-running
+    # the same id range overwrites it with identical content.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    if fmt == "parquet":
+        pq.write_table(pa.Table.from_pylist(records), tmp_path, compression="zstd")
+    else:
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as handle:
+            for record in records:
+                handle.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    os.replace(tmp_path, path)
+
+
+def archive_pairs_raw(
+    db: Database,
+    archive_dir: str | Path,
+    older_than_days: float,
+    chunk_rows: int = 2_000,
+    fmt: str = "jsonl",
+    now: datetime | None = None,
+) -> RetentionReport:
+    """Move pairs_raw rows fetched more than `older_than_days` ago into archive files.
+
+    Each chunk is written (and renamed into place) before its rows are deleted, in one short
+    write transaction, so the scan loop is never blocked for long.
+    """
+    if fmt not in ARCHIVE_FORMATS:
+        raise ValueError(f"Unknown archive format: {fmt}")
+    if fmt == "parquet" and pq is None:
+        raise RuntimeError("Parquet archives require the optional pyarrow dependency")
+
+    archive_root = Path(archive_dir).expanduser()
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=older_than_days)
+    report = RetentionReport()
+    after_id = 0
+    while True:
+        rows = db.list_pairs_raw_before(cutoff, after_id=after_id, limit=max(chunk_rows, 1))
+        if not rows:
+            break
+        by_day: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            record = dict(row)
+            record["is_recheck"] = int(record["is_recheck"])
+            by_day.setdefault(str(record["fetched_at"])[:10], []).append(record)
+        for day, records in sorted(by_day.items()):
+            path = _partition_path(archive_root, day, records[0]["id"], records[-1]["id"], fmt)
+            _write_partition(path, records, fmt)
+            report.files.append(str(path))
+        report.archived_rows += len(rows)
+        report.deleted_rows += db.delete_pairs_raw([int(row["id"]) for row in rows])
+        after_id = int(rows[-1]["id"])
+
+    if report.archived_rows:
+        logger.info(
+            "pairs_raw archived | rows=%s files=%s cutoff=%s",
+            report.archived_rows,
+            len(report.files),
+            cutoff.isoformat(),
+        )
+    return report
+
+
+def _read_partition(path: Path) -> list[dict[str, Any]]:
+    if path.name.endswith(_SUFFIXES["parquet"]):
+        if pq is None:
+            raise RuntimeError(f"Reading {path} requires the optional pyarrow dependency")
+        return pq.read_table(path).to_pylist()
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def iter_archive_records(
+    archive_dir: str | Path,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Stream archived records in (fetched_at, id) order, one partition file in memory at a time."""
+    root = Path(archive_dir).expanduser() / "pairs_raw"
+    if not root.is_dir():
+        return
+    start_sql = _to_sqlite_ts(start) if start is not None else "0000-00-00 00:00:00"
+    end_sql = _to_sqlite_ts(end) if end is not None else "9999-12-31 23:59:59"
+    for day_dir in sorted(root.glob("date=*")):
+        day = day_dir.name.removeprefix("date=")
+        if day < start_sql[:10] or day > end_sql[:10]:
+            continue
+        parts = [
+            path
+            for path in sorted(day_dir.iterdir())
+            if any(path.name.endswith(suffix) for suffix in _SUFFIXES.values())
+        ]
+        for path in parts:
+            records = _read_partition(path)
+            records.sort(key=lambda record: (str(record["fetched_at"]), int(record["id"])))
+            for record in records:
+                if start_sql <= str(record["fetched_at"]) < end_sql:
+                    yield record
+
+
+def run_retention(db: Database, settings: Settings, now: datetime | None = None) -> RetentionReport:
+    """One periodic pass: archive + delete expired rows, then reclaim free pages."""
+    report = RetentionReport()
+    if settings.retention_days > 0:
+        report = archive_pairs_raw(
+            db,
+            settings.retention_archive_dir,
+            older_than_days=settings.retention_days,
+            chunk_rows=settings.retention_chunk_rows,
+            fmt=settings.retention_format,
+            now=now,
+        )
+    report.vacuumed_pages = db.incremental_vacuum(settings.retention_vacuum_pages)
+    return report
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Archive old pairs_raw rows and reclaim space")
+    parser.add_argument("--db-path", default=None, help="Override sqlite db path")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    archive = subparsers.add_parser("archive", help="Move rows older than N days into archive files")
+    archive.add_argument("--days", type=float, default=None, help="Defaults to DOG_SCOUT_RETENTION_DAYS")
+    archive.add_argument("--archive-dir", default=None, help="Defaults to DOG_SCOUT_RETENTION_ARCHIVE_DIR")
+    archive.add_argument("--format", choices=ARCHIVE_FORMATS, default=None)
+    archive.add_argument("--chunk-rows", type=int, default=None)
+
+    vacuum = subparsers.add_parser("vacuum", help="Run an incremental vacuum pass")
+    vacuum.add_argument(
+        "--enable-incremental",
+        action="store_true",
+        help="Switch an older DB to auto_vacuum=INCREMENTAL first (runs one full VACUUM)",
+    )
+    vacuum.add_argument("--pages", type=int, default=None, help="0 = release every free page")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    load_dotenv()
+    setup_logging()
+    args = parse_args(argv)
+
+    settings = Settings.from_env()
+    if args.db_path:
+        settings = apply_setting_overrides(settings, {"db_path": args.db_path})
+
+    db = Database.from_settings(settings)
+    db.ensure_initialized()
+    try:
+        if args.command == "archive":
+            days = args.days if args.days is not None else settings.retention_days
+            if days <= 0:
+                raise SystemExit("Set --days or DOG_SCOUT_RETENTION_DAYS to a positive value")
+            report = archive_pairs_raw(
+                db,
+                args.archive_dir or settings.retention_archive_dir,
+                older_than_days=days,
+                chunk_rows=args.chunk_rows or settings.retention_chunk_rows,
+                fmt=args.format or settings.retention_format,
+            )
+        else:
+            report = RetentionReport()
+            if args.enable_incremental and db.enable_incremental_vacuum():
+                logger.info("auto_vacuum switched to INCREMENTAL")
+            pages = args.pages if args.pages is not None else settings.retention_vacuum_pages
+            report.vacuumed_pages = db.incremental_vacuum(pages)
+    finally:
+        db.close()
+
+    json.dump(report.to_dict(), sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
+import logging
+import math
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Protocol, Sequence
 
+from dog_scout.clients.cache import CachedResponse, CacheStats, MemoryResponseCache
+from dog_scout.clients.risk_apis import RISK_BACKENDS, RiskBackendError
+from dog_scout.config import Settings
 from dog_scout.models import RiskAssessment
 
+logger = logging.getLogger(__name__)
+
 
 class RiskProvider(Protocol):
     def assess_token(self, token_address: str, chain_id: str) -> RiskAssessment:
         ...
 
 
+class RiskBackend(Protocol):
+    """One upstream risk API; returns a partial assessment, or None when it does not cover the chain."""
+
+    name: str
+    timeout_seconds: float
+
+    def assess(self, token_address: str, chain_id: str) -> RiskAssessment | None:
+        ...
+
+
 @dataclass(slots=True)
 class MockRiskProvider:
     denylist_tokens: set[str]
@@ -32,3 +51,164 @@ class MockRiskProvider:
             top10_concentration=None,
             metadata={"provider": "mock", "chain_id": chain_id},
         )
+
+
+def merge_assessments(
+    parts: Sequence[tuple[str, RiskAssessment]],
+    failed: Sequence[str] = (),
+    denylisted: bool = False,
+) -> RiskAssessment:
+    """Fold backend results into one: any honeypot verdict wins, flags are unioned, holders come
+    from the first backend that has them, and top-10 concentration takes the most pessimistic value."""
+    flags: list[str] = ["denylisted_token"] if denylisted else []
+    holders: int | None = None
+    concentrations: list[float] = []
+    for _, part in parts:
+        flags.extend(flag for flag in part.risk_flags if flag not in flags)
+        if holders is None:
+            holders = part.holders
+        if part.top10_concentration is not None:
+            concentrations.append(part.top10_concentration)
+    flags.extend(f"risk_backend_unavailable:{name}" for name in failed)
+    return RiskAssessment(
+        is_honeypot=denylisted or any(part.is_honeypot for _, part in parts),
+        risk_flags=flags,
+        holders=holders,
+        top10_concentration=max(concentrations) if concentrations else None,
+        metadata={
+            "provider": "composite",
+            "backends": [name for name, _ in parts],
+            "failed_backends": list(failed),
+        },
+    )
+
+
+class CompositeRiskProvider:
+    """Queries every backend concurrently and merges the answers per token.
+
+    Each call is bounded by its backend's `timeout_seconds`; a backend that errors or
+    overruns is listed in `failed_backends` and leaves its fields unset, so the hard
+    filters skip those checks instead of failing the pair. Complete results are cached
+    per (chain, token) for `cache_ttl_seconds`; partial ones are retried next time.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[RiskBackend],
+        denylist_tokens: set[str] | None = None,
+        cache_ttl_seconds: float = 900.0,
+        cache_max_entries: int = 4096,
+        max_workers: int = 8,
+    ) -> None:
+        self.backends = list(backends)
+        self.denylist_tokens = {token.lower() for token in denylist_tokens or set()}
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache = MemoryResponseCache(cache_max_entries)
+        self.cache_stats = CacheStats()
+        self.max_workers = max(max_workers, 1)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="risk")
+
+    def assess_token(self, token_address: str, chain_id: str) -> RiskAssessment:
+        return self.assess_tokens([(token_address, chain_id)])[0]
+
+    def assess_tokens(self, tokens: Sequence[tuple[str, str]]) -> list[RiskAssessment]:
+        """Assess many tokens at once; all (token, backend) calls share the worker pool."""
+        keys = [f"{chain_id.lower()}:{token_address.lower()}" for token_address, chain_id in tokens]
+        resolved: dict[str, RiskAssessment] = {}
+        futures: dict[Future, tuple[str, RiskBackend]] = {}
+        pending: set[str] = set()
+        for key, (token_address, chain_id) in zip(keys, tokens):
+            if key in resolved or key in pending:
+                continue
+            cached = self.cache.get(key)
+            if cached is not None and cached.age_seconds() < self.cache_ttl_seconds:
+                self.cache_stats.record("hits")
+                resolved[key] = cached.payload
+                continue
+            self.cache_stats.record("misses")
+            if token_address.lower() in self.denylist_tokens or not self.backends:
+                # Denylisted tokens are blocked anyway; no need to spend API quota on them.
+                resolved[key] = merge_assessments([], denylisted=token_address.lower() in self.denylist_tokens)
+                continue
+            pending.add(key)
+            for backend in self.backends:
+                futures[self._executor.submit(self._timed_assess, backend, token_address, chain_id)] = (key, backend)
+
+        if futures:
+            # Calls enforce their own timeouts; this only guards against a backend that ignores them.
+            waves = math.ceil(len(futures) / self.max_workers)
+            slowest = max(backend.timeout_seconds for backend in self.backends)
+            done, not_done = wait(futures, timeout=slowest * (waves + 1))
+            for future in not_done:
+                future.cancel()
+
+            parts: dict[str, list[tuple[str, RiskAssessment]]] = {key: [] for key in pending}
+            failed: dict[str, list[str]] = {key: [] for key in pending}
+            for future, (key, backend) in futures.items():
+                outcome = future.result() if future in done else RiskBackendError("timed out")
+                if isinstance(outcome, RiskBackendError):
+                    logger.warning("Risk backend failed | backend=%s key=%s error=%s", backend.name, key, outcome)
+                    failed[key].append(backend.name)
+                elif outcome is not None:
+                    parts[key].append((backend.name, outcome))
+
+            now = time.time()
+            for key in pending:
+                resolved[key] = merge_assessments(parts[key], failed[key])
+                if not failed[key]:
+                    self.cache.put(key, CachedResponse(payload=resolved[key], stored_at=now))
+        return [resolved[key] for key in keys]
+
+    @staticmethod
+    def _timed_assess(
+        backend: RiskBackend,
+        token_address: str,
+        chain_id: str,
+    ) -> RiskAssessment | RiskBackendError | None:
+        started = time.monotonic()
+        try:
+            result = backend.assess(token_address, chain_id)
+        except RiskBackendError as exc:
+            return exc
+        except Exception as exc:  # noqa: BLE001 - one broken backend must not sink the scan
+            return RiskBackendError(f"{type(exc).__name__}: {exc}")
+        if time.monotonic() - started > backend.timeout_seconds:
+            return RiskBackendError(f"exceeded {backend.timeout_seconds}s")
+        return result
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def build_risk_provider(settings: Settings) -> RiskProvider:
+    if settings.risk_provider != "composite":
+        return MockRiskProvider(denylist_tokens=settings.denylist_tokens)
+
+    timeouts = {
+        "honeypot_is": settings.risk_honeypot_is_timeout_seconds,
+        "goplus": settings.risk_goplus_timeout_seconds,
+    }
+    base_urls = {
+        "honeypot_is": settings.risk_honeypot_is_base_url,
+        "goplus": settings.risk_goplus_base_url,
+    }
+    backends = []
+    for name in sorted(settings.risk_backends) or sorted(RISK_BACKENDS):
+        backend_cls = RISK_BACKENDS.get(name)
+        if backend_cls is None:
+            logger.warning("Unknown risk backend '%s', skipped", name)
+            continue
+        backends.append(
+            backend_cls(
+                timeout_seconds=timeouts[name],
+                base_url=base_urls[name] or None,
+                pool_size=settings.risk_max_workers,
+            )
+        )
+    return CompositeRiskProvider(
+        backends,
+        denylist_tokens=settings.denylist_tokens,
+        cache_ttl_seconds=settings.risk_cache_ttl_seconds,
+        cache_max_entries=settings.risk_cache_max_entries,
+        max_workers=settings.risk_max_workers,
+    )
@@ -9,15 +9,24 @@ from dotenv import load_dotenv
 
 from dog_scout.config import Settings
 from dog_scout.logging_config import setup_logging
+from dog_scout.metrics import MetricsServer
+from dog_scout.outbox import OutboxSender
 from dog_scout.pipeline import ScoutPipeline
+from dog_scout.retention import run_retention
 from dog_scout.storage import Database
+from dog_scout.worker import build_recheck_worker
 
 logger = logging.getLogger(__name__)
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Dog Scout scanner")
-    parser.add_argument("--mode", choices=["once", "loop"], default="once")
+    parser.add_argument(
+        "--mode",
+        choices=["once", "loop", "worker"],
+        default="once",
+        help="worker: only drain recheck_jobs (pair with DOG_SCOUT_RECHECK_MODE=external for the scanner)",
+    )
     parser.add_argument("--interval", type=int, default=None, help="loop interval seconds")
     parser.add_argument("--dry-run", action="store_true", help="force dry-run output mode")
     parser.add_argument(
@@ -42,29 +51,68 @@ def main() -> None:
     if args.use_mock_data:
         settings = replace(settings, use_mock_data=True)
 
-    db = Database(settings.db_path)
+    db = Database.from_settings(settings)
     db.ensure_initialized()
 
     pipeline = ScoutPipeline(settings=settings, db=db)
+    worker = build_recheck_worker(pipeline, settings)
+    sender = OutboxSender.from_settings(db, pipeline.notifier, settings) if settings.notify_mode == "outbox" else None
+    metrics_server = None
+    if settings.metrics_port > 0 and args.mode != "once":
+        metrics_server = MetricsServer(pipeline.metrics, port=settings.metrics_port).start()
+
+    try:
+        if args.mode == "worker":
+            worker.run_forever()
+            return
+
+        if args.mode == "once":
+            result = pipeline.run_once()
+            if sender is not None:
+                sender.run_once()
+            logger.info(
+                "single run done | fetched=%s passed=%s selected=%s rechecked=%s",
+                result.fetched_pairs,
+                result.passed_filters,
+                result.selected,
+                result.rechecked,
+            )
+            return
 
-    if args.mode == "once":
-        result = pipeline.run_once()
         logger.info(
-            "single run done | fetched=%s passed=%s selected=%s rechecked=%s",
-            result.fetched_pairs,
-            result.passed_filters,
-            result.selected,
-            result.rechecked,
+            "loop mode started | interval=%s sec rechecks=%s",
+            settings.loop_interval_seconds,
+            settings.recheck_mode,
         )
-        return
-
-    logger.info("loop mode started | interval=%s sec", settings.loop_interval_seconds)
-    try:
+        if settings.recheck_mode == "thread":
+            worker.start()
+        if sender is not None:
+            sender.start()
+        next_retention = time.monotonic()
         while True:
             pipeline.run_once()
+            if settings.retention_days > 0 and time.monotonic() >= next_retention:
+                next_retention = time.monotonic() + settings.retention_interval_seconds
+                try:
+                    report = run_retention(db, settings)
+                    logger.info(
+                        "retention pass | archived=%s vacuumed_pages=%s",
+                        report.archived_rows,
+                        report.vacuumed_pages,
+                    )
+                except OSError as exc:
+                    logger.warning("retention pass failed, rows kept in DB: %s", exc)
             time.sleep(settings.loop_interval_seconds)
     except KeyboardInterrupt:
-        logger.info("loop mode stopped")
+        logger.info("%s mode stopped", args.mode)
+    finally:
+        worker.stop()
+        if sender is not None:
+            sender.stop()
+        if metrics_server is not None:
+            metrics_server.stop()
+        pipeline.close()
+        db.close()
 
 
 if __name__ == "__main__":
@@ -4,14 +4,14 @@ from dataclasses import replace
 
 from dog_scout.analyzer import AnalyzerOutput
 from dog_scout.config import Settings
-from dog_scout.models import PairSnapshot, ScoreBreakdown
+from dog_scout.models import PairSnapshot, ScoreBreakdown, TrendFeatures
 
 
 def _clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
 
 
-def score_pair(pair: PairSnapshot, settings: Settings) -> ScoreBreakdown:
+def score_pair(pair: PairSnapshot, settings: Settings, features: TrendFeatures | None = None) -> ScoreBreakdown:
     # 0..40
     liquidity_target = max(settings.min_liquidity_usd * 4.0, 1.0)
     liquidity_score = _clamp((pair.liquidity_usd / liquidity_target) * 40.0, 0.0, 40.0)
@@ -30,12 +30,20 @@ def score_pair(pair: PairSnapshot, settings: Settings) -> ScoreBreakdown:
 
     final_score = _clamp(liquidity_score + txn_activity_score + momentum_score, 0.0, 100.0)
 
+    # Optional trend component, blended in only once a pair has history.
+    trend_score = None
+    if features is not None and features.samples >= 2 and settings.trend_weight > 0:
+        trend_score = _trend_score(features, txn_target)
+        trend_weight = _clamp(settings.trend_weight, 0.0, 1.0)
+        final_score = _clamp(final_score * (1.0 - trend_weight) + trend_score * trend_weight, 0.0, 100.0)
+
     return ScoreBreakdown(
         liquidity_score=round(liquidity_score, 2),
         txn_activity_score=round(txn_activity_score, 2),
         momentum_score=round(momentum_score, 2),
         final_score=round(final_score, 2),
         rule_score=round(final_score, 2),
+        trend_score=round(trend_score, 2) if trend_score is not None else None,
     )
 
 
@@ -63,9 +71,10 @@ def merge_with_analyzer(
             llm_action_hint=None,
             llm_reasons=[],
             llm_failed=analyzer_failed,
+            llm_cache_hit=False,
         )
 
-    rule_weight, llm_weight = _normalized_weights(settings.rule_weight, settings.llm_weight)
+    rule_weight, llm_weight = normalized_weights(settings.rule_weight, settings.llm_weight)
     merged = _clamp((rule_score * rule_weight) + (analyzer_output.narrative_score * llm_weight), 0.0, 100.0)
     return replace(
         rule_breakdown,
@@ -79,6 +88,7 @@ def merge_with_analyzer(
         llm_action_hint=analyzer_output.action_hint,
         llm_reasons=list(analyzer_output.reasons),
         llm_failed=False,
+        llm_cache_hit=analyzer_output.cache_hit,
     )
 
 
@@ -118,7 +128,20 @@ def _momentum_score(
     return _clamp(score, 0.0, 25.0)
 
 
-def _normalized_weights(rule_weight: float, llm_weight: float) -> tuple[float, float]:
+def _trend_score(features: TrendFeatures, txn_target: int) -> float:
+    # 0..40: +1%/min liquidity growth is worth +10 around the neutral 20
+    liquidity = 20.0 + _clamp(features.liquidity_slope * 100.0 * 10.0, -20.0, 20.0)
+    # 0..30: gaining 10% of the txn target per minute is worth the full +15
+    acceleration = 15.0 + _clamp((features.txn_acceleration / txn_target) * 150.0, -15.0, 15.0)
+    # 0..20
+    imbalance = 10.0 + _clamp(features.buy_sell_imbalance, -1.0, 1.0) * 10.0
+    # 0..10: trading 10% above the EWMA is worth the full +5
+    price = 5.0 + _clamp(features.price_vs_ewma * 50.0, -5.0, 5.0)
+    return _clamp(liquidity + acceleration + imbalance + price, 0.0, 100.0)
+
+
+def normalized_weights(rule_weight: float, llm_weight: float) -> tuple[float, float]:
+    """Rule/LLM blend weights scaled to sum to 1 (all rule when both are <= 0)."""
     safe_rule = max(rule_weight, 0.0)
     safe_llm = max(llm_weight, 0.0)
     total = safe_rule + safe_llm
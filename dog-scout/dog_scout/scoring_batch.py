@@ -0,0 +1,150 @@
+"""Columnar (NumPy) twin of `dog_scout.scoring.score_pair` for backfills and replays.
+
+Requires the optional `numpy` dependency (see `requirements-analytics.txt`).
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from dog_scout.config import Settings
+from dog_scout.models import PairSnapshot, ScoreBreakdown
+
+# |x*100 - (n + 0.5)| below this may round differently in float than in decimal.
+_TIE_TOLERANCE = 1e-6
+
+
+@dataclass(slots=True)
+class BatchScores:
+    liquidity_score: np.ndarray
+    txn_activity_score: np.ndarray
+    momentum_score: np.ndarray
+    final_score: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.final_score.shape[0])
+
+    @property
+    def rule_score(self) -> np.ndarray:
+        return self.final_score
+
+    def breakdown(self, index: int) -> ScoreBreakdown:
+        final_score = float(self.final_score[index])
+        return ScoreBreakdown(
+            liquidity_score=float(self.liquidity_score[index]),
+            txn_activity_score=float(self.txn_activity_score[index]),
+            momentum_score=float(self.momentum_score[index]),
+            final_score=final_score,
+            rule_score=final_score,
+        )
+
+    def to_breakdowns(self) -> list[ScoreBreakdown]:
+        return [self.breakdown(index) for index in range(len(self))]
+
+
+def pair_columns(pairs: Sequence[PairSnapshot]) -> dict[str, np.ndarray]:
+    """Columnar view of snapshots; missing price changes become NaN."""
+    return {
+        "liquidity_usd": np.fromiter((p.liquidity_usd for p in pairs), dtype=np.float64, count=len(pairs)),
+        "txns_h1_buys": np.fromiter((p.txns_h1_buys for p in pairs), dtype=np.int64, count=len(pairs)),
+        "txns_h1_sells": np.fromiter((p.txns_h1_sells for p in pairs), dtype=np.int64, count=len(pairs)),
+        "price_change_h1": np.fromiter(
+            (np.nan if p.price_change_h1 is None else p.price_change_h1 for p in pairs),
+            dtype=np.float64,
+            count=len(pairs),
+        ),
+        "price_change_h24": np.fromiter(
+            (np.nan if p.price_change_h24 is None else p.price_change_h24 for p in pairs),
+            dtype=np.float64,
+            count=len(pairs),
+        ),
+    }
+
+
+def score_pairs_batch(
+    liquidity_usd: np.ndarray,
+    txns_h1_buys: np.ndarray,
+    txns_h1_sells: np.ndarray,
+    price_change_h1: np.ndarray,
+    price_change_h24: np.ndarray,
+    settings: Settings,
+) -> BatchScores:
+    """Score many pairs at once; each element equals `score_pair` bit for bit."""
+    liquidity = np.asarray(liquidity_usd, dtype=np.float64)
+
+    # 0..40
+    liquidity_target = max(settings.min_liquidity_usd * 4.0, 1.0)
+    liquidity_score = np.clip((liquidity / liquidity_target) * 40.0, 0.0, 40.0)
+
+    # 0..35
+    txns_h1 = np.maximum(np.asarray(txns_h1_buys, dtype=np.int64), 0) + np.maximum(
+        np.asarray(txns_h1_sells, dtype=np.int64), 0
+    )
+    txn_target = max(settings.txn_target_h1, 1)
+    txn_activity_score = np.clip((txns_h1 / txn_target) * 35.0, 0.0, 35.0)
+
+    # 0..25
+    momentum_score = momentum_scores_batch(
+        np.asarray(price_change_h1, dtype=np.float64),
+        np.asarray(price_change_h24, dtype=np.float64),
+        settings.momentum_blowoff_threshold,
+    )
+
+    final_score = np.clip(liquidity_score + txn_activity_score + momentum_score, 0.0, 100.0)
+
+    return BatchScores(
+        liquidity_score=round2(liquidity_score),
+        txn_activity_score=round2(txn_activity_score),
+        momentum_score=round2(momentum_score),
+        final_score=round2(final_score),
+    )
+
+
+def momentum_scores_batch(
+    price_change_h1: np.ndarray,
+    price_change_h24: np.ndarray,
+    blowoff_threshold: float,
+) -> np.ndarray:
+    change = price_change_h1
+    missing = np.isnan(change)
+    abs_change = np.abs(change)
+
+    with np.errstate(invalid="ignore"):
+        score = np.select(
+            [
+                change < -60,
+                abs_change <= 12,
+                abs_change <= 25,
+                abs_change <= 45,
+                abs_change <= blowoff_threshold,
+            ],
+            [1.5, 25.0, 22.0, 17.0, 12.0],
+            default=4.0,
+        )
+        # Sanity penalty: sharp 1h move nearly equals full 24h move.
+        penalized = (
+            ~np.isnan(price_change_h24)
+            & (change > 20)
+            & (price_change_h24 > 0)
+            & (change >= 0.8 * price_change_h24)
+        )
+    score = np.where(penalized, score - 3.0, score)
+    score = np.clip(score, 0.0, 25.0)
+    return np.where(missing, 12.0, score)
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """Vectorized `round(x, 2)` that matches Python's correctly-rounded result.
+
+    `np.round` scales by 100 first, which can flip near-half ties; those few
+    elements are re-rounded with the builtin.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100.0
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < _TIE_TOLERANCE
+    if near_tie.any():
+        for index in np.flatnonzero(near_tie):
+            rounded[index] = round(float(values[index]), 2)
+    return rounded
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+
+from dog_scout.models import PairSnapshot, TokenProfile
+
+FETCH = "fetch"
+RESCORE = "rescore"
+SKIP = "skip"
+
+
+@dataclass(slots=True)
+class SeenToken:
+    fingerprint: str
+    fetched_at: float
+    pair: PairSnapshot
+    pair_raw_id: int | None = None
+    passed_filters: bool = False
+
+
+class SeenTokenIndex:
+    """Per-token memory of the latest-profiles feed, deciding what a repeat token costs.
+
+    A token is fetched again when it is new, its profile entry changed, or its snapshot is
+    older than `refetch_seconds`. Otherwise the cached snapshot is re-scored if it last
+    passed the hard filters (it can still win a top-N slot) and skipped if it did not
+    (same data, same rejection). Expired entries are swept lazily.
+    """
+
+    def __init__(self, refetch_seconds: float) -> None:
+        self.refetch_seconds = max(refetch_seconds, 0.0)
+        self._tokens: dict[tuple[str, str], SeenToken] = {}
+        self._lock = threading.Lock()
+        self._next_sweep_at: float | None = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tokens)
+
+    @staticmethod
+    def _key(chain_id: str, token_address: str) -> tuple[str, str]:
+        return chain_id.lower(), token_address.lower()
+
+    def decide(self, profile: TokenProfile, now: float | None = None) -> str:
+        now = now if now is not None else time.time()
+        with self._lock:
+            entry = self._tokens.get(self._key(profile.chain_id, profile.token_address))
+        if (
+            entry is None
+            or entry.fingerprint != profile.fingerprint
+            or now - entry.fetched_at >= self.refetch_seconds
+        ):
+            return FETCH
+        return RESCORE if entry.passed_filters else SKIP
+
+    def get(self, profile: TokenProfile) -> SeenToken | None:
+        with self._lock:
+            return self._tokens.get(self._key(profile.chain_id, profile.token_address))
+
+    def record_fetch(self, profile: TokenProfile, pair: PairSnapshot, now: float | None = None) -> None:
+        now = now if now is not None else time.time()
+        with self._lock:
+            self._tokens[self._key(profile.chain_id, profile.token_address)] = SeenToken(
+                fingerprint=profile.fingerprint,
+                fetched_at=now,
+                pair=pair,
+            )
+            if self._next_sweep_at is None:
+                self._next_sweep_at = now + self.refetch_seconds
+            elif now >= self._next_sweep_at:
+                self._sweep(now)
+
+    def record_outcome(self, profile: TokenProfile, pair_raw_id: int | None, passed_filters: bool) -> None:
+        """Remember where the snapshot was stored and whether it passed, so a re-score can reuse both."""
+        with self._lock:
+            entry = self._tokens.get(self._key(profile.chain_id, profile.token_address))
+            if entry is not None:
+                entry.pair_raw_id = pair_raw_id
+                entry.passed_filters = passed_filters
+
+    def _sweep(self, now: float) -> None:
+        cutoff = now - self.refetch_seconds
+        expired = [key for key, entry in self._tokens.items() if entry.fetched_at <= cutoff]
+        for key in expired:
+            del self._tokens[key]
+        self._next_sweep_at = now + self.refetch_seconds
@@ -0,0 +1,110 @@
+"""NumPy views of the per-pair `pair_snapshots` time series.
+
+Requires the optional `numpy` dependency (see `requirements-analytics.txt`).
+
+    history = SnapshotStore(db).history("0xpair")
+    history.liquidity_usd[-1], np.diff(history.price_usd)
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Sequence
+
+import numpy as np
+
+from dog_scout.storage import Database
+
+SERIES_FIELDS = (
+    "fetched_at",
+    "liquidity_usd",
+    "price_usd",
+    "volume_h24",
+    "txns_h1_buys",
+    "txns_h1_sells",
+    "price_change_h1",
+    "price_change_h24",
+)
+
+# Stays well under SQLite's bound-parameter limit.
+_QUERY_CHUNK = 500
+
+
+@dataclass(slots=True)
+class PairHistory:
+    """One pair's snapshots as parallel float64 arrays, oldest first.
+
+    `fetched_at` is unix seconds; missing price changes are NaN.
+    """
+
+    pair_address: str
+    fetched_at: np.ndarray
+    liquidity_usd: np.ndarray
+    price_usd: np.ndarray
+    volume_h24: np.ndarray
+    txns_h1_buys: np.ndarray
+    txns_h1_sells: np.ndarray
+    price_change_h1: np.ndarray
+    price_change_h24: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.fetched_at.shape[0])
+
+    @property
+    def txns_h1(self) -> np.ndarray:
+        return self.txns_h1_buys + self.txns_h1_sells
+
+    @classmethod
+    def empty(cls, pair_address: str) -> "PairHistory":
+        return cls(pair_address, *(np.empty(0, dtype=np.float64) for _ in SERIES_FIELDS))
+
+    @classmethod
+    def from_matrix(cls, pair_address: str, matrix: np.ndarray) -> "PairHistory":
+        # Columns are contiguous copies so downstream vector ops do not stride through the matrix.
+        return cls(pair_address, *(np.ascontiguousarray(matrix[:, column]) for column in range(len(SERIES_FIELDS))))
+
+
+def _epoch(value: datetime | float | None) -> float | None:
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return value.timestamp()
+
+
+class SnapshotStore:
+    """Read side of `pair_snapshots` (rows are written by `Database.insert_scan_results`)."""
+
+    def __init__(self, db: Database) -> None:
+        self.db = db
+
+    def history(
+        self,
+        pair_address: str,
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+    ) -> PairHistory:
+        return self.histories([pair_address], start=start, end=end)[pair_address]
+
+    def histories(
+        self,
+        pair_addresses: Sequence[str],
+        start: datetime | float | None = None,
+        end: datetime | float | None = None,
+    ) -> dict[str, PairHistory]:
+        """Histories for many pairs with one range query per chunk; unknown pairs map to empty arrays."""
+        unique = list(dict.fromkeys(pair_addresses))
+        result = {pair_address: PairHistory.empty(pair_address) for pair_address in unique}
+        for offset in range(0, len(unique), _QUERY_CHUNK):
+            rows = self.db.list_pair_snapshots(
+                unique[offset : offset + _QUERY_CHUNK],
+                start=_epoch(start),
+                end=_epoch(end),
+            )
+            if not rows:
+                continue
+            keys = [row[0] for row in rows]
+            matrix = np.array([row[1:] for row in rows], dtype=np.float64)
+            # Rows arrive sorted by pair, so each pair is one contiguous slice.
+            boundaries = [0] + [index for index in range(1, len(keys)) if keys[index] != keys[index - 1]] + [len(keys)]
+            for lo, hi in zip(boundaries, boundaries[1:]):
+                result[keys[lo]] = PairHistory.from_matrix(keys[lo], matrix[lo:hi])
+        return result
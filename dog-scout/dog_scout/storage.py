@@ -3,15 +3,21 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterator, Sequence
+from typing import Callable, Iterator, Sequence
 
+from dog_scout.config import Settings
+from dog_scout.dedup import RecentAlertIndex
 from dog_scout.models import (
     Candidate,
     FilterOutcome,
+    OutboxMessage,
     PairSnapshot,
+    RecheckContext,
     RecheckJob,
     RiskAssessment,
     ScoreBreakdown,
@@ -36,20 +42,302 @@ def _parse_sqlite_ts(raw: str) -> datetime:
     return parsed.astimezone(timezone.utc)
 
 
+_INSERT_PAIR_RAW_SQL = """
+    INSERT INTO pairs_raw (
+        chain_id, pair_address, token_address, dex_id,
+        liquidity_usd, price_usd, volume_h24,
+        txns_h1_buys, txns_h1_sells,
+        pair_created_at, raw_json
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_SIGNAL_SQL = """
+    INSERT INTO signals (
+        pair_raw_id, chain_id, pair_address, token_address,
+        liquidity_score, txn_activity_score, momentum_score, final_score, rule_score,
+        llm_score, llm_confidence, llm_provider, llm_model,
+        passed_filters, filter_reasons, skipped_checks, risk_flags,
+        holders, top10_concentration,
+        llm_risk_comment, llm_action_hint, llm_reasons, llm_failed, llm_cache_hit, trend_score
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# pairs_raw plus the recorded risk/LLM fields a replay needs; shared by replays and archives.
+# Exactly one row per pairs_raw row: a re-scored snapshot adds more signals for the same
+# pair_raw_id, so only the first (the one written when the snapshot was fetched) is joined.
+_REPLAY_SELECT_SQL = """
+    SELECT
+        p.id, p.chain_id, p.pair_address, p.token_address, p.dex_id,
+        p.liquidity_usd, p.price_usd, p.volume_h24, p.txns_h1_buys, p.txns_h1_sells,
+        p.pair_created_at, p.fetched_at, p.raw_json,
+        s.holders, s.top10_concentration, s.risk_flags, s.llm_score, s.llm_confidence,
+        EXISTS (
+            SELECT 1 FROM recheck_results rr WHERE rr.signal_id = s.id
+        ) AS is_recheck
+    FROM pairs_raw p
+    LEFT JOIN signals s ON s.id = (SELECT MIN(id) FROM signals WHERE pair_raw_id = p.id)
+"""
+
+_INSERT_PAIR_SNAPSHOT_SQL = """
+    INSERT OR REPLACE INTO pair_snapshots (
+        pair_address, fetched_at, chain_id,
+        liquidity_usd, price_usd, volume_h24, txns_h1_buys, txns_h1_sells,
+        price_change_h1, price_change_h24
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_RECHECK_JOB_COLUMNS = """
+    id, source_alert_id, source_signal_id, chain_id, pair_address, token_address,
+    token_symbol, scheduled_minutes, due_at, status, attempts
+"""
+
+
+def _pair_raw_params(pair: PairSnapshot) -> tuple:
+    return (
+        pair.chain_id,
+        pair.pair_address,
+        pair.base_token_address,
+        pair.dex_id,
+        pair.liquidity_usd,
+        pair.price_usd,
+        pair.volume_h24,
+        pair.txns_h1_buys,
+        pair.txns_h1_sells,
+        pair.pair_created_at.isoformat() if pair.pair_created_at else None,
+        json.dumps(pair.raw, ensure_ascii=True),
+    )
+
+
+def _pair_snapshot_params(pair: PairSnapshot, fetched_at: float) -> tuple:
+    return (
+        pair.pair_address,
+        fetched_at,
+        pair.chain_id,
+        pair.liquidity_usd,
+        pair.price_usd,
+        pair.volume_h24,
+        pair.txns_h1_buys,
+        pair.txns_h1_sells,
+        pair.price_change_h1,
+        pair.price_change_h24,
+    )
+
+
+def _signal_params(
+    pair_raw_id: int,
+    pair: PairSnapshot,
+    risk: RiskAssessment,
+    filter_outcome: FilterOutcome,
+    score: ScoreBreakdown,
+) -> tuple:
+    return (
+        pair_raw_id,
+        pair.chain_id,
+        pair.pair_address,
+        pair.base_token_address,
+        score.liquidity_score,
+        score.txn_activity_score,
+        score.momentum_score,
+        score.final_score,
+        score.rule_score if score.rule_score is not None else score.final_score,
+        score.llm_score,
+        score.llm_confidence,
+        score.llm_provider,
+        score.llm_model,
+        int(filter_outcome.passed),
+        json.dumps(filter_outcome.reasons, ensure_ascii=True),
+        json.dumps(filter_outcome.skipped_checks, ensure_ascii=True),
+        json.dumps(risk.risk_flags, ensure_ascii=True),
+        risk.holders,
+        risk.top10_concentration,
+        score.llm_risk_comment,
+        score.llm_action_hint,
+        json.dumps(score.llm_reasons, ensure_ascii=True),
+        int(score.llm_failed),
+        int(score.llm_cache_hit),
+        score.trend_score,
+    )
+
+
+def _executemany_ids(conn: sqlite3.Connection, sql: str, rows: list[tuple]) -> list[int]:
+    # Inside one write transaction AUTOINCREMENT hands out consecutive ids,
+    # so the batch occupies (last_id - n, last_id].
+    if not rows:
+        return []
+    conn.executemany(sql, rows)
+    last_id = int(conn.execute("SELECT last_insert_rowid()").fetchone()[0])
+    return list(range(last_id - len(rows) + 1, last_id + 1))
+
+
 class Database:
-    def __init__(self, db_path: Path) -> None:
+    """SQLite store with one long-lived WAL connection per thread.
+
+    WAL lets readers (dashboards, `reader()`, ad-hoc sqlite3 shells) run alongside the
+    writer; SQLite's busy timeout serializes writers from the scan loop and recheck workers.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        cache_size_kib: int = 16_384,
+        mmap_size_bytes: int = 256 * 1024 * 1024,
+        statement_cache_size: int = 256,
+        busy_timeout_seconds: float = 10.0,
+    ) -> None:
         self.db_path = db_path
+        self.cache_size_kib = cache_size_kib
+        self.mmap_size_bytes = mmap_size_bytes
+        self.statement_cache_size = statement_cache_size
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._generation = 0
+        self.alert_index: RecentAlertIndex | None = None
+        self._alert_index_last_id = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "Database":
+        return cls(
+            settings.db_path,
+            cache_size_kib=settings.db_cache_size_kib,
+            mmap_size_bytes=settings.db_mmap_size_mb * 1024 * 1024,
+            statement_cache_size=settings.db_statement_cache_size,
+        )
+
+    def _open_connection(self, readonly: bool) -> sqlite3.Connection:
+        if readonly:
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                timeout=self.busy_timeout_seconds,
+                cached_statements=self.statement_cache_size,
+                check_same_thread=False,
+            )
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.busy_timeout_seconds,
+                cached_statements=self.statement_cache_size,
+                check_same_thread=False,
+            )
+            # Only takes effect on a fresh file; older DBs switch via enable_incremental_vacuum().
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        conn.row_factory = sqlite3.Row
+        conn.execute(f"PRAGMA cache_size=-{int(self.cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size={int(self.mmap_size_bytes)}")
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _thread_connection(self, readonly: bool = False) -> sqlite3.Connection:
+        attr = "read_conn" if readonly else "conn"
+        cached = getattr(self._local, attr, None)
+        if cached is not None and cached[0] == self._generation:
+            return cached[1]
+        conn = self._open_connection(readonly=readonly)
+        setattr(self._local, attr, (self._generation, conn))
+        return conn
 
     @contextmanager
     def connect(self) -> Iterator[sqlite3.Connection]:
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        active = getattr(self._local, "batch_conn", None)
+        if active is not None:
+            # Inside batch(): share its connection, commit happens when the batch exits.
+            yield active
+            return
+
+        conn = self._thread_connection()
         try:
             yield conn
             conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Read-only connection for reports/replays; never takes the write lock."""
+        conn = self._thread_connection(readonly=True)
+        try:
+            yield conn
         finally:
-            conn.close()
+            conn.rollback()
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                logger.debug("Failed to close sqlite connection", exc_info=True)
+
+    @contextmanager
+    def batch(self) -> Iterator[sqlite3.Connection]:
+        """Unit of work: every storage call in the block shares one connection and one commit."""
+        if getattr(self._local, "batch_conn", None) is not None:
+            with self.connect() as conn:
+                yield conn
+            return
+
+        callbacks: list[Callable[[], None]] = []
+        with self.connect() as conn:
+            self._local.batch_conn = conn
+            self._local.batch_callbacks = callbacks
+            try:
+                yield conn
+            finally:
+                self._local.batch_conn = None
+                self._local.batch_callbacks = None
+        for callback in callbacks:
+            callback()
+
+    def _after_commit(self, callback: Callable[[], None]) -> None:
+        # In-memory side effects must not outlive a rolled-back batch.
+        pending = getattr(self._local, "batch_callbacks", None)
+        if pending is not None:
+            pending.append(callback)
+        else:
+            callback()
+
+    def warm_alert_index(self, ttl_minutes: int) -> RecentAlertIndex:
+        """Build the in-memory dedup index from alerts inside the cooldown window."""
+        self.alert_index = RecentAlertIndex(ttl_minutes=ttl_minutes)
+        self._alert_index_last_id = 0
+        self.refresh_alert_index()
+        logger.info("Warmed recent-alert index | entries=%s ttl_min=%s", len(self.alert_index), ttl_minutes)
+        return self.alert_index
+
+    def refresh_alert_index(self) -> None:
+        """Pull alerts written since the last refresh (e.g. by another process) into the index."""
+        if self.alert_index is None:
+            return
+        cutoff = _utc_now() - self.alert_index.ttl
+        with self.connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, token_address, pair_address, created_at
+                FROM alerts
+                WHERE id > ? AND created_at >= ?
+                ORDER BY id ASC
+                """,
+                (self._alert_index_last_id, _to_sqlite_ts(cutoff)),
+            ).fetchall()
+        for row in rows:
+            self.alert_index.record(
+                str(row["token_address"]),
+                str(row["pair_address"]),
+                _parse_sqlite_ts(str(row["created_at"])),
+            )
+            self._alert_index_last_id = max(self._alert_index_last_id, int(row["id"]))
 
     def ensure_initialized(self) -> None:
         migrations_dir = Path(__file__).parent / "db" / "migrations"
@@ -80,30 +368,8 @@ class Database:
 
     def insert_pair_raw(self, pair: PairSnapshot) -> int:
         with self.connect() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO pairs_raw (
-                    chain_id, pair_address, token_address, dex_id,
-                    liquidity_usd, price_usd, volume_h24,
-                    txns_h1_buys, txns_h1_sells,
-                    pair_created_at, raw_json
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    pair.chain_id,
-                    pair.pair_address,
-                    pair.base_token_address,
-                    pair.dex_id,
-                    pair.liquidity_usd,
-                    pair.price_usd,
-                    pair.volume_h24,
-                    pair.txns_h1_buys,
-                    pair.txns_h1_sells,
-                    pair.pair_created_at.isoformat() if pair.pair_created_at else None,
-                    json.dumps(pair.raw, ensure_ascii=True),
-                ),
-            )
+            cursor = conn.execute(_INSERT_PAIR_RAW_SQL, _pair_raw_params(pair))
+            conn.execute(_INSERT_PAIR_SNAPSHOT_SQL, _pair_snapshot_params(pair, time.time()))
             return int(cursor.lastrowid)
 
     def insert_signal(
@@ -116,59 +382,71 @@ class Database:
     ) -> int:
         with self.connect() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO signals (
-                    pair_raw_id, chain_id, pair_address, token_address,
-                    liquidity_score, txn_activity_score, momentum_score, final_score, rule_score,
-                    llm_score, llm_confidence, llm_provider, llm_model,
-                    passed_filters, filter_reasons, skipped_checks, risk_flags,
-                    holders, top10_concentration,
-                    llm_risk_comment, llm_action_hint, llm_reasons, llm_failed
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    pair_raw_id,
-                    pair.chain_id,
-                    pair.pair_address,
-                    pair.base_token_address,
-                    score.liquidity_score,
-                    score.txn_activity_score,
-                    score.momentum_score,
-                    score.final_score,
-                    score.rule_score if score.rule_score is not None else score.final_score,
-                    score.llm_score,
-                    score.llm_confidence,
-                    score.llm_provider,
-                    score.llm_model,
-                    int(filter_outcome.passed),
-                    json.dumps(filter_outcome.reasons, ensure_ascii=True),
-                    json.dumps(filter_outcome.skipped_checks, ensure_ascii=True),
-                    json.dumps(risk.risk_flags, ensure_ascii=True),
-                    risk.holders,
-                    risk.top10_concentration,
-                    score.llm_risk_comment,
-                    score.llm_action_hint,
-                    json.dumps(score.llm_reasons, ensure_ascii=True),
-                    int(score.llm_failed),
-                ),
+                _INSERT_SIGNAL_SQL,
+                _signal_params(pair_raw_id, pair, risk, filter_outcome, score),
             )
             return int(cursor.lastrowid)
 
+    def insert_scan_results(self, candidates: Sequence[Candidate]) -> list[tuple[int, int]]:
+        """Persist raw pairs + signals for a whole cycle in one transaction.
+
+        Fills `pair_raw_id` / `signal_id` on each candidate and returns them in input order.
+        Candidates that already carry a `pair_raw_id` (a re-scored snapshot) only add a signal.
+        """
+        if not candidates:
+            return []
+
+        fresh = [candidate for candidate in candidates if candidate.pair_raw_id is None]
+        with self.batch() as conn:
+            if fresh:
+                fresh_ids = _executemany_ids(
+                    conn,
+                    _INSERT_PAIR_RAW_SQL,
+                    [_pair_raw_params(candidate.pair) for candidate in fresh],
+                )
+                fetched_at = time.time()
+                conn.executemany(
+                    _INSERT_PAIR_SNAPSHOT_SQL,
+                    [_pair_snapshot_params(candidate.pair, fetched_at) for candidate in fresh],
+                )
+                for candidate, pair_raw_id in zip(fresh, fresh_ids):
+                    candidate.pair_raw_id = pair_raw_id
+            pair_raw_ids = [candidate.pair_raw_id for candidate in candidates]
+            signal_ids = _executemany_ids(
+                conn,
+                _INSERT_SIGNAL_SQL,
+                [
+                    _signal_params(
+                        pair_raw_id,
+                        candidate.pair,
+                        candidate.risk,
+                        candidate.filter_outcome,
+                        candidate.score,
+                    )
+                    for pair_raw_id, candidate in zip(pair_raw_ids, candidates)
+                ],
+            )
+
+        for candidate, signal_id in zip(candidates, signal_ids):
+            candidate.signal_id = signal_id
+        return list(zip(pair_raw_ids, signal_ids))
+
     def has_recent_alert(self, token_address: str, pair_address: str, cooldown_minutes: int) -> bool:
-        cutoff = _utc_now() - timedelta(minutes=cooldown_minutes)
+        if self.alert_index is not None and self.alert_index.covers(cooldown_minutes):
+            return self.alert_index.has_recent_alert(token_address, pair_address, cooldown_minutes)
+
+        cutoff = _to_sqlite_ts(_utc_now() - timedelta(minutes=cooldown_minutes))
+        # Two probes instead of one OR, so each is answered from its (address, created_at) index alone.
         with self.connect() as conn:
             row = conn.execute(
                 """
-                SELECT 1
-                FROM alerts
-                WHERE (token_address = ? OR pair_address = ?)
-                  AND created_at >= ?
-                LIMIT 1
+                SELECT
+                    EXISTS (SELECT 1 FROM alerts WHERE token_address = ? AND created_at >= ?)
+                    OR EXISTS (SELECT 1 FROM alerts WHERE pair_address = ? AND created_at >= ?)
                 """,
-                (token_address, pair_address, _to_sqlite_ts(cutoff)),
+                (token_address, cutoff, pair_address, cutoff),
             ).fetchone()
-            return row is not None
+            return bool(row[0])
 
     def insert_alert(self, candidate: Candidate, message: str, dry_run: bool, status: str, sent: bool) -> int:
         with self.connect() as conn:
@@ -192,8 +470,131 @@ class Database:
                     _utc_now().isoformat() if sent else None,
                 ),
             )
+            alert_id = int(cursor.lastrowid)
+        if self.alert_index is not None:
+            index = self.alert_index
+            token_address = candidate.pair.base_token_address
+            pair_address = candidate.pair.pair_address
+            self._after_commit(lambda: index.record(token_address, pair_address))
+        return alert_id
+
+    def enqueue_notification(
+        self,
+        chat_id: str,
+        message: str,
+        alert_id: int | None = None,
+        batch_key: str | None = None,
+    ) -> int:
+        with self.connect() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO notification_outbox (alert_id, chat_id, batch_key, message, next_attempt_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (alert_id, chat_id, batch_key, message, _to_sqlite_ts(_utc_now())),
+            )
             return int(cursor.lastrowid)
 
+    def claim_due_notifications(self, limit: int) -> list[OutboxMessage]:
+        """Move up to `limit` due rows to `sending`, oldest first."""
+        with self.batch() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, alert_id, chat_id, batch_key, message, attempts
+                FROM notification_outbox
+                WHERE status = 'pending' AND next_attempt_at <= ?
+                ORDER BY id ASC
+                LIMIT ?
+                """,
+                (_to_sqlite_ts(_utc_now()), max(limit, 1)),
+            ).fetchall()
+            claimed = [
+                row
+                for row in rows
+                if conn.execute(
+                    "UPDATE notification_outbox SET status = 'sending' WHERE id = ? AND status = 'pending'",
+                    (row["id"],),
+                ).rowcount
+                == 1
+            ]
+        return [
+            OutboxMessage(
+                id=int(row["id"]),
+                alert_id=int(row["alert_id"]) if row["alert_id"] is not None else None,
+                chat_id=str(row["chat_id"]),
+                batch_key=row["batch_key"],
+                message=str(row["message"]),
+                attempts=int(row["attempts"]),
+            )
+            for row in claimed
+        ]
+
+    def complete_notifications(self, outbox_ids: Sequence[int], status: str, sent: bool) -> None:
+        """Close delivered rows and copy the outcome onto their alerts."""
+        sent_at = _utc_now().isoformat() if sent else None
+        params = [(status, sent_at, outbox_id) for outbox_id in outbox_ids]
+        with self.batch() as conn:
+            conn.executemany(
+                """
+                UPDATE notification_outbox
+                SET status = ?, sent_at = ?, attempts = attempts + 1, last_error = NULL
+                WHERE id = ?
+                """,
+                params,
+            )
+            conn.executemany(
+                """
+                UPDATE alerts
+                SET status = ?, sent_at = ?
+                WHERE id = (SELECT alert_id FROM notification_outbox WHERE id = ?)
+                """,
+                params,
+            )
+
+    def retry_notifications(
+        self,
+        outbox_ids: Sequence[int],
+        delay_seconds: float,
+        error_message: str,
+        count_attempt: bool = True,
+    ) -> None:
+        next_attempt_at = _to_sqlite_ts(_utc_now() + timedelta(seconds=max(delay_seconds, 0.0)))
+        with self.connect() as conn:
+            conn.executemany(
+                """
+                UPDATE notification_outbox
+                SET status = 'pending', next_attempt_at = ?, attempts = attempts + ?, last_error = ?
+                WHERE id = ?
+                """,
+                [(next_attempt_at, int(count_attempt), error_message[:500], outbox_id) for outbox_id in outbox_ids],
+            )
+
+    def fail_notifications(self, outbox_ids: Sequence[int], error_message: str) -> None:
+        """Give up on rows; their alerts end as `send_failed`, as inline delivery records it."""
+        with self.batch() as conn:
+            conn.executemany(
+                """
+                UPDATE notification_outbox
+                SET status = 'failed', attempts = attempts + 1, last_error = ?
+                WHERE id = ?
+                """,
+                [(error_message[:500], outbox_id) for outbox_id in outbox_ids],
+            )
+            conn.executemany(
+                """
+                UPDATE alerts
+                SET status = 'send_failed'
+                WHERE id = (SELECT alert_id FROM notification_outbox WHERE id = ?)
+                """,
+                [(outbox_id,) for outbox_id in outbox_ids],
+            )
+
+    def release_claimed_notifications(self) -> int:
+        """Return rows left in `sending` (e.g. by a crashed sender) to the queue."""
+        with self.connect() as conn:
+            cursor = conn.execute("UPDATE notification_outbox SET status = 'pending' WHERE status = 'sending'")
+            return int(cursor.rowcount)
+
     def enqueue_recheck_jobs(
         self,
         candidate: Candidate,
@@ -201,74 +602,111 @@ class Database:
         scheduled_minutes: Sequence[int] = (5, 15),
     ) -> None:
         now = _utc_now()
+        rows = [
+            (
+                source_alert_id,
+                candidate.signal_id,
+                candidate.pair.chain_id,
+                candidate.pair.pair_address,
+                candidate.pair.base_token_address,
+                candidate.pair.base_token_symbol,
+                int(minute),
+                _to_sqlite_ts(now + timedelta(minutes=int(minute))),
+            )
+            for minute in scheduled_minutes
+        ]
         with self.connect() as conn:
-            for minute in scheduled_minutes:
-                due_at = _to_sqlite_ts(now + timedelta(minutes=int(minute)))
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO recheck_jobs (
-                        source_alert_id, source_signal_id, chain_id, pair_address, token_address,
-                        token_symbol, scheduled_minutes, due_at, status
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'pending')
-                    """,
-                    (
-                        source_alert_id,
-                        candidate.signal_id,
-                        candidate.pair.chain_id,
-                        candidate.pair.pair_address,
-                        candidate.pair.base_token_address,
-                        candidate.pair.base_token_symbol,
-                        int(minute),
-                        due_at,
-                    ),
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO recheck_jobs (
+                    source_alert_id, source_signal_id, chain_id, pair_address, token_address,
+                    token_symbol, scheduled_minutes, due_at, status
                 )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'pending')
+                """,
+                rows,
+            )
 
-    def claim_due_recheck_jobs(self, limit: int) -> list[RecheckJob]:
-        now_sql = _to_sqlite_ts(_utc_now())
-        jobs: list[RecheckJob] = []
+    def claim_due_recheck_jobs(self, limit: int, lease_seconds: float = 300.0) -> list[RecheckJob]:
+        now = _utc_now()
         with self.connect() as conn:
             rows = conn.execute(
-                """
-                SELECT
-                    id, source_alert_id, source_signal_id, chain_id, pair_address, token_address,
-                    token_symbol, scheduled_minutes, due_at, status, attempts
+                f"""
+                SELECT {_RECHECK_JOB_COLUMNS}
                 FROM recheck_jobs
                 WHERE status = 'pending' AND due_at <= ?
                 ORDER BY due_at ASC
                 LIMIT ?
                 """,
-                (now_sql, max(limit, 1)),
+                (_to_sqlite_ts(now), max(limit, 1)),
             ).fetchall()
+            return self._claim_recheck_rows(conn, rows, now + timedelta(seconds=lease_seconds))
 
-            for row in rows:
-                updated = conn.execute(
-                    """
-                    UPDATE recheck_jobs
-                    SET status = 'running', attempts = attempts + 1
-                    WHERE id = ? AND status = 'pending'
-                    """,
-                    (row["id"],),
-                )
-                if updated.rowcount != 1:
-                    continue
-                jobs.append(
-                    RecheckJob(
-                        id=int(row["id"]),
-                        source_alert_id=int(row["source_alert_id"]),
-                        source_signal_id=(
-                            int(row["source_signal_id"]) if row["source_signal_id"] is not None else None
-                        ),
-                        chain_id=str(row["chain_id"]),
-                        pair_address=str(row["pair_address"]),
-                        token_address=str(row["token_address"]),
-                        token_symbol=str(row["token_symbol"]),
-                        scheduled_minutes=int(row["scheduled_minutes"]),
-                        due_at=_parse_sqlite_ts(str(row["due_at"])),
-                        status="running",
-                        attempts=int(row["attempts"]) + 1,
-                    )
+    def claim_recheck_jobs(self, job_ids: Sequence[int], lease_seconds: float = 300.0) -> list[RecheckJob]:
+        """Claim specific jobs (a scheduler's due heap entries) if still pending and due.
+
+        Jobs another worker claimed first, or whose `due_at` moved later, are left out.
+        """
+        if not job_ids:
+            return []
+        now = _utc_now()
+        placeholders = ",".join("?" for _ in job_ids)
+        with self.connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {_RECHECK_JOB_COLUMNS}
+                FROM recheck_jobs
+                WHERE id IN ({placeholders}) AND status = 'pending' AND due_at <= ?
+                ORDER BY due_at ASC
+                """,
+                (*job_ids, _to_sqlite_ts(now)),
+            ).fetchall()
+            return self._claim_recheck_rows(conn, rows, now + timedelta(seconds=lease_seconds))
+
+    def list_pending_recheck_jobs(self, after_id: int = 0) -> list[tuple[int, datetime]]:
+        """`(id, due_at)` of pending jobs with `id > after_id`, for rebuilding a scheduler's heap."""
+        with self.reader() as conn:
+            rows = conn.execute(
+                "SELECT id, due_at FROM recheck_jobs WHERE status = 'pending' AND id > ? ORDER BY id",
+                (after_id,),
+            ).fetchall()
+        return [(int(row["id"]), _parse_sqlite_ts(str(row["due_at"]))) for row in rows]
+
+    @staticmethod
+    def _claim_recheck_rows(
+        conn: sqlite3.Connection,
+        rows: Sequence[sqlite3.Row],
+        lease_until: datetime,
+    ) -> list[RecheckJob]:
+        jobs: list[RecheckJob] = []
+        for row in rows:
+            updated = conn.execute(
+                """
+                UPDATE recheck_jobs
+                SET status = 'running', attempts = attempts + 1, lease_until = ?
+                WHERE id = ? AND status = 'pending'
+                """,
+                (_to_sqlite_ts(lease_until), row["id"]),
+            )
+            if updated.rowcount != 1:
+                continue
+            jobs.append(
+                RecheckJob(
+                    id=int(row["id"]),
+                    source_alert_id=int(row["source_alert_id"]),
+                    source_signal_id=(
+                        int(row["source_signal_id"]) if row["source_signal_id"] is not None else None
+                    ),
+                    chain_id=str(row["chain_id"]),
+                    pair_address=str(row["pair_address"]),
+                    token_address=str(row["token_address"]),
+                    token_symbol=str(row["token_symbol"]),
+                    scheduled_minutes=int(row["scheduled_minutes"]),
+                    due_at=_parse_sqlite_ts(str(row["due_at"])),
+                    status="running",
+                    attempts=int(row["attempts"]) + 1,
                 )
+            )
         return jobs
 
     def mark_recheck_job_done(self, job_id: int) -> None:
@@ -276,7 +714,7 @@ class Database:
             conn.execute(
                 """
                 UPDATE recheck_jobs
-                SET status = 'done', processed_at = ?, last_error = NULL
+                SET status = 'done', processed_at = ?, last_error = NULL, lease_until = NULL
                 WHERE id = ?
                 """,
                 (_to_sqlite_ts(_utc_now()), job_id),
@@ -287,12 +725,58 @@ class Database:
             conn.execute(
                 """
                 UPDATE recheck_jobs
-                SET status = 'failed', processed_at = ?, last_error = ?
+                SET status = 'failed', processed_at = ?, last_error = ?, lease_until = NULL
                 WHERE id = ?
                 """,
                 (_to_sqlite_ts(_utc_now()), error_message[:500], job_id),
             )
 
+    def retry_recheck_job(self, job_id: int, delay_seconds: float, error_message: str) -> datetime:
+        """Return a failed attempt to `pending`, due again after `delay_seconds`; returns the new `due_at`."""
+        due_at = _utc_now() + timedelta(seconds=delay_seconds)
+        with self.connect() as conn:
+            conn.execute(
+                """
+                UPDATE recheck_jobs
+                SET status = 'pending', due_at = ?, last_error = ?, lease_until = NULL
+                WHERE id = ? AND status = 'running'
+                """,
+                (_to_sqlite_ts(due_at), error_message[:500], job_id),
+            )
+        return _parse_sqlite_ts(_to_sqlite_ts(due_at))
+
+    def reap_expired_recheck_leases(self, max_attempts: int) -> list[tuple[int, datetime]]:
+        """Return `running` jobs whose lease expired (their worker died) to `pending`.
+
+        Jobs that already used `max_attempts` attempts are marked `failed` instead. Returns
+        `(id, due_at)` of the requeued jobs.
+        """
+        now_sql = _to_sqlite_ts(_utc_now())
+        requeued: list[tuple[int, datetime]] = []
+        with self.connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, due_at, attempts
+                FROM recheck_jobs
+                WHERE status = 'running' AND lease_until <= ?
+                """,
+                (now_sql,),
+            ).fetchall()
+            for row in rows:
+                exhausted = int(row["attempts"]) >= max_attempts
+                updated = conn.execute(
+                    """
+                    UPDATE recheck_jobs
+                    SET status = ?, lease_until = NULL, last_error = 'lease expired',
+                        processed_at = CASE WHEN ? THEN ? ELSE processed_at END
+                    WHERE id = ? AND status = 'running' AND lease_until <= ?
+                    """,
+                    ("failed" if exhausted else "pending", exhausted, now_sql, row["id"], now_sql),
+                )
+                if updated.rowcount == 1 and not exhausted:
+                    requeued.append((int(row["id"]), _parse_sqlite_ts(str(row["due_at"]))))
+        return requeued
+
     def insert_recheck_result(
         self,
         job: RecheckJob,
@@ -306,7 +790,7 @@ class Database:
         with self.connect() as conn:
             cursor = conn.execute(
                 """
-                INSERT INTO recheck_results (
+                INSERT OR IGNORE INTO recheck_results (
                     job_id, source_alert_id, signal_id, chain_id, pair_address, token_address,
                     token_symbol, scheduled_minutes, status,
                     initial_score, score_5m, score_15m, current_score,
@@ -335,63 +819,247 @@ class Database:
                     candidate.score.rule_score,
                     candidate.score.llm_score,
                     candidate.score.llm_confidence,
-                    (
-                        f"{timeline.initial_score:.2f} -> "
-                        f"{'--' if timeline.score_5m is None else f'{timeline.score_5m:.2f}'} -> "
-                        f"{'--' if timeline.score_15m is None else f'{timeline.score_15m:.2f}'}"
+                    " -> ".join(
+                        [
+                            f"{timeline.initial_score:.2f}",
+                            *("--" if score is None else f"{score:.2f}" for _, score in timeline.points()),
+                        ]
                     ),
                     message,
                 ),
             )
+            if cursor.rowcount == 0:
+                # Already recorded by an earlier attempt of this job (e.g. one whose lease expired).
+                existing = conn.execute("SELECT id FROM recheck_results WHERE job_id = ?", (job.id,)).fetchone()
+                return int(existing["id"])
             return int(cursor.lastrowid)
 
-    def get_alert_score(self, alert_id: int) -> float | None:
+    def load_recheck_context(
+        self,
+        job_ids: Sequence[int],
+        minutes: Sequence[int] = (5, 15),
+    ) -> dict[int, RecheckContext]:
+        """Alert score, recorded rechecks and result marker for a batch of jobs, in one query.
+
+        Jobs whose source alert is gone are left out of the result.
+        """
+        if not job_ids:
+            return {}
+        placeholders = ",".join("?" for _ in job_ids)
         with self.connect() as conn:
-            row = conn.execute(
-                "SELECT final_score FROM alerts WHERE id = ? LIMIT 1",
-                (alert_id,),
+            rows = conn.execute(
+                f"""
+                SELECT
+                    j.id AS job_id, j.source_alert_id, j.scheduled_minutes,
+                    a.final_score AS initial_score,
+                    EXISTS (SELECT 1 FROM recheck_results done WHERE done.job_id = j.id) AS has_result,
+                    rr.scheduled_minutes AS result_minutes, rr.current_score
+                FROM recheck_jobs j
+                JOIN alerts a ON a.id = j.source_alert_id
+                LEFT JOIN recheck_results rr ON rr.source_alert_id = j.source_alert_id
+                WHERE j.id IN ({placeholders})
+                """,
+                tuple(job_ids),
+            ).fetchall()
+
+        timelines: dict[int, ScoreTimeline] = {}
+        contexts: dict[int, RecheckContext] = {}
+        for row in rows:
+            alert_id = int(row["source_alert_id"])
+            timeline = timelines.get(alert_id)
+            if timeline is None:
+                timeline = ScoreTimeline(initial_score=float(row["initial_score"]), minutes=tuple(minutes))
+                timelines[alert_id] = timeline
+            if row["result_minutes"] is not None:
+                timeline.scores[int(row["result_minutes"])] = float(row["current_score"])
+            job_id = int(row["job_id"])
+            if job_id not in contexts:
+                contexts[job_id] = RecheckContext(
+                    job_id=job_id,
+                    scheduled_minutes=int(row["scheduled_minutes"]),
+                    timeline=timeline,
+                    has_result=bool(row["has_result"]),
+                )
+        return contexts
+
+    def iter_replay_rows(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        chunk_size: int = 5_000,
+    ) -> Iterator[sqlite3.Row]:
+        """Stream pairs_raw (+ recorded risk/LLM fields) in fetched_at order on a read-only connection."""
+        start_sql = _to_sqlite_ts(start) if start is not None else "0000-00-00 00:00:00"
+        end_sql = _to_sqlite_ts(end) if end is not None else "9999-12-31 23:59:59"
+        with self.reader() as conn:
+            cursor = conn.execute(
+                f"""
+                {_REPLAY_SELECT_SQL}
+                WHERE p.fetched_at >= ? AND p.fetched_at < ?
+                ORDER BY p.fetched_at ASC, p.id ASC
+                """,
+                (start_sql, end_sql),
+            )
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+
+    def list_initial_alerts(self, start: datetime | None = None, end: datetime | None = None) -> list[sqlite3.Row]:
+        """Live first-time alerts (recheck summaries excluded) in a time range."""
+        start_sql = _to_sqlite_ts(start) if start is not None else "0000-00-00 00:00:00"
+        end_sql = _to_sqlite_ts(end) if end is not None else "9999-12-31 23:59:59"
+        with self.reader() as conn:
+            return conn.execute(
+                """
+                SELECT a.id, a.token_address, a.pair_address, a.created_at
+                FROM alerts a
+                WHERE a.created_at >= ? AND a.created_at < ?
+                  AND NOT EXISTS (
+                      SELECT 1 FROM recheck_results rr WHERE rr.signal_id = a.signal_id
+                  )
+                ORDER BY a.created_at ASC, a.id ASC
+                """,
+                (start_sql, end_sql),
+            ).fetchall()
+
+    def list_trade_feedback(self) -> list[sqlite3.Row]:
+        # CROSS JOIN pins the (small) feedback table as the outer loop; without statistics the
+        # planner would rather walk every alert in created_at order to skip the sort.
+        with self.reader() as conn:
+            return conn.execute(
+                """
+                SELECT
+                    f.alert_id, f.outcome, f.pnl_pct, f.holding_minutes,
+                    a.pair_address, a.token_address, a.created_at AS alert_created_at
+                FROM trade_feedback f
+                CROSS JOIN alerts a ON a.id = f.alert_id
+                ORDER BY a.created_at ASC
+                """
+            ).fetchall()
+
+    def get_llm_cache(self, cache_key: str) -> sqlite3.Row | None:
+        """Unexpired cached analyzer output for `cache_key`, if any."""
+        with self.reader() as conn:
+            return conn.execute(
+                """
+                SELECT cache_key, provider, model, output_json, created_at, expires_at
+                FROM llm_cache
+                WHERE cache_key = ? AND expires_at > ?
+                """,
+                (cache_key, _to_sqlite_ts(_utc_now())),
             ).fetchone()
-            if row is None:
-                return None
-            return float(row["final_score"])
 
-    def get_previous_recheck_score(self, source_alert_id: int, scheduled_minutes: int) -> float | None:
+    def put_llm_cache(self, cache_key: str, provider: str, model: str, output_json: str, ttl_seconds: float) -> None:
+        now = _utc_now()
         with self.connect() as conn:
-            row = conn.execute(
+            conn.execute(
                 """
-                SELECT current_score
-                FROM recheck_results
-                WHERE source_alert_id = ?
-                  AND scheduled_minutes < ?
-                ORDER BY scheduled_minutes DESC
-                LIMIT 1
+                INSERT OR REPLACE INTO llm_cache (cache_key, provider, model, output_json, created_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?)
                 """,
-                (source_alert_id, scheduled_minutes),
-            ).fetchone()
-            if row is None:
-                return None
-            return float(row["current_score"])
+                (
+                    cache_key,
+                    provider,
+                    model,
+                    output_json,
+                    _to_sqlite_ts(now),
+                    _to_sqlite_ts(now + timedelta(seconds=ttl_seconds)),
+                ),
+            )
 
-    def get_timeline_for_alert(self, alert_id: int) -> ScoreTimeline | None:
-        initial = self.get_alert_score(alert_id)
-        if initial is None:
-            return None
+    def prune_llm_cache(self) -> int:
+        with self.connect() as conn:
+            cursor = conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (_to_sqlite_ts(_utc_now()),))
+            return int(cursor.rowcount)
 
-        timeline = ScoreTimeline(initial_score=initial)
+    def list_pairs_raw_before(self, cutoff: datetime, after_id: int, limit: int) -> list[sqlite3.Row]:
+        """Next `limit` replay records fetched before `cutoff`, keyset-paginated by pairs_raw id."""
+        with self.reader() as conn:
+            return conn.execute(
+                f"""
+                {_REPLAY_SELECT_SQL}
+                WHERE p.fetched_at < ? AND p.id > ?
+                ORDER BY p.id ASC
+                LIMIT ?
+                """,
+                (_to_sqlite_ts(cutoff), after_id, limit),
+            ).fetchall()
+
+    def delete_pairs_raw(self, ids: Sequence[int]) -> int:
+        # signals.pair_raw_id keeps the archived id so archives can still be joined back.
+        if not ids:
+            return 0
         with self.connect() as conn:
-            rows = conn.execute(
+            cursor = conn.executemany("DELETE FROM pairs_raw WHERE id = ?", [(pair_raw_id,) for pair_raw_id in ids])
+            return int(cursor.rowcount)
+
+    def enable_incremental_vacuum(self) -> bool:
+        """Switch an existing DB to auto_vacuum=INCREMENTAL; returns True if a full VACUUM was needed."""
+        with self.connect() as conn:
+            if int(conn.execute("PRAGMA auto_vacuum").fetchone()[0]) == 2:
+                return False
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.commit()
+            conn.execute("VACUUM")
+            return True
+
+    def incremental_vacuum(self, max_pages: int) -> int:
+        """Release up to `max_pages` free pages (0 = all) back to the filesystem; returns pages freed."""
+        with self.connect() as conn:
+            before = int(conn.execute("PRAGMA freelist_count").fetchone()[0])
+            # sqlite3's execute() steps the pragma once (one page); executescript() runs it to completion.
+            conn.executescript(f"PRAGMA incremental_vacuum({max(int(max_pages), 0)})")
+            after = int(conn.execute("PRAGMA freelist_count").fetchone()[0])
+            return before - after
+
+    def list_pair_snapshots(
+        self,
+        pair_addresses: Sequence[str],
+        start: float | None = None,
+        end: float | None = None,
+    ) -> list[tuple]:
+        """(pair_address, fetched_at, liquidity, price, volume, buys, sells, h1, h24) ordered by pair, time."""
+        if not pair_addresses:
+            return []
+        placeholders = ",".join("?" for _ in pair_addresses)
+        with self.reader() as conn:
+            cursor = conn.execute(
+                f"""
+                SELECT
+                    pair_address, fetched_at, liquidity_usd, price_usd, volume_h24,
+                    txns_h1_buys, txns_h1_sells, price_change_h1, price_change_h24
+                FROM pair_snapshots
+                WHERE pair_address IN ({placeholders}) AND fetched_at >= ? AND fetched_at < ?
+                ORDER BY pair_address ASC, fetched_at ASC
+                """,
+                (
+                    *pair_addresses,
+                    start if start is not None else float("-inf"),
+                    end if end is not None else float("inf"),
+                ),
+            )
+            # Plain tuples: the columnar loader does not need sqlite3.Row's name lookups.
+            cursor.row_factory = None
+            return cursor.fetchall()
+
+    def iter_pair_snapshots_since(self, since: float, chunk_size: int = 5_000) -> Iterator[tuple]:
+        """(pair_address, fetched_at, liquidity, price, buys, sells) in primary-key order, i.e. each
+        pair's rows contiguous and oldest first; no sort needed."""
+        with self.reader() as conn:
+            cursor = conn.execute(
                 """
-                SELECT scheduled_minutes, current_score
-                FROM recheck_results
-                WHERE source_alert_id = ?
+                SELECT pair_address, fetched_at, liquidity_usd, price_usd, txns_h1_buys, txns_h1_sells
+                FROM pair_snapshots
+                WHERE fetched_at >= ?
+                ORDER BY pair_address ASC, fetched_at ASC
                 """,
-                (alert_id,),
-            ).fetchall()
-            for row in rows:
-                minute = int(row["scheduled_minutes"])
-                score = float(row["current_score"])
-                if minute == 5:
-                    timeline.score_5m = score
-                elif minute == 15:
-                    timeline.score_15m = score
-        return timeline
+                (since,),
+            )
+            cursor.row_factory = None
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
@@ -0,0 +1,555 @@
+"""Grid search over Settings on top of the historical replay, across all CPU cores.
+
+History is loaded once into columnar NumPy arrays placed in shared memory; pool
+workers attach to them read-only, so each task only ships its overrides dict.
+Each variant is evaluated with the same semantics as `dog_scout.backtest`
+(filters, batch rule score + recorded LLM score, TopN with replay-clock cooldown,
+simulated rechecks), but scoring/filtering is vectorized per variant.
+
+    python -m dog_scout.sweep --grid min_liquidity_usd=10000,20000,40000 \\
+        --grid rule_weight=0.6,0.7,0.8 --grid top_n=3,5
+
+Requires the optional `numpy` dependency (see `requirements-analytics.txt`).
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import itertools
+import json
+import logging
+import math
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+
+import numpy as np
+from dotenv import load_dotenv
+
+from dog_scout.backtest import (
+    NO_DATA,
+    PENDING,
+    ReplayRow,
+    check_replayable,
+    iter_archive_replay_rows,
+    iter_db_replay_rows,
+    parse_ts,
+)
+from dog_scout.config import Settings, apply_setting_overrides
+from dog_scout.dedup import RecentAlertIndex
+from dog_scout.logging_config import setup_logging
+from dog_scout.recheck import classify_recheck_status
+from dog_scout.scoring import normalized_weights
+from dog_scout.scoring_batch import round2, score_pairs_batch
+from dog_scout.storage import Database
+
+logger = logging.getLogger(__name__)
+
+_ARRAY_FIELDS = (
+    "fetched_at",
+    "cycle",
+    "is_recheck",
+    "token",
+    "pair",
+    "liquidity_usd",
+    "txns_h1_buys",
+    "txns_h1_sells",
+    "price_change_h1",
+    "price_change_h24",
+    "holders",
+    "top10_concentration",
+    "honeypot",
+    "llm_score",
+    "cycle_offsets",
+    "cycle_clock",
+    "pair_order",
+    "pair_offsets",
+    "pair_times",
+)
+
+
+@dataclass(slots=True)
+class SweepDataset:
+    """Columnar replay history; row order is fetched_at order, `cycle` matches the backtest."""
+
+    arrays: dict[str, np.ndarray]
+    token_addresses: list[str]
+    live_alerts: dict[int, list[tuple[float, int]]] = field(default_factory=dict)
+    feedback: dict[int, list[tuple[float, float | None]]] = field(default_factory=dict)
+
+    @property
+    def rows(self) -> int:
+        return int(self.arrays["fetched_at"].shape[0])
+
+    @property
+    def cycles(self) -> int:
+        return int(self.arrays["cycle_clock"].shape[0])
+
+
+@dataclass(slots=True)
+class SweepResult:
+    overrides: dict[str, Any]
+    alerts: int = 0
+    unique_tokens: int = 0
+    candidates_passed: int = 0
+    recheck_status: dict[str, int] = field(default_factory=dict)
+    matched_live_alerts: int = 0
+    replay_only_alerts: int = 0
+    feedback_matched: int = 0
+    feedback_wins: int = 0
+    feedback_avg_pnl_pct: float | None = None
+
+    @property
+    def feedback_win_rate(self) -> float | None:
+        if not self.feedback_matched:
+            return None
+        return round(self.feedback_wins / self.feedback_matched, 4)
+
+    def to_dict(self) -> dict[str, Any]:
+        payload = asdict(self)
+        payload["feedback_win_rate"] = self.feedback_win_rate
+        return payload
+
+
+def build_dataset(
+    rows: Iterable[ReplayRow],
+    cycle_window_seconds: float = 60.0,
+    live_alerts: Iterable[Mapping[str, Any]] = (),
+    feedback: Iterable[Mapping[str, Any]] = (),
+) -> SweepDataset:
+    columns: dict[str, list[Any]] = {name: [] for name in _ARRAY_FIELDS[:14]}
+    token_codes: dict[str, int] = {}
+    pair_codes: dict[str, int] = {}
+    cycle_offsets: list[int] = []
+    cycle_clock: list[float] = []
+    cycle_start: float | None = None
+
+    for index, row in enumerate(rows):
+        fetched_at = row.fetched_at.timestamp()
+        if cycle_start is None or fetched_at - cycle_start > cycle_window_seconds:
+            cycle_start = fetched_at
+            cycle_offsets.append(index)
+            cycle_clock.append(fetched_at)
+        cycle_clock[-1] = fetched_at
+
+        pair = row.pair
+        columns["fetched_at"].append(fetched_at)
+        columns["cycle"].append(len(cycle_offsets) - 1)
+        columns["is_recheck"].append(row.is_recheck)
+        columns["token"].append(token_codes.setdefault(pair.base_token_address, len(token_codes)))
+        columns["pair"].append(pair_codes.setdefault(pair.pair_address, len(pair_codes)))
+        columns["liquidity_usd"].append(pair.liquidity_usd)
+        columns["txns_h1_buys"].append(pair.txns_h1_buys)
+        columns["txns_h1_sells"].append(pair.txns_h1_sells)
+        columns["price_change_h1"].append(np.nan if pair.price_change_h1 is None else pair.price_change_h1)
+        columns["price_change_h24"].append(np.nan if pair.price_change_h24 is None else pair.price_change_h24)
+        columns["holders"].append(np.nan if row.risk.holders is None else row.risk.holders)
+        columns["top10_concentration"].append(
+            np.nan if row.risk.top10_concentration is None else row.risk.top10_concentration
+        )
+        columns["honeypot"].append(row.risk.is_honeypot or "honeypot" in row.risk.risk_flags)
+        columns["llm_score"].append(np.nan if row.llm_output is None else row.llm_output.narrative_score)
+
+    dtypes = {
+        "fetched_at": np.float64,
+        "cycle": np.int64,
+        "is_recheck": np.bool_,
+        "token": np.int64,
+        "pair": np.int64,
+        "txns_h1_buys": np.int64,
+        "txns_h1_sells": np.int64,
+        "honeypot": np.bool_,
+    }
+    arrays = {name: np.asarray(values, dtype=dtypes.get(name, np.float64)) for name, values in columns.items()}
+    row_count = arrays["fetched_at"].shape[0]
+    arrays["cycle_offsets"] = np.asarray([*cycle_offsets, row_count], dtype=np.int64)
+    arrays["cycle_clock"] = np.asarray(cycle_clock, dtype=np.float64)
+
+    # CSR index of each pair's sightings in time order, for simulated recheck observations.
+    pair_order = np.argsort(arrays["pair"], kind="stable")
+    arrays["pair_order"] = pair_order.astype(np.int64)
+    arrays["pair_offsets"] = np.searchsorted(
+        arrays["pair"][pair_order], np.arange(len(pair_codes) + 1), side="left"
+    ).astype(np.int64)
+    arrays["pair_times"] = arrays["fetched_at"][pair_order]
+
+    live: dict[int, list[tuple[float, int]]] = {}
+    for item in live_alerts:
+        code = pair_codes.get(str(item["pair_address"]))
+        if code is not None:
+            live.setdefault(code, []).append((parse_ts(str(item["created_at"])).timestamp(), int(item["id"])))
+    feedback_by_pair: dict[int, list[tuple[float, float | None]]] = {}
+    for item in feedback:
+        code = pair_codes.get(str(item["pair_address"]))
+        if code is not None:
+            pnl = item["pnl_pct"]
+            feedback_by_pair.setdefault(code, []).append(
+                (parse_ts(str(item["alert_created_at"])).timestamp(), None if pnl is None else float(pnl))
+            )
+
+    ordered_tokens = [""] * len(token_codes)
+    for address, code in token_codes.items():
+        ordered_tokens[code] = address
+    return SweepDataset(
+        arrays=arrays,
+        token_addresses=ordered_tokens,
+        live_alerts=live,
+        feedback=feedback_by_pair,
+    )
+
+
+def load_dataset(
+    db: Database,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    cycle_window_seconds: float = 60.0,
+    archive_dir: str | Path | None = None,
+) -> SweepDataset:
+    rows: Iterable[ReplayRow] = iter_db_replay_rows(db, start=start, end=end)
+    if archive_dir:
+        rows = itertools.chain(iter_archive_replay_rows(archive_dir, start=start, end=end), rows)
+    return build_dataset(
+        rows,
+        cycle_window_seconds=cycle_window_seconds,
+        live_alerts=db.list_initial_alerts(start=start, end=end),
+        feedback=db.list_trade_feedback(),
+    )
+
+
+def evaluate_variant(
+    dataset: SweepDataset,
+    base_settings: Settings,
+    overrides: Mapping[str, Any],
+) -> SweepResult:
+    settings = apply_setting_overrides(base_settings, overrides)
+    a = dataset.arrays
+    result = SweepResult(overrides=dict(overrides))
+    if dataset.rows == 0:
+        return result
+
+    rule = score_pairs_batch(
+        liquidity_usd=a["liquidity_usd"],
+        txns_h1_buys=a["txns_h1_buys"],
+        txns_h1_sells=a["txns_h1_sells"],
+        price_change_h1=a["price_change_h1"],
+        price_change_h24=a["price_change_h24"],
+        settings=settings,
+    ).final_score
+    rule_weight, llm_weight = normalized_weights(settings.rule_weight, settings.llm_weight)
+    has_llm = ~np.isnan(a["llm_score"])
+    merged = round2(np.clip((rule * rule_weight) + (a["llm_score"] * llm_weight), 0.0, 100.0))
+    final = np.where(has_llm, merged, rule)
+
+    denylisted = np.zeros(len(dataset.token_addresses), dtype=np.bool_)
+    if settings.denylist_tokens:
+        for code, address in enumerate(dataset.token_addresses):
+            denylisted[code] = address.lower() in settings.denylist_tokens
+    with np.errstate(invalid="ignore"):
+        failed = (
+            (a["liquidity_usd"] < settings.min_liquidity_usd)
+            | (a["holders"] < settings.min_holders)
+            | (a["top10_concentration"] > settings.max_top10_concentration)
+            | a["honeypot"]
+            | denylisted[a["token"]]
+        )
+    passed = ~failed
+    selectable = passed & ~a["is_recheck"]
+
+    minutes = tuple(sorted(int(minute) for minute in settings.recheck_minutes))
+    cooldown = settings.dedup_cooldown_minutes
+    cooldown_seconds = cooldown * 60.0
+    index = RecentAlertIndex(ttl_minutes=cooldown)
+    due: list[tuple[float, float, int, int]] = []
+    sequence = itertools.count()
+    states: dict[int, list[Any]] = {}
+    status_counts: Counter[str] = Counter()
+    tokens: set[int] = set()
+    matched_live: set[int] = set()
+    pnl_total = 0.0
+    pnl_count = 0
+
+    # The selection loop is per alert/candidate; plain lists avoid NumPy scalar overhead there.
+    token_of = a["token"].tolist()
+    pair_of = a["pair"].tolist()
+    fetched_of = a["fetched_at"].tolist()
+    final_of = final.tolist()
+    passed_of = passed.tolist()
+    pair_order = a["pair_order"].tolist()
+    pair_offsets = a["pair_offsets"].tolist()
+    pair_times = a["pair_times"].tolist()
+    cycle_clock = a["cycle_clock"].tolist()
+    cycle_offsets = a["cycle_offsets"]
+
+    def to_dt(epoch: float) -> datetime:
+        return datetime.fromtimestamp(epoch, tz=timezone.utc)
+
+    def latest_sighting(pair_code: int, until: float) -> int | None:
+        lo = pair_offsets[pair_code]
+        position = bisect_right(pair_times, until, lo, pair_offsets[pair_code + 1]) - 1
+        return pair_order[position] if position >= lo else None
+
+    def resolve_due(until: float) -> None:
+        while due and due[0][0] <= until:
+            clock, due_at, _, alert_key = heapq.heappop(due)
+            state = states[alert_key]
+            alerted_at, token, pair, initial_score, previous_score, remaining = state
+            row = latest_sighting(pair, clock)
+            if row is None or fetched_of[row] <= alerted_at:
+                status_counts[NO_DATA] += 1
+            else:
+                current = final_of[row]
+                status_counts[
+                    classify_recheck_status(
+                        passed_filters=passed_of[row],
+                        initial_score=initial_score,
+                        previous_score=previous_score,
+                        current_score=current,
+                    )
+                ] += 1
+                state[4] = current
+                index.record(token, pair, to_dt(due_at))
+            state[5] = remaining - 1
+            if state[5] <= 0:
+                del states[alert_key]
+
+    result.candidates_passed = int(np.count_nonzero(selectable))
+    # Only cycles with a selectable row can alert; rechecks due in between are
+    # resolved against the clock of the first cycle at or after their due time.
+    per_cycle = np.add.reduceat(selectable.astype(np.int64), cycle_offsets[:-1])
+    for cycle in np.flatnonzero(per_cycle).tolist():
+        lo, hi = int(cycle_offsets[cycle]), int(cycle_offsets[cycle + 1])
+        clock = cycle_clock[cycle]
+        resolve_due(clock)
+
+        candidates = lo + np.flatnonzero(selectable[lo:hi])
+        ranked = candidates[np.argsort(-final[candidates], kind="stable")].tolist()
+
+        now = to_dt(clock)
+        selected: list[int] = []
+        for row in ranked:
+            if len(selected) >= settings.top_n:
+                break
+            if index.has_recent_alert(token_of[row], pair_of[row], cooldown, now=now):
+                continue
+            selected.append(row)
+
+        for row in selected:
+            token, pair = token_of[row], pair_of[row]
+            index.record(token, pair, now)
+            tokens.add(token)
+            result.alerts += 1
+
+            for created_at, live_id in dataset.live_alerts.get(pair, ()):
+                if abs(created_at - clock) <= cooldown_seconds and live_id not in matched_live:
+                    matched_live.add(live_id)
+                    break
+            else:
+                result.replay_only_alerts += 1
+
+            closest: tuple[float, float | None] | None = None
+            for created_at, pnl_pct in dataset.feedback.get(pair, ()):
+                distance = abs(created_at - clock)
+                if distance <= cooldown_seconds and (closest is None or distance < closest[0]):
+                    closest = (distance, pnl_pct)
+            if closest is not None:
+                result.feedback_matched += 1
+                if closest[1] is not None:
+                    pnl_total += closest[1]
+                    pnl_count += 1
+                    if closest[1] > 0:
+                        result.feedback_wins += 1
+
+            if minutes:
+                alert_key = result.alerts
+                states[alert_key] = [clock, token, pair, final_of[row], None, len(minutes)]
+                for minute in minutes:
+                    due_at = clock + minute * 60.0
+                    resolving = bisect_left(cycle_clock, due_at)
+                    resolve_at = cycle_clock[resolving] if resolving < len(cycle_clock) else math.inf
+                    heapq.heappush(due, (resolve_at, due_at, next(sequence), alert_key))
+
+    resolve_due(cycle_clock[-1])
+    status_counts[PENDING] += len(due)
+    result.unique_tokens = len(tokens)
+    result.recheck_status = dict(sorted(status_counts.items()))
+    result.matched_live_alerts = len(matched_live)
+    if pnl_count:
+        result.feedback_avg_pnl_pct = round(pnl_total / pnl_count, 4)
+    return result
+
+
+class SharedDataset:
+    """Publishes a SweepDataset's arrays to named shared memory blocks (owner side)."""
+
+    def __init__(self, dataset: SweepDataset) -> None:
+        self.blocks: list[shared_memory.SharedMemory] = []
+        self.spec: dict[str, tuple[str, str, tuple[int, ...]]] = {}
+        for name, array in dataset.arrays.items():
+            block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+            view[...] = array
+            self.blocks.append(block)
+            self.spec[name] = (block.name, array.dtype.str, array.shape)
+
+    def close(self) -> None:
+        for block in self.blocks:
+            block.close()
+            block.unlink()
+        self.blocks = []
+
+
+_WORKER: dict[str, Any] = {}
+
+
+def _init_worker(
+    spec: Mapping[str, tuple[str, str, tuple[int, ...]]],
+    token_addresses: list[str],
+    live_alerts: dict[int, list[tuple[float, int]]],
+    feedback: dict[int, list[tuple[float, float | None]]],
+    base_settings: Settings,
+) -> None:
+    blocks = []
+    arrays: dict[str, np.ndarray] = {}
+    for name, (block_name, dtype, shape) in spec.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        view.flags.writeable = False
+        arrays[name] = view
+        blocks.append(block)
+    _WORKER.update(
+        blocks=blocks,
+        dataset=SweepDataset(
+            arrays=arrays,
+            token_addresses=token_addresses,
+            live_alerts=live_alerts,
+            feedback=feedback,
+        ),
+        settings=base_settings,
+    )
+
+
+def _evaluate_in_worker(overrides: dict[str, Any]) -> SweepResult:
+    return evaluate_variant(
+        _WORKER["dataset"],
+        _WORKER["settings"],
+        overrides,
+    )
+
+
+def expand_grid(grid: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def run_sweep(
+    dataset: SweepDataset,
+    base_settings: Settings,
+    variants: Sequence[Mapping[str, Any]],
+    max_workers: int | None = None,
+) -> list[SweepResult]:
+    """Evaluate variants (in input order); `max_workers=1` stays in-process."""
+    for variant in variants:
+        check_replayable(apply_setting_overrides(base_settings, variant))  # fail fast before forking
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers <= 1 or len(variants) <= 1:
+        return [evaluate_variant(dataset, base_settings, variant) for variant in variants]
+
+    shared = SharedDataset(dataset)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(variants)),
+            initializer=_init_worker,
+            initargs=(
+                shared.spec,
+                dataset.token_addresses,
+                dataset.live_alerts,
+                dataset.feedback,
+                base_settings,
+            ),
+        ) as executor:
+            return list(executor.map(_evaluate_in_worker, [dict(variant) for variant in variants]))
+    finally:
+        shared.close()
+
+
+def parse_grid(items: Sequence[str]) -> dict[str, list[str]]:
+    grid: dict[str, list[str]] = {}
+    for item in items:
+        name, sep, values = item.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"Grid axis must look like name=v1,v2,...: {item!r}")
+        grid[name.strip()] = [value.strip() for value in values.split(",") if value.strip()]
+    return grid
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Grid-search Settings against replayed history")
+    parser.add_argument("--db-path", default=None, help="Override sqlite db path")
+    parser.add_argument("--start", default=None, help="ISO timestamp (UTC) lower bound on fetched_at")
+    parser.add_argument("--end", default=None, help="ISO timestamp (UTC) upper bound on fetched_at")
+    parser.add_argument(
+        "--grid",
+        action="append",
+        default=[],
+        metavar="NAME=V1,V2,...",
+        help="Settings axis, e.g. --grid min_liquidity_usd=10000,20000 (repeatable)",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="process count (default: all cores)")
+    parser.add_argument("--cycle-window-seconds", type=float, default=60.0)
+    parser.add_argument(
+        "--sort-by",
+        default="feedback_avg_pnl_pct",
+        help="result field to rank by (descending, missing values last)",
+    )
+    parser.add_argument("--top", type=int, default=20, help="print only the best N variants")
+    parser.add_argument("--archive-dir", default=None, help="Also load pairs_raw archives from dog_scout.retention")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    load_dotenv()
+    setup_logging()
+    args = parse_args(argv)
+
+    settings = Settings.from_env()
+    if args.db_path:
+        settings = apply_setting_overrides(settings, {"db_path": args.db_path})
+    start = parse_ts(args.start) if args.start else None
+    end = parse_ts(args.end) if args.end else None
+    variants = expand_grid(parse_grid(args.grid)) or [{}]
+
+    db = Database.from_settings(settings)
+    try:
+        dataset = load_dataset(
+            db,
+            start=start,
+            end=end,
+            cycle_window_seconds=args.cycle_window_seconds,
+            archive_dir=args.archive_dir,
+        )
+    finally:
+        db.close()
+    logger.info(
+        "sweep dataset loaded | rows=%s cycles=%s variants=%s",
+        dataset.rows,
+        dataset.cycles,
+        len(variants),
+    )
+
+    swept = run_sweep(dataset, settings, variants, max_workers=args.workers)
+    results = [item.to_dict() for item in swept]
+    results.sort(key=lambda item: (item.get(args.sort_by) is None, -(item.get(args.sort_by) or 0)))
+    json.dump(results[: max(args.top, 1)], sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
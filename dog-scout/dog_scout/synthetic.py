@@ -0,0 +1,415 @@
+"""Seeded synthetic market data and a local stand-in for Dexscreener, Telegram and DeepSeek.
+
+`SyntheticMarket` keeps a population of tokens whose pairs drift between cycles with heavy-tailed
+distributions (lognormal liquidity/volume, Poisson trade counts, fat-tailed price moves).
+`FakeUpstream` serves it over HTTP with per-service latency and error rates so the real clients,
+pipeline and storage can be exercised end to end (see `dog_scout.bench`).
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Sequence
+from urllib.parse import urlsplit
+
+from dog_scout.clients.dexscreener import DexscreenerClient
+from dog_scout.models import PairSnapshot
+
+logger = logging.getLogger(__name__)
+
+# Dex and quote-token mix per chain; anything else falls back to "default".
+CHAIN_MARKETS = {
+    "base": (("uniswap", "aerodrome", "baseswap"), ("WETH", "USDC")),
+    "ethereum": (("uniswap", "sushiswap"), ("WETH", "USDT")),
+    "bsc": (("pancakeswap",), ("WBNB", "USDT")),
+    "solana": (("raydium", "orca", "meteora", "pumpswap"), ("SOL", "USDC")),
+    "default": (("uniswap",), ("WETH",)),
+}
+_BASE58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_BATCH_SIZE_RE = re.compile(r"Evaluate these (\d+) meme token candidates")
+
+
+@dataclass(slots=True)
+class _SyntheticPair:
+    pair_address: str
+    dex_id: str
+    quote_symbol: str
+    created_at: datetime
+    price_usd: float
+    liquidity_usd: float
+    volume_h24: float
+    # Expected h1 trades; buys/sells are Poisson draws around it every cycle.
+    trade_rate_h1: float
+    buy_share: float
+    price_change_h1: float | None = None
+    price_change_h24: float | None = None
+    txns_h1_buys: int = 0
+    txns_h1_sells: int = 0
+
+
+@dataclass(slots=True)
+class _SyntheticToken:
+    chain_id: str
+    address: str
+    symbol: str
+    pairs: list[_SyntheticPair] = field(default_factory=list)
+
+
+class SyntheticMarket:
+    """Deterministic token population for one or more chains.
+
+    Every `advance()` lists `turnover` of `tokens_per_chain` fresh tokens per chain (newest
+    first, like Dexscreener's latest profiles) and moves every existing pair one step.
+    Tokens older than `tokens_per_chain * history_factor` listings are dropped.
+    """
+
+    def __init__(
+        self,
+        seed: int = 42,
+        chain_ids: Sequence[str] = ("base",),
+        tokens_per_chain: int = 30,
+        turnover: float = 0.3,
+        history_factor: int = 4,
+        now: datetime | None = None,
+    ) -> None:
+        self.rng = random.Random(seed)
+        self.chain_ids = [chain_id.lower() for chain_id in chain_ids]
+        self.tokens_per_chain = max(tokens_per_chain, 1)
+        self.turnover = min(max(turnover, 0.0), 1.0)
+        self.history = self.tokens_per_chain * max(history_factor, 1)
+        self.now = now or datetime.now(timezone.utc)
+        self.cycle = 0
+        self._serial = 0
+        self._lock = threading.Lock()
+        self._tokens: dict[str, list[_SyntheticToken]] = {chain_id: [] for chain_id in self.chain_ids}
+        self._by_address: dict[tuple[str, str], _SyntheticToken] = {}
+        for chain_id in self.chain_ids:
+            for _ in range(self.tokens_per_chain):
+                self._list_token(chain_id)
+
+    def advance(self, seconds: float = 120.0) -> None:
+        """One scan interval: pairs drift, then new tokens are listed."""
+        with self._lock:
+            self.cycle += 1
+            self.now += timedelta(seconds=seconds)
+            for tokens in self._tokens.values():
+                for token in tokens:
+                    for pair in token.pairs:
+                        self._step(pair, seconds)
+            fresh = round(self.tokens_per_chain * self.turnover)
+            for chain_id in self.chain_ids:
+                for _ in range(fresh):
+                    self._list_token(chain_id)
+
+    def latest_profiles(self) -> list[dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "chainId": token.chain_id,
+                    "tokenAddress": token.address,
+                    "url": f"https://dexscreener.com/{token.chain_id}/{token.address}",
+                    "description": f"{token.symbol} to the moon",
+                }
+                for chain_id in self.chain_ids
+                for token in self._tokens[chain_id][: self.tokens_per_chain]
+            ]
+
+    def pair_payloads(self, chain_id: str, token_address: str) -> list[dict[str, Any]]:
+        """Dexscreener `token-pairs` JSON for one token; empty for unknown tokens."""
+        with self._lock:
+            token = self._by_address.get((chain_id.lower(), token_address.lower()))
+            if token is None:
+                return []
+            return [_pair_payload(token, pair) for pair in token.pairs]
+
+    def snapshots(self) -> list[PairSnapshot]:
+        """Every listed pair as parsed by `DexscreenerClient`, newest token first."""
+        with self._lock:
+            payloads = [
+                _pair_payload(token, pair)
+                for tokens in self._tokens.values()
+                for token in tokens
+                for pair in token.pairs
+            ]
+        return [pair for pair in map(DexscreenerClient._parse_pair, payloads) if pair is not None]
+
+    def _list_token(self, chain_id: str) -> None:
+        rng = self.rng
+        self._serial += 1
+        dexes, quotes = CHAIN_MARKETS.get(chain_id, CHAIN_MARKETS["default"])
+        token = _SyntheticToken(
+            chain_id=chain_id,
+            address=_address(rng, chain_id),
+            symbol=f"DOG{self._serial}",
+        )
+        for index in range(1 + (rng.random() < 0.3) + (rng.random() < 0.1)):
+            liquidity = rng.lognormvariate(10.3, 1.3)  # median ~30k USD
+            token.pairs.append(
+                _SyntheticPair(
+                    pair_address=_address(rng, chain_id),
+                    dex_id=rng.choice(dexes),
+                    quote_symbol=quotes[0] if index == 0 else rng.choice(quotes),
+                    created_at=self.now - timedelta(seconds=rng.expovariate(1 / 1800)),
+                    price_usd=rng.lognormvariate(-9.0, 2.5),
+                    liquidity_usd=liquidity,
+                    volume_h24=liquidity * rng.lognormvariate(0.5, 1.0),
+                    trade_rate_h1=rng.lognormvariate(3.2, 1.0),  # median ~25 trades/h
+                    buy_share=rng.betavariate(6, 5),
+                )
+            )
+            self._step(token.pairs[-1], 0.0)
+
+        tokens = self._tokens[chain_id]
+        tokens.insert(0, token)
+        self._by_address[(chain_id, token.address.lower())] = token
+        for expired in tokens[self.history :]:
+            self._by_address.pop((chain_id, expired.address.lower()), None)
+        del tokens[self.history :]
+
+    def _step(self, pair: _SyntheticPair, seconds: float) -> None:
+        rng = self.rng
+        hours = seconds / 3600.0
+        # Fat-tailed log-return: mostly small moves, occasionally a pump or a rug-sized drop.
+        jump = rng.gauss(0.0, 0.6) if rng.random() < 0.05 else 0.0
+        log_return = rng.gauss(0.0, 0.08) + jump
+        pair.price_usd *= math.exp(log_return)
+        pair.liquidity_usd = max(pair.liquidity_usd * math.exp(0.5 * log_return + rng.gauss(0.0, 0.05)), 50.0)
+        pair.trade_rate_h1 = max(pair.trade_rate_h1 * math.exp(rng.gauss(0.0, 0.2) + abs(jump)), 0.5)
+        pair.txns_h1_buys = _poisson(rng, pair.trade_rate_h1 * pair.buy_share)
+        pair.txns_h1_sells = _poisson(rng, pair.trade_rate_h1 * (1.0 - pair.buy_share))
+        trades = pair.txns_h1_buys + pair.txns_h1_sells
+        pair.volume_h24 += pair.liquidity_usd * 0.01 * trades * hours
+        pair.price_change_h1 = None if rng.random() < 0.03 else round(math.expm1(log_return * 4) * 100, 2)
+        pair.price_change_h24 = None if rng.random() < 0.03 else round(rng.gauss(10.0, 60.0), 2)
+
+
+def synthetic_pairs(
+    count: int,
+    seed: int = 42,
+    chain_id: str = "base",
+    now: datetime | None = None,
+) -> list[PairSnapshot]:
+    """`count` seeded pair snapshots (newest pair of `count` freshly listed tokens)."""
+    market = SyntheticMarket(seed=seed, chain_ids=[chain_id], tokens_per_chain=count, now=now)
+    seen: set[str] = set()
+    pairs: list[PairSnapshot] = []
+    for pair in market.snapshots():
+        if pair.base_token_address not in seen:
+            seen.add(pair.base_token_address)
+            pairs.append(pair)
+    return pairs
+
+
+@dataclass(slots=True)
+class FakeService:
+    """Latency and failure knobs for one fake upstream; failures answer `error_status`."""
+
+    latency_seconds: float = 0.0
+    jitter_seconds: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+
+
+class _FakeServer(ThreadingHTTPServer):
+    # The default listen backlog of 5 drops SYNs under fetch fan-out, costing ~1s retransmits.
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class FakeUpstream:
+    """One local HTTP server impersonating Dexscreener, the Telegram Bot API and DeepSeek.
+
+    Point `DexscreenerClient(base_url=...)`, `TelegramNotifier(base_url=...)` and
+    `llm_base_url` at `base_url`. Request and injected-error counts are kept per service.
+    """
+
+    def __init__(
+        self,
+        market: SyntheticMarket,
+        dexscreener: FakeService | None = None,
+        telegram: FakeService | None = None,
+        deepseek: FakeService | None = None,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.market = market
+        self.services = {
+            "dexscreener": dexscreener or FakeService(),
+            "telegram": telegram or FakeService(),
+            "deepseek": deepseek or FakeService(),
+        }
+        self.requests: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = _FakeServer((host, port), _build_handler(self))
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeUpstream":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-upstream", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeUpstream":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {"requests": dict(self.requests), "errors": dict(self.errors)}
+
+    def _admit(self, service: str) -> int | None:
+        """Count the request and sleep its latency; returns an error status to inject, if any."""
+        config = self.services[service]
+        with self._lock:
+            self.requests[service] += 1
+            delay = config.latency_seconds + self._rng.uniform(0.0, config.jitter_seconds)
+            failed = self._rng.random() < config.error_rate
+            if failed:
+                self.errors[service] += 1
+        if delay > 0:
+            time.sleep(delay)
+        return config.error_status if failed else None
+
+
+def _build_handler(upstream: FakeUpstream) -> type[BaseHTTPRequestHandler]:
+    class FakeUpstreamHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # noqa: A002, ANN001
+            return
+
+        def _write_json(self, payload: Any, status: int = 200) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            try:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                return  # the client already timed out
+
+        def _read_json(self) -> Any:
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                return json.loads(self.rfile.read(length) or b"{}")
+            except ValueError:
+                return {}
+
+        def do_GET(self) -> None:  # noqa: N802
+            path = urlsplit(self.path).path
+            if not (path == "/token-profiles/latest/v1" or path.startswith("/token-pairs/v1/")):
+                self.send_error(404)
+                return
+            error = upstream._admit("dexscreener")
+            if error is not None:
+                self._write_json({"error": "injected"}, status=error)
+                return
+            if path == "/token-profiles/latest/v1":
+                self._write_json(upstream.market.latest_profiles())
+                return
+            chain_id, token_address = path.rsplit("/", 2)[-2:]
+            self._write_json(upstream.market.pair_payloads(chain_id, token_address))
+
+        def do_POST(self) -> None:  # noqa: N802
+            path = urlsplit(self.path).path
+            if path.endswith("/sendMessage"):
+                service = "telegram"
+            elif path.endswith("/chat/completions"):
+                service = "deepseek"
+            else:
+                self.send_error(404)
+                return
+            payload = self._read_json()
+            error = upstream._admit(service)
+            if error is not None:
+                self._write_json({"ok": False, "error": "injected"}, status=error)
+                return
+            if service == "telegram":
+                self._write_json({"ok": True, "result": {"message_id": upstream.requests["telegram"]}})
+                return
+            self._write_json(_completion(payload))
+
+    return FakeUpstreamHandler
+
+
+def _completion(request_payload: Any) -> dict[str, Any]:
+    messages = request_payload.get("messages") if isinstance(request_payload, dict) else None
+    prompt = str(messages[-1].get("content", "")) if messages else ""
+    # Scores derive from the prompt so identical candidates get identical answers.
+    rng = random.Random(zlib.crc32(prompt.encode("utf-8")))
+    batch = _BATCH_SIZE_RE.search(prompt)
+    if batch:
+        content: dict[str, Any] = {
+            "results": [{"index": index, **_analysis(rng)} for index in range(int(batch.group(1)))]
+        }
+    else:
+        content = _analysis(rng)
+    return {"choices": [{"message": {"role": "assistant", "content": json.dumps(content)}}]}
+
+
+def _analysis(rng: random.Random) -> dict[str, Any]:
+    return {
+        "narrative_score": round(rng.uniform(20.0, 90.0), 2),
+        "risk_comment": "synthetic",
+        "action_hint": "watch",
+        "confidence": round(rng.uniform(0.3, 0.9), 2),
+        "reasons": ["fake upstream"],
+    }
+
+
+def _pair_payload(token: _SyntheticToken, pair: _SyntheticPair) -> dict[str, Any]:
+    return {
+        "chainId": token.chain_id,
+        "dexId": pair.dex_id,
+        "pairAddress": pair.pair_address,
+        "baseToken": {"address": token.address, "symbol": token.symbol},
+        "quoteToken": {"symbol": pair.quote_symbol},
+        "priceUsd": f"{pair.price_usd:.12g}",
+        "liquidity": {"usd": round(pair.liquidity_usd, 2)},
+        "volume": {"h24": round(pair.volume_h24, 2)},
+        "txns": {"h1": {"buys": pair.txns_h1_buys, "sells": pair.txns_h1_sells}},
+        "priceChange": {"h1": pair.price_change_h1, "h24": pair.price_change_h24},
+        "pairCreatedAt": int(pair.created_at.timestamp() * 1000),
+    }
+
+
+def _address(rng: random.Random, chain_id: str) -> str:
+    if chain_id == "solana":
+        return "".join(rng.choice(_BASE58) for _ in range(44))
+    return f"0x{rng.getrandbits(160):040x}"
+
+
+def _poisson(rng: random.Random, lam: float) -> int:
+    if lam <= 0:
+        return 0
+    if lam > 30:
+        return max(int(round(rng.gauss(lam, math.sqrt(lam)))), 0)
+    # Knuth's method; fine for the small rates that dominate meme pairs.
+    limit = math.exp(-lam)
+    count, product = 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Iterable
+
+from dog_scout.config import Settings
+from dog_scout.models import RecheckContext, RecheckJob
+from dog_scout.pipeline import RecheckOutcome, ScoutPipeline
+
+logger = logging.getLogger(__name__)
+
+
+class RecheckWorker:
+    """Drains `recheck_jobs` independently of the scan loop.
+
+    A single dispatcher claims due jobs (so claims never race each other) and hands
+    them to a pool of `concurrency` threads; each job reports its lateness
+    (`processed_at - due_at`). Every poll also requeues jobs whose lease expired.
+    """
+
+    def __init__(
+        self,
+        pipeline: ScoutPipeline,
+        concurrency: int = 4,
+        poll_seconds: float = 5.0,
+    ) -> None:
+        self.pipeline = pipeline
+        self.concurrency = max(concurrency, 1)
+        self.poll_seconds = max(poll_seconds, 0.1)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> list[RecheckOutcome]:
+        """Process every job due right now, `concurrency` alerts at a time; returns one outcome per job."""
+        self.pipeline.reap_recheck_leases()
+        outcomes: list[RecheckOutcome] = []
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="recheck") as executor:
+            while True:
+                jobs = self._claim(self.concurrency)
+                if not jobs:
+                    break
+                outcomes.extend(_collect(_submit(executor, self.pipeline, jobs)))
+        if outcomes:
+            _log_batch(outcomes)
+        return outcomes
+
+    def run_forever(self) -> None:
+        logger.info(
+            "recheck worker started | concurrency=%s poll=%ss",
+            self.concurrency,
+            self.poll_seconds,
+        )
+        in_flight: set[Future[list[RecheckOutcome]]] = set()
+        next_reap = 0.0
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="recheck") as executor:
+            while not self._stop.is_set():
+                if time.monotonic() >= next_reap:
+                    self.pipeline.reap_recheck_leases()
+                    next_reap = time.monotonic() + self.poll_seconds
+                free = self.concurrency - len(in_flight)
+                jobs = self._claim(free) if free > 0 else []
+                in_flight.update(_submit(executor, self.pipeline, jobs))
+
+                if not in_flight:
+                    self._stop.wait(self.poll_seconds)
+                    continue
+                # Wake on the first finished job to refill the slot; poll for newly due jobs otherwise.
+                done, in_flight = wait(in_flight, timeout=self.poll_seconds, return_when=FIRST_COMPLETED)
+                if done:
+                    _log_batch(_collect(done))
+            wait(in_flight)
+        logger.info("recheck worker stopped")
+
+    def start(self) -> threading.Thread:
+        """Run `run_forever` on a daemon thread (for `DOG_SCOUT_RECHECK_MODE=thread`)."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="recheck-worker", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _claim(self, limit: int) -> list[RecheckJob]:
+        return self.pipeline.db.claim_due_recheck_jobs(
+            limit=limit,
+            lease_seconds=self.pipeline.settings.recheck_lease_seconds,
+        )
+
+
+class RecheckScheduler:
+    """Fires `recheck_jobs` at their `due_at` instead of on the next poll or scan cycle.
+
+    Pending jobs sit in an in-process min-heap of `(due_at, job_id)`, rebuilt from the
+    table on start. The dispatcher sleeps until the earliest entry is due (or a slot frees up) and
+    claims exactly those ids. The claim still requires `status = 'pending'`, so several schedulers or
+    pollers can share one table safely. New jobs are picked up every `refresh_seconds` by id. Every
+    `resync_seconds` the heap is rebuilt to catch jobs whose `due_at` changed. `schedule()` lets
+    in-process producers skip the wait. Retries and jobs requeued by the lease reaper are scheduled
+    directly.
+    """
+
+    def __init__(
+        self,
+        pipeline: ScoutPipeline,
+        concurrency: int = 4,
+        refresh_seconds: float = 5.0,
+        resync_seconds: float = 300.0,
+    ) -> None:
+        self.pipeline = pipeline
+        self.concurrency = max(concurrency, 1)
+        self.refresh_seconds = max(refresh_seconds, 0.1)
+        self.resync_seconds = max(resync_seconds, self.refresh_seconds)
+        self._heap: list[tuple[float, int]] = []
+        # Current due time per queued job; heap entries that disagree are stale and skipped.
+        self._due: dict[int, float] = {}
+        self._last_id = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._due)
+
+    def schedule(self, job_id: int, due_at: datetime) -> None:
+        """Queue (or move) one pending job and wake the dispatcher if it is now the earliest."""
+        due = due_at.timestamp()
+        with self._lock:
+            if self._due.get(job_id) == due:
+                return
+            self._due[job_id] = due
+            heapq.heappush(self._heap, (due, job_id))
+            self._last_id = max(self._last_id, job_id)
+            earliest = self._heap[0][1] == job_id
+        if earliest:
+            self._wakeup.set()
+
+    def rehydrate(self) -> int:
+        """Rebuild the heap from every pending job; returns how many are queued."""
+        pending = self.pipeline.db.list_pending_recheck_jobs()
+        with self._lock:
+            self._due = {job_id: due_at.timestamp() for job_id, due_at in pending}
+            self._heap = [(due, job_id) for job_id, due in self._due.items()]
+            heapq.heapify(self._heap)
+            self._last_id = max(self._due, default=self._last_id)
+            return len(self._due)
+
+    def refresh(self) -> int:
+        """Queue jobs enqueued since the last look (by any process) or requeued after an expired
+        lease; returns how many."""
+        with self._lock:
+            after_id = self._last_id
+        pending = self.pipeline.db.list_pending_recheck_jobs(after_id=after_id)
+        pending += self.pipeline.reap_recheck_leases()
+        for job_id, due_at in pending:
+            self.schedule(job_id, due_at)
+        return len(pending)
+
+    def next_due(self) -> float | None:
+        """Epoch seconds of the earliest queued job, if any."""
+        with self._lock:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def run_once(self) -> list[RecheckOutcome]:
+        """Rebuild the heap and process every job due right now, `concurrency` at a time."""
+        self.pipeline.reap_recheck_leases()
+        self.rehydrate()
+        outcomes: list[RecheckOutcome] = []
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="recheck") as executor:
+            while True:
+                jobs = self._claim(self._pop_due(time.time(), self.concurrency))
+                if not jobs:
+                    due = self.next_due()
+                    if due is None or due > time.time():
+                        break
+                    continue  # popped ids were claimed elsewhere; more are due
+                outcomes.extend(_collect(_submit(executor, self.pipeline, jobs)))
+        for outcome in outcomes:
+            if outcome.retry_at is not None:
+                self.schedule(outcome.job_id, outcome.retry_at)
+        if outcomes:
+            _log_batch(outcomes)
+        return outcomes
+
+    def run_forever(self) -> None:
+        self.pipeline.reap_recheck_leases()
+        queued = self.rehydrate()
+        logger.info("recheck scheduler started | concurrency=%s queued=%s", self.concurrency, queued)
+        next_refresh = time.monotonic() + self.refresh_seconds
+        next_resync = time.monotonic() + self.resync_seconds
+        in_flight: set[Future[list[RecheckOutcome]]] = set()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="recheck") as executor:
+            while not self._stop.is_set():
+                if time.monotonic() >= next_resync:
+                    self.rehydrate()
+                    next_resync = time.monotonic() + self.resync_seconds
+                    next_refresh = time.monotonic() + self.refresh_seconds
+                elif time.monotonic() >= next_refresh:
+                    self.refresh()
+                    next_refresh = time.monotonic() + self.refresh_seconds
+
+                free = self.concurrency - len(in_flight)
+                if free > 0:
+                    for future in _submit(executor, self.pipeline, self._claim(self._pop_due(time.time(), free))):
+                        future.add_done_callback(lambda _: self._wakeup.set())
+                        in_flight.add(future)
+
+                done = {future for future in in_flight if future.done()}
+                if done:
+                    in_flight -= done
+                    outcomes = _collect(done)
+                    for outcome in outcomes:
+                        if outcome.retry_at is not None:
+                            self.schedule(outcome.job_id, outcome.retry_at)
+                    _log_batch(outcomes)
+                    continue
+
+                timeout = next_refresh - time.monotonic()
+                due = self.next_due()
+                if due is not None and len(in_flight) < self.concurrency:
+                    timeout = min(timeout, due - time.time())
+                self._wakeup.wait(max(timeout, 0.0))
+                self._wakeup.clear()
+            wait(in_flight)
+        logger.info("recheck scheduler stopped")
+
+    def start(self) -> threading.Thread:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="recheck-scheduler", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _claim(self, job_ids: list[int]) -> list[RecheckJob]:
+        return self.pipeline.db.claim_recheck_jobs(job_ids, lease_seconds=self.pipeline.settings.recheck_lease_seconds)
+
+    def _pop_due(self, now: float, limit: int) -> list[int]:
+        job_ids: list[int] = []
+        with self._lock:
+            self._drop_stale()
+            while self._heap and len(job_ids) < limit and self._heap[0][0] <= now:
+                _, job_id = heapq.heappop(self._heap)
+                del self._due[job_id]
+                job_ids.append(job_id)
+                self._drop_stale()
+        return job_ids
+
+    def _drop_stale(self) -> None:
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+
+def build_recheck_worker(pipeline: ScoutPipeline, settings: Settings) -> RecheckScheduler | RecheckWorker:
+    """The dispatcher for `DOG_SCOUT_RECHECK_MODE=thread` and `--mode worker`."""
+    if settings.recheck_scheduler == "poll":
+        return RecheckWorker(
+            pipeline,
+            concurrency=settings.recheck_concurrency,
+            poll_seconds=settings.recheck_poll_seconds,
+        )
+    return RecheckScheduler(
+        pipeline,
+        concurrency=settings.recheck_concurrency,
+        refresh_seconds=settings.recheck_poll_seconds,
+        resync_seconds=settings.recheck_resync_seconds,
+    )
+
+
+def _submit(
+    executor: ThreadPoolExecutor,
+    pipeline: ScoutPipeline,
+    jobs: list[RecheckJob],
+) -> list[Future[list[RecheckOutcome]]]:
+    """Load the claimed batch's stored scores in one query, then hand the jobs to the pool.
+
+    Jobs of the same alert share one timeline, so they run as one task, in schedule order: a 15m job
+    claimed together with its 5m job still builds on the 5m score. Different alerts run in parallel.
+    """
+    if not jobs:
+        return []
+    contexts = pipeline.load_recheck_contexts(jobs)
+    groups: dict[int, list[RecheckJob]] = {}
+    for job in jobs:
+        groups.setdefault(job.source_alert_id, []).append(job)
+    return [
+        executor.submit(_process_group, pipeline, sorted(group, key=lambda job: job.scheduled_minutes), contexts)
+        for group in groups.values()
+    ]
+
+
+def _process_group(
+    pipeline: ScoutPipeline,
+    jobs: list[RecheckJob],
+    contexts: dict[int, RecheckContext],
+) -> list[RecheckOutcome]:
+    return [pipeline.process_recheck_job(job, contexts.get(job.id)) for job in jobs]
+
+
+def _collect(futures: Iterable[Future[list[RecheckOutcome]]]) -> list[RecheckOutcome]:
+    return [outcome for future in futures for outcome in future.result()]
+
+
+def _log_batch(outcomes: list[RecheckOutcome]) -> None:
+    lateness = [outcome.lateness_seconds for outcome in outcomes]
+    logger.info(
+        "recheck batch | processed=%s failed=%s retried=%s lateness_avg=%.1fs lateness_max=%.1fs",
+        len(outcomes),
+        sum(1 for outcome in outcomes if not outcome.succeeded),
+        sum(1 for outcome in outcomes if outcome.retry_at is not None),
+        sum(lateness) / len(lateness),
+        max(lateness),
+    )
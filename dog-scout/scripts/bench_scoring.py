@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Throughput of per-pair `score_pair` vs columnar `score_pairs_batch`."""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from dog_scout.config import Settings
+from dog_scout.models import PairSnapshot
+from dog_scout.scoring import score_pair
+from dog_scout.scoring_batch import pair_columns, score_pairs_batch
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark rule scoring throughput")
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+def build_pairs(rows: int, seed: int) -> list[PairSnapshot]:
+    rng = random.Random(seed)
+    return [
+        PairSnapshot(
+            chain_id="base",
+            pair_address=f"0xpair{index}",
+            dex_id="uniswap",
+            base_token_address=f"0xtoken{index}",
+            base_token_symbol="DOG",
+            quote_token_symbol="WETH",
+            price_usd=0.001,
+            liquidity_usd=rng.lognormvariate(10.5, 1.2),
+            volume_h24=rng.lognormvariate(11, 1.5),
+            txns_h1_buys=int(rng.expovariate(1 / 40)),
+            txns_h1_sells=int(rng.expovariate(1 / 35)),
+            price_change_h1=None if rng.random() < 0.03 else rng.gauss(5, 40),
+            price_change_h24=None if rng.random() < 0.03 else rng.gauss(15, 80),
+            pair_created_at=None,
+            raw={},
+        )
+        for index in range(rows)
+    ]
+
+
+def main() -> None:
+    args = parse_args()
+    settings = Settings.from_env()
+    pairs = build_pairs(args.rows, args.seed)
+
+    started = time.perf_counter()
+    scalar = [score_pair(pair, settings) for pair in pairs]
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    columns = pair_columns(pairs)
+    columns_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = score_pairs_batch(settings=settings, **columns)
+    batch_seconds = time.perf_counter() - started
+
+    mismatches = sum(
+        1 for index, expected in enumerate(scalar) if float(batch.final_score[index]) != expected.final_score
+    )
+    print(f"rows={args.rows}")
+    print(f"score_pair         {scalar_seconds:8.3f}s  {args.rows / scalar_seconds:12,.0f} rows/s")
+    print(f"pair_columns       {columns_seconds:8.3f}s  {args.rows / columns_seconds:12,.0f} rows/s")
+    print(f"score_pairs_batch  {batch_seconds:8.3f}s  {args.rows / batch_seconds:12,.0f} rows/s")
+    print(f"final_score mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
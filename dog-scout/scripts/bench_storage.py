@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Compare per-call vs batched persistence of one scan cycle (commits + latency)."""
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from dog_scout.config import Settings
+from dog_scout.models import Candidate, FilterOutcome, RiskAssessment, ScoreBreakdown
+from dog_scout.pipeline import _mock_pairs
+from dog_scout.storage import Database
+
+COMMITS = {"count": 0}
+_original_connect = sqlite3.connect
+
+
+def _counting_connect(*args, **kwargs):  # noqa: ANN002, ANN003, ANN202
+    conn = _original_connect(*args, **kwargs)
+
+    def _trace(statement: str) -> None:
+        if statement.strip().upper() == "COMMIT":
+            COMMITS["count"] += 1
+
+    conn.set_trace_callback(_trace)
+    return conn
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark scan-cycle persistence")
+    parser.add_argument("--pairs", type=int, default=40, help="pairs per cycle")
+    parser.add_argument("--alerts", type=int, default=5, help="alerts per cycle")
+    parser.add_argument("--cycles", type=int, default=20)
+    return parser.parse_args()
+
+
+def build_cycle(cycle: int, size: int) -> list[Candidate]:
+    templates = _mock_pairs("base")
+    candidates: list[Candidate] = []
+    for index in range(size):
+        pair = replace(
+            templates[index % len(templates)],
+            pair_address=f"0xpair{cycle:04d}{index:04d}",
+            base_token_address=f"0xtoken{cycle:04d}{index:04d}",
+        )
+        candidates.append(
+            Candidate(
+                pair=pair,
+                risk=RiskAssessment(is_honeypot=False, risk_flags=[]),
+                filter_outcome=FilterOutcome(passed=True, reasons=[], skipped_checks=[]),
+                score=ScoreBreakdown(30.0, 20.0, 15.0, 65.0, rule_score=65.0),
+            )
+        )
+    return candidates
+
+
+def persist_per_call(db: Database, candidates: list[Candidate], alerts: int, recheck_minutes: tuple[int, ...]) -> None:
+    for candidate in candidates:
+        candidate.pair_raw_id = db.insert_pair_raw(candidate.pair)
+        candidate.signal_id = db.insert_signal(
+            candidate.pair_raw_id,
+            candidate.pair,
+            candidate.risk,
+            candidate.filter_outcome,
+            candidate.score,
+        )
+    for candidate in candidates[:alerts]:
+        alert_id = db.insert_alert(candidate, "bench", dry_run=True, status="dry_run", sent=False)
+        db.enqueue_recheck_jobs(candidate, alert_id, recheck_minutes)
+
+
+def persist_batched(db: Database, candidates: list[Candidate], alerts: int, recheck_minutes: tuple[int, ...]) -> None:
+    db.insert_scan_results(candidates)
+    with db.batch():
+        for candidate in candidates[:alerts]:
+            alert_id = db.insert_alert(candidate, "bench", dry_run=True, status="dry_run", sent=False)
+            db.enqueue_recheck_jobs(candidate, alert_id, recheck_minutes)
+
+
+def run(name: str, persist, args: argparse.Namespace, recheck_minutes: tuple[int, ...]) -> None:  # noqa: ANN001
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = Database(Path(tmpdir) / "bench.db")
+        db.ensure_initialized()
+        latencies: list[float] = []
+        commits: list[int] = []
+        for cycle in range(args.cycles):
+            candidates = build_cycle(cycle, args.pairs)
+            COMMITS["count"] = 0
+            started = time.perf_counter()
+            persist(db, candidates, args.alerts, recheck_minutes)
+            latencies.append((time.perf_counter() - started) * 1000.0)
+            commits.append(COMMITS["count"])
+        db.close()
+
+    print(
+        f"{name:<10} commits/cycle={statistics.mean(commits):6.1f} "
+        f"latency_ms p50={statistics.median(latencies):8.2f} "
+        f"max={max(latencies):8.2f}"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    # Benchmark the configured recheck schedule (DOG_SCOUT_RECHECK_MINUTES), as the scanner enqueues it.
+    recheck_minutes = Settings.from_env().recheck_minutes
+    sqlite3.connect = _counting_connect
+    print(f"pairs/cycle={args.pairs} alerts/cycle={args.alerts} cycles={args.cycles}")
+    run("per-call", persist_per_call, args, recheck_minutes)
+    run("batched", persist_batched, args, recheck_minutes)
+
+
+if __name__ == "__main__":
+    main()
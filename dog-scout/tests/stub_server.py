@@ -0,0 +1,13 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def serve(test: unittest.TestCase, handler: type[BaseHTTPRequestHandler]) -> str:
+    """Serve ``handler`` on a free local port for the duration of ``test`` and return its base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    # Cleanups run last-in first-out: stop the serve loop, then release the socket.
+    test.addCleanup(server.server_close)
+    test.addCleanup(server.shutdown)
+    return f"http://127.0.0.1:{server.server_address[1]}"
@@ -0,0 +1,145 @@
+import json
+import re
+import tempfile
+import threading
+import unittest
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+from dog_scout.analyzer import AnalyzerError, AnalyzerOutput, DeepSeekAnalyzer
+from dog_scout.pipeline import ScoutPipeline
+from dog_scout.storage import Database
+
+from stub_server import serve
+from test_analyzer_cache import build_input
+from test_day2_features import build_settings
+
+
+class ChatState:
+    def __init__(self, mode: str = "ok") -> None:
+        self.mode = mode
+        self.lock = threading.Lock()
+        self.batch_requests = 0
+        self.single_requests = 0
+
+
+def _result(index: int | None = None) -> dict:
+    item = {
+        "narrative_score": 70 + (index or 0),
+        "risk_comment": "ok",
+        "action_hint": "watch",
+        "confidence": 0.6,
+        "reasons": ["volume building"],
+    }
+    if index is not None:
+        item["index"] = index
+    return item
+
+
+def build_handler(state: ChatState) -> type[BaseHTTPRequestHandler]:
+    class ChatHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # noqa: A002, ANN001
+            return
+
+        def do_POST(self) -> None:  # noqa: N802
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            system_prompt = request["messages"][0]["content"]
+            user_prompt = request["messages"][1]["content"]
+            if '"results"' in system_prompt:
+                with state.lock:
+                    state.batch_requests += 1
+                content = self._batch_content([int(n) for n in re.findall(r"^\[(\d+)\]", user_prompt, re.M)])
+            else:
+                with state.lock:
+                    state.single_requests += 1
+                content = json.dumps(_result())
+
+            body = json.dumps({"choices": [{"message": {"content": content}}]}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _batch_content(self, indexes: list[int]) -> str:
+            if state.mode == "garbage":
+                return "I cannot answer in JSON today"
+            results = [_result(index) for index in indexes]
+            if state.mode == "partial":
+                # Candidate 1 is skipped, candidate 2 has a non-numeric score.
+                results = [item for item in results if item["index"] != 1]
+                results[1]["narrative_score"] = "high"
+            return "```json\n" + json.dumps({"results": results}) + "\n```"
+
+    return ChatHandler
+
+
+class DeepSeekBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state = ChatState()
+        base_url = serve(self, build_handler(self.state))
+        self.analyzer = DeepSeekAnalyzer(
+            base_url=base_url,
+            api_key="test-key",
+            model="deepseek-chat",
+            timeout_seconds=5,
+        )
+
+    def _payloads(self, count: int) -> list:
+        return [build_input(token_address=f"0xtoken{index}") for index in range(count)]
+
+    def test_batch_is_one_request_and_keeps_order(self) -> None:
+        results = self.analyzer.analyze_batch(self._payloads(4))
+
+        self.assertEqual([result.narrative_score for result in results], [70.0, 71.0, 72.0, 73.0])
+        self.assertEqual((self.state.batch_requests, self.state.single_requests), (1, 0))
+
+    def test_unparseable_batch_falls_back_to_per_item_calls(self) -> None:
+        self.state.mode = "garbage"
+
+        results = self.analyzer.analyze_batch(self._payloads(3))
+
+        self.assertTrue(all(isinstance(result, AnalyzerOutput) for result in results))
+        self.assertEqual((self.state.batch_requests, self.state.single_requests), (1, 3))
+
+    def test_missing_or_invalid_elements_are_retried_alone(self) -> None:
+        self.state.mode = "partial"
+
+        results = self.analyzer.analyze_batch(self._payloads(4))
+
+        self.assertEqual([result.narrative_score for result in results], [70.0, 70.0, 70.0, 73.0])
+        self.assertEqual((self.state.batch_requests, self.state.single_requests), (1, 2))
+
+    def test_per_item_failures_are_returned_in_place(self) -> None:
+        results = DeepSeekAnalyzer(
+            base_url="http://127.0.0.1:9", api_key="test-key", model="deepseek-chat", timeout_seconds=1
+        ).analyze_batch(self._payloads(2))
+
+        self.assertTrue(all(isinstance(result, AnalyzerError) for result in results))
+
+    def test_pipeline_sends_gated_pairs_in_batches(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings = replace(
+                build_settings(Path(tmpdir) / "dog_scout.db"),
+                llm_batch_size=4,
+                llm_cache_enabled=False,
+            )
+            db = Database(settings.db_path)
+            db.ensure_initialized()
+            pipeline = ScoutPipeline(settings=settings, db=db, analyzer=self.analyzer)
+            try:
+                result = pipeline.run_once()
+                with db.connect() as conn:
+                    rows = conn.execute("SELECT llm_score, llm_failed FROM signals").fetchall()
+            finally:
+                pipeline.close()
+                db.close()
+
+        self.assertEqual(self.state.batch_requests, -(-result.fetched_pairs // 4))
+        self.assertEqual(self.state.single_requests, 0)
+        self.assertTrue(all(row["llm_score"] is not None and row["llm_failed"] == 0 for row in rows))
+
+
+if __name__ == "__main__":
+    unittest.main()
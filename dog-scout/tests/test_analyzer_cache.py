@@ -0,0 +1,137 @@
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from dog_scout.analyzer import AnalyzerError, AnalyzerInput, AnalyzerOutput, MockAnalyzer
+from dog_scout.analyzer_cache import CacheKeyPrecision, CachingAnalyzer, analysis_cache_key
+from dog_scout.pipeline import ScoutPipeline
+from dog_scout.storage import Database
+
+from test_day2_features import FailingAnalyzer, build_settings
+
+
+def build_input(**overrides) -> AnalyzerInput:  # noqa: ANN003
+    payload = AnalyzerInput(
+        chain_id="base",
+        token_address="0xToken",
+        token_symbol="DOG",
+        pair_address="0xPair",
+        dex_id="uniswap",
+        rule_score=72.3,
+        liquidity_usd=48_210.0,
+        txns_h1=121,
+        price_change_h1=12.2,
+        price_change_h24=40.4,
+        volume_h24=150_300.0,
+        risk_flags=["mint_enabled", "new_pair"],
+        market_snapshot="",
+    )
+    return replace(payload, **overrides)
+
+
+class CountingAnalyzer:
+    provider = "mock"
+    model = "mock-v1"
+
+    def __init__(self) -> None:
+        self.inner = MockAnalyzer()
+        self.calls = 0
+
+    def analyze(self, payload: AnalyzerInput) -> AnalyzerOutput:
+        self.calls += 1
+        return self.inner.analyze(payload)
+
+
+class CacheKeyTests(unittest.TestCase):
+    def test_nearby_snapshots_share_a_bucket(self) -> None:
+        precision = CacheKeyPrecision()
+        base = analysis_cache_key(build_input(), precision, "mock", "mock-v1")
+
+        jittered = build_input(
+            liquidity_usd=48_390.0,
+            volume_h24=149_800.0,
+            txns_h1=122,
+            price_change_h1=11.9,
+            rule_score=72.4,
+            risk_flags=["new_pair", "mint_enabled"],
+        )
+        self.assertEqual(analysis_cache_key(jittered, precision, "mock", "mock-v1"), base)
+
+        for changed in (
+            build_input(liquidity_usd=60_000.0),
+            build_input(price_change_h1=None),
+            build_input(rule_score=75.0),
+            build_input(risk_flags=["mint_enabled"]),
+            build_input(token_address="0xOther"),
+        ):
+            self.assertNotEqual(analysis_cache_key(changed, precision, "mock", "mock-v1"), base)
+        self.assertNotEqual(analysis_cache_key(build_input(), precision, "deepseek", "deepseek-chat"), base)
+
+    def test_finer_precision_separates_jitter(self) -> None:
+        precision = CacheKeyPrecision(usd_significant_digits=4, pct_step=0.1)
+        self.assertNotEqual(
+            analysis_cache_key(build_input(), precision, "mock", "mock-v1"),
+            analysis_cache_key(build_input(liquidity_usd=48_390.0), precision, "mock", "mock-v1"),
+        )
+
+
+class CachingAnalyzerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = Database(Path(self.tmpdir.name) / "dog_scout.db")
+        self.db.ensure_initialized()
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_hits_persist_across_instances_until_expiry(self) -> None:
+        inner = CountingAnalyzer()
+        first = CachingAnalyzer(inner, self.db, ttl_seconds=600).analyze(build_input())
+        self.assertFalse(first.cache_hit)
+
+        restarted = CachingAnalyzer(inner, self.db, ttl_seconds=600)
+        second = restarted.analyze(build_input(liquidity_usd=48_390.0))
+        self.assertTrue(second.cache_hit)
+        self.assertEqual(replace(second, cache_hit=False), first)
+        self.assertEqual(inner.calls, 1)
+        self.assertEqual(restarted.stats.snapshot()["hits"], 1)
+
+        with self.db.connect() as conn:
+            conn.execute("UPDATE llm_cache SET expires_at = datetime('now', '-1 second')")
+        self.assertFalse(restarted.analyze(build_input()).cache_hit)
+        self.assertEqual(inner.calls, 2)
+
+    def test_prune_removes_expired_rows_and_failures_are_not_cached(self) -> None:
+        cache = CachingAnalyzer(CountingAnalyzer(), self.db, ttl_seconds=600, prune_interval_seconds=0)
+        cache.analyze(build_input(token_address="0xA"))
+        with self.db.connect() as conn:
+            conn.execute("UPDATE llm_cache SET expires_at = datetime('now', '-1 second')")
+        cache.analyze(build_input(token_address="0xB"))
+
+        with self.assertRaises(AnalyzerError):
+            CachingAnalyzer(FailingAnalyzer(), self.db, ttl_seconds=600).analyze(build_input(token_address="0xC"))
+        with self.db.connect() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0], 1)
+
+    def test_repeat_scan_records_cache_hits_on_signals(self) -> None:
+        settings = build_settings(self.db.db_path)
+        inner = CountingAnalyzer()
+        pipeline = ScoutPipeline(settings=settings, db=self.db, analyzer=inner)
+        try:
+            pipeline.run_once()
+            calls_after_first = inner.calls
+            pipeline.run_once()
+        finally:
+            pipeline.close()
+
+        self.assertEqual(inner.calls, calls_after_first)
+        with self.db.connect() as conn:
+            rows = conn.execute("SELECT pair_raw_id, llm_cache_hit FROM signals ORDER BY id").fetchall()
+        half = len(rows) // 2
+        self.assertEqual([row["llm_cache_hit"] for row in rows], [0] * half + [1] * half)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from dog_scout.backtest import NO_DATA, PENDING, BacktestEngine, iter_db_replay_rows, run_backtest
+from dog_scout.config import Settings, apply_setting_overrides
+from dog_scout.models import Candidate, FilterOutcome, PairSnapshot, RiskAssessment, ScoreBreakdown
+from dog_scout.storage import Database
+
+T0 = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def build_settings(db_path: Path) -> Settings:
+    return Settings(
+        db_path=db_path,
+        chain_id="base",
+        loop_interval_seconds=120,
+        top_n=2,
+        dedup_cooldown_minutes=30,
+        dry_run=True,
+        use_mock_data=True,
+        request_timeout_seconds=10,
+        max_new_tokens=20,
+        min_liquidity_usd=20_000,
+        min_holders=100,
+        max_top10_concentration=0.50,
+        denylist_tokens=set(),
+        txn_target_h1=100,
+        momentum_blowoff_threshold=80.0,
+        llm_enabled=False,
+        llm_provider="mock",
+        llm_base_url="https://api.deepseek.com/v1",
+        llm_api_key="",
+        llm_model="deepseek-chat",
+        llm_timeout_seconds=5,
+        llm_weight=0.30,
+        rule_weight=0.70,
+        recheck_batch_size=20,
+        telegram_enabled=False,
+        telegram_bot_token="",
+        telegram_chat_id="",
+    )
+
+
+def build_candidate(name: str, liquidity: float, txns: int, h1: float = 5.0) -> Candidate:
+    pair = PairSnapshot(
+        chain_id="base",
+        pair_address=f"0xpair{name}",
+        dex_id="uniswap",
+        base_token_address=f"0xtoken{name}",
+        base_token_symbol=name,
+        quote_token_symbol="WETH",
+        price_usd=0.001,
+        liquidity_usd=liquidity,
+        volume_h24=100_000,
+        txns_h1_buys=txns,
+        txns_h1_sells=txns,
+        price_change_h1=h1,
+        price_change_h24=10.0,
+        pair_created_at=T0,
+        raw={"baseToken": {"symbol": name}, "priceChange": {"h1": h1, "h24": 10.0}},
+    )
+    return Candidate(
+        pair=pair,
+        risk=RiskAssessment(is_honeypot=False, risk_flags=[]),
+        filter_outcome=FilterOutcome(passed=True, reasons=[], skipped_checks=[]),
+        score=ScoreBreakdown(0.0, 0.0, 0.0, 0.0),
+    )
+
+
+class BacktestTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "dog_scout.db"
+        self.db = Database(self.db_path)
+        self.db.ensure_initialized()
+        self.settings = build_settings(self.db_path)
+
+        self._insert_cycle(
+            T0,
+            [
+                build_candidate("A", 90_000, 60),
+                build_candidate("B", 60_000, 40),
+                build_candidate("C", 25_000, 10),
+                build_candidate("D", 5_000, 80),
+            ],
+        )
+        self._insert_cycle(T0 + timedelta(minutes=2), [build_candidate("C", 26_000, 12)])
+        # A is seen again after its 5m recheck is due and improves; B is never seen again.
+        self._insert_cycle(T0 + timedelta(minutes=6), [build_candidate("A", 120_000, 90)])
+        self._insert_cycle(T0 + timedelta(minutes=40), [build_candidate("E", 30_000, 20)])
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def _insert_cycle(self, fetched_at: datetime, candidates: list[Candidate]) -> None:
+        self.db.insert_scan_results(candidates)
+        with self.db.connect() as conn:
+            conn.executemany(
+                "UPDATE pairs_raw SET fetched_at = ? WHERE id = ?",
+                [(fetched_at.strftime("%Y-%m-%d %H:%M:%S"), c.pair_raw_id) for c in candidates],
+            )
+
+    def _table_counts(self) -> dict[str, int]:
+        with self.db.connect() as conn:
+            return {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("pairs_raw", "signals", "alerts", "recheck_jobs", "recheck_results")
+            }
+
+    def test_replay_reports_alerts_and_recheck_statuses_without_writing(self) -> None:
+        before = self._table_counts()
+        alerts = []
+
+        report = run_backtest(self.db, self.settings, alert_sink=alerts.append)
+
+        self.assertEqual(self._table_counts(), before)
+        self.assertEqual(report.rows_read, 7)
+        self.assertEqual(report.cycles, 4)
+        # Cycle 1: A, B; cycle 2: C (cooldown does not block a new token); cycle 3: A deduped; cycle 4: E.
+        self.assertEqual([alert.token_symbol for alert in alerts], ["A", "B", "C", "E"])
+        self.assertEqual(report.alerts, 4)
+        # A: both rechecks observe the +6m sighting; B/C never reappear; E's rechecks are past the data.
+        self.assertEqual(report.recheck_status, {"IMPROVING": 2, NO_DATA: 4, PENDING: 2})
+
+    def test_overrides_change_alert_set(self) -> None:
+        strict = apply_setting_overrides(self.settings, {"min_liquidity_usd": "50000", "top_n": "5"})
+        alerts = []
+
+        report = run_backtest(self.db, strict, alert_sink=alerts.append)
+
+        self.assertEqual({alert.token_symbol for alert in alerts}, {"A", "B"})
+        self.assertEqual(report.alerts, 2)
+
+    def test_trend_weight_is_refused(self) -> None:
+        trended = apply_setting_overrides(self.settings, {"trend_weight": "0.3"})
+
+        with self.assertRaisesRegex(ValueError, "trend_weight"):
+            run_backtest(self.db, trended)
+
+    def test_feedback_is_joined_to_matching_live_alert(self) -> None:
+        alert_id = self.db.insert_alert(
+            build_candidate("A", 90_000, 60), "m", dry_run=True, status="dry_run", sent=False
+        )
+        with self.db.connect() as conn:
+            conn.execute("UPDATE alerts SET created_at = ? WHERE id = ?", ("2026-03-01 12:00:30", alert_id))
+            conn.execute("INSERT INTO trade_feedback (alert_id, outcome, pnl_pct) VALUES (?, 'win', 42.0)", (alert_id,))
+
+        report = run_backtest(self.db, self.settings)
+
+        self.assertEqual(report.live_alerts, 1)
+        self.assertEqual(report.matched_live_alerts, 1)
+        self.assertEqual(report.feedback_matched, 1)
+        self.assertEqual(report.feedback_wins, 1)
+        self.assertEqual(report.feedback_avg_pnl_pct, 42.0)
+
+    def test_engine_state_is_bounded_by_pending_rechecks(self) -> None:
+        engine = BacktestEngine(self.settings)
+        for row in iter_db_replay_rows(self.db, chunk_size=2):
+            engine.feed(row)
+        engine.finish()
+
+        # Everything resolved before the last cycle was dropped; only E still waits.
+        self.assertEqual([state.token_address for state in engine._alerts.values()], ["0xtokenE"])
+        self.assertLessEqual(set(engine._latest), {"0xpairE"})
+
+
+if __name__ == "__main__":
+    unittest.main()
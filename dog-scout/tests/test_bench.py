@@ -0,0 +1,99 @@
+import statistics
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dog_scout.bench import bench_settings, compare_reports, run_bench
+from dog_scout.clients.dexscreener import DexscreenerClient
+from dog_scout.synthetic import FakeService, FakeUpstream, SyntheticMarket, synthetic_pairs
+
+from test_day2_features import build_settings
+
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+class SyntheticMarketTests(unittest.TestCase):
+    def test_same_seed_gives_same_market(self) -> None:
+        first = synthetic_pairs(50, seed=7, now=NOW)
+        second = synthetic_pairs(50, seed=7, now=NOW)
+
+        self.assertEqual([pair.raw for pair in first], [pair.raw for pair in second])
+        self.assertNotEqual(first[0].raw, synthetic_pairs(50, seed=8, now=NOW)[0].raw)
+        self.assertEqual(len({pair.base_token_address for pair in first}), 50)
+
+    def test_distributions_are_heavy_tailed_and_valid(self) -> None:
+        pairs = synthetic_pairs(2000, seed=3, now=NOW)
+        liquidity = [pair.liquidity_usd for pair in pairs]
+
+        self.assertTrue(10_000 < statistics.median(liquidity) < 100_000)
+        self.assertGreater(statistics.mean(liquidity), statistics.median(liquidity))
+        self.assertTrue(all(pair.txns_h1_buys >= 0 and pair.txns_h1_sells >= 0 for pair in pairs))
+        self.assertTrue(any(pair.price_change_h1 is None for pair in pairs))
+        self.assertTrue(all(pair.pair_created_at <= NOW for pair in pairs))
+
+    def test_advance_lists_fresh_tokens_and_moves_pairs(self) -> None:
+        market = SyntheticMarket(seed=1, chain_ids=["base", "solana"], tokens_per_chain=10, history_factor=2, now=NOW)
+        before = market.latest_profiles()
+        oldest = before[9]
+
+        market.advance(120)
+        after = market.latest_profiles()
+
+        self.assertEqual(len(after), 20)
+        self.assertEqual(after[3]["tokenAddress"], before[0]["tokenAddress"])  # three fresh tokens per chain
+        self.assertTrue(after[10]["tokenAddress"][0] != "0")  # solana addresses are base58
+        moved = market.pair_payloads("base", oldest["tokenAddress"])
+        self.assertTrue(moved)
+        for _ in range(10):
+            market.advance(120)
+        self.assertEqual(market.pair_payloads("base", oldest["tokenAddress"]), [])
+
+
+class FakeUpstreamTests(unittest.TestCase):
+    def test_latency_and_error_knobs_apply_per_service(self) -> None:
+        market = SyntheticMarket(seed=2, tokens_per_chain=4, now=NOW)
+        with FakeUpstream(market, dexscreener=FakeService(latency_seconds=0.1, error_rate=1.0)) as upstream:
+            client = DexscreenerClient(timeout_seconds=5, base_url=upstream.base_url)
+            started = time.monotonic()
+            tokens = client.fetch_latest_tokens(["base"], max_tokens=4)
+            elapsed = time.monotonic() - started
+
+            self.assertEqual(tokens, {"base": []})
+            self.assertGreaterEqual(elapsed, 0.1)
+            self.assertEqual(upstream.stats(), {"requests": {"dexscreener": 1}, "errors": {"dexscreener": 1}})
+
+
+class BenchTests(unittest.TestCase):
+    def test_run_bench_reports_latency_growth_and_rows(self) -> None:
+        market = SyntheticMarket(seed=5, tokens_per_chain=8, now=NOW)
+        with tempfile.TemporaryDirectory() as tmpdir, FakeUpstream(market) as upstream:
+            settings = bench_settings(build_settings(Path(tmpdir) / "bench.db"), upstream, market)
+            report = run_bench(settings, market, upstream, cycles=2)
+
+        self.assertEqual([cycle["fetched_pairs"] for cycle in report["cycles"]], [8, 8])
+        self.assertEqual(report["rows"]["written"]["pairs_raw"], 16)
+        self.assertGreater(report["rows"]["per_second"], 0)
+        self.assertGreater(report["db"]["growth_bytes"], 0)
+        self.assertIn("fetch", report["stage_latency_ms"])
+        requests = report["upstream"]["requests"]
+        self.assertEqual(requests["dexscreener"], 2 * (1 + 8))
+        self.assertEqual(requests["telegram"], report["rows"]["written"]["alerts"])
+        self.assertGreater(requests["deepseek"], 0)
+
+    def test_compare_flags_regressions_beyond_ten_percent(self) -> None:
+        baseline = {"cycle_latency_ms": {"p50": 100.0, "p95": 200.0}, "rows": {"per_second": 1000.0}}
+        current = {"cycle_latency_ms": {"p50": 105.0, "p95": 260.0}, "rows": {"per_second": 800.0}}
+
+        comparison = compare_reports(baseline, current)
+
+        self.assertFalse(comparison["cycle_latency_ms.p50"]["regressed"])
+        self.assertTrue(comparison["cycle_latency_ms.p95"]["regressed"])
+        self.assertEqual(comparison["rows.per_second"]["change_pct"], -20.0)
+        self.assertTrue(comparison["rows.per_second"]["regressed"])
+        self.assertNotIn("db.growth_bytes_per_cycle", comparison)
+
+
+if __name__ == "__main__":
+    unittest.main()
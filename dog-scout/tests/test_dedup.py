@@ -0,0 +1,114 @@
+import sqlite3
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from dog_scout.dedup import RecentAlertIndex
+from dog_scout.models import Candidate, FilterOutcome, PairSnapshot, RiskAssessment, ScoreBreakdown
+from dog_scout.storage import Database
+
+
+def build_candidate(token: str, pair: str) -> Candidate:
+    return Candidate(
+        pair=PairSnapshot(
+            chain_id="base",
+            pair_address=pair,
+            dex_id="uniswap",
+            base_token_address=token,
+            base_token_symbol="DOG",
+            quote_token_symbol="WETH",
+            price_usd=0.001,
+            liquidity_usd=50_000,
+            volume_h24=100_000,
+            txns_h1_buys=20,
+            txns_h1_sells=10,
+            price_change_h1=8.0,
+            price_change_h24=17.0,
+            pair_created_at=None,
+            raw={},
+        ),
+        risk=RiskAssessment(is_honeypot=False, risk_flags=[]),
+        filter_outcome=FilterOutcome(passed=True, reasons=[], skipped_checks=[]),
+        score=ScoreBreakdown(30.0, 20.0, 15.0, 65.0),
+    )
+
+
+class RecentAlertIndexTests(unittest.TestCase):
+    def test_matches_token_or_pair_inside_cooldown(self) -> None:
+        now = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        index = RecentAlertIndex(ttl_minutes=30)
+        index.record("0xtA", "0xpA", now - timedelta(minutes=10))
+
+        self.assertTrue(index.has_recent_alert("0xtA", "0xother", 30, now=now))
+        self.assertTrue(index.has_recent_alert("0xother", "0xpA", 30, now=now))
+        self.assertFalse(index.has_recent_alert("0xtA", "0xpA", 5, now=now))
+        self.assertFalse(index.has_recent_alert("0xtB", "0xpB", 30, now=now))
+        self.assertFalse(index.covers(45))
+
+    def test_expired_entries_are_swept(self) -> None:
+        start = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+        index = RecentAlertIndex(ttl_minutes=30)
+        index.record("0xtA", "0xpA", start)
+        index.record("0xtB", "0xpB", start + timedelta(minutes=45))
+
+        self.assertEqual(len(index), 2)
+        self.assertFalse(index.has_recent_alert("0xtA", "0xpA", 30, now=start + timedelta(minutes=45)))
+
+
+class DatabaseAlertIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "dog_scout.db"
+        self.db = Database(self.db_path)
+        self.db.ensure_initialized()
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_warm_index_answers_without_db_reads(self) -> None:
+        self.db.insert_alert(build_candidate("0xtA", "0xpA"), "m", dry_run=True, status="dry_run", sent=False)
+        stale = build_candidate("0xtOld", "0xpOld")
+        old_id = self.db.insert_alert(stale, "m", dry_run=True, status="dry_run", sent=False)
+        with self.db.connect() as conn:
+            conn.execute("UPDATE alerts SET created_at = '2000-01-01 00:00:00' WHERE id = ?", (old_id,))
+
+        self.db.warm_alert_index(ttl_minutes=30)
+
+        statements: list[str] = []
+        with self.db.connect() as conn:
+            conn.set_trace_callback(statements.append)
+        self.assertTrue(self.db.has_recent_alert("0xtA", "0xpX", 30))
+        self.assertFalse(self.db.has_recent_alert("0xtOld", "0xpOld", 30))
+
+        self.db.insert_alert(build_candidate("0xtB", "0xpB"), "m", dry_run=True, status="dry_run", sent=False)
+        self.assertTrue(self.db.has_recent_alert("0xtX", "0xpB", 30))
+        self.assertFalse(any("FROM alerts" in statement for statement in statements))
+
+    def test_rolled_back_alert_is_not_indexed_and_foreign_alerts_are_refreshed(self) -> None:
+        self.db.warm_alert_index(ttl_minutes=30)
+
+        with self.assertRaises(RuntimeError):
+            with self.db.batch():
+                self.db.insert_alert(build_candidate("0xtA", "0xpA"), "m", dry_run=True, status="dry_run", sent=False)
+                raise RuntimeError("boom")
+        self.assertFalse(self.db.has_recent_alert("0xtA", "0xpA", 30))
+
+        other_process = sqlite3.connect(self.db_path)
+        other_process.execute(
+            """
+            INSERT INTO alerts (chain_id, pair_address, token_address, final_score, message, status)
+            VALUES ('base', '0xpC', '0xtC', 70, 'm', 'dry_run')
+            """
+        )
+        other_process.commit()
+        other_process.close()
+
+        self.assertFalse(self.db.has_recent_alert("0xtC", "0xpC", 30))
+        self.db.refresh_alert_index()
+        self.assertTrue(self.db.has_recent_alert("0xtC", "0xpC", 30))
+
+
+if __name__ == "__main__":
+    unittest.main()
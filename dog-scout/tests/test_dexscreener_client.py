@@ -0,0 +1,259 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+from dog_scout.clients.cache import CachedResponse, MemoryResponseCache, build_response_cache
+from dog_scout.clients.dexscreener import DexscreenerClient
+from dog_scout.pipeline import ScoutPipeline
+from dog_scout.ratelimit import TokenBucket
+from dog_scout.storage import Database
+
+from stub_server import serve
+from test_day2_features import build_settings
+
+TOKENS = [f"0xtoken{index:02d}" for index in range(12)]
+SOLANA_TOKENS = [f"SoLToken{index}" for index in range(4)]
+PAIR_DELAY_SECONDS = 0.2
+
+
+class StubState:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.pair_requests = 0
+        self.profile_requests = 0
+        self.not_modified = 0
+
+
+def build_handler(state: StubState) -> type[BaseHTTPRequestHandler]:
+    class StubHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # noqa: A002, ANN001
+            return
+
+        def _write_json(self, payload, etag: str | None = None) -> None:  # noqa: ANN001
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if etag:
+                self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path == "/token-profiles/latest/v1":
+                with state.lock:
+                    state.profile_requests += 1
+                self._write_json(
+                    [{"chainId": "base", "tokenAddress": token} for token in TOKENS]
+                    + [{"chainId": "solana", "tokenAddress": token} for token in SOLANA_TOKENS]
+                )
+                return
+
+            chain_id, token_address = self.path.rsplit("/", 2)[-2:]
+            etag = f'"v1-{token_address}"'
+            with state.lock:
+                state.pair_requests += 1
+                if self.headers.get("If-None-Match") == etag:
+                    state.not_modified += 1
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            try:
+                time.sleep(PAIR_DELAY_SECONDS)
+                if token_address.endswith("05"):
+                    self._write_json([])
+                    return
+                self._write_json(
+                    [
+                        {
+                            "chainId": chain_id,
+                            "pairAddress": f"pair-{token_address}",
+                            "dexId": "uniswap",
+                            "baseToken": {"address": token_address, "symbol": "DOG"},
+                            "quoteToken": {"symbol": "WETH"},
+                            "priceUsd": "0.001",
+                            "liquidity": {"usd": 50000},
+                            "volume": {"h24": 90000},
+                            "txns": {"h1": {"buys": 10, "sells": 5}},
+                            "priceChange": {"h1": 3.5, "h24": 9.0},
+                            "pairCreatedAt": 1_700_000_000_000,
+                        }
+                    ],
+                    etag=etag,
+                )
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+    return StubHandler
+
+
+class DexscreenerClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state = StubState()
+        self.base_url = serve(self, build_handler(self.state))
+
+    def test_fetch_new_pairs_is_concurrent_bounded_and_ordered(self) -> None:
+        client = DexscreenerClient(timeout_seconds=5, max_concurrency=6, base_url=self.base_url)
+
+        started = time.monotonic()
+        pairs = client.fetch_new_pairs(chain_id="base", max_tokens=40)
+        elapsed = time.monotonic() - started
+
+        expected = [f"pair-{token}" for token in TOKENS if not token.endswith("05")]
+        self.assertEqual([pair.pair_address for pair in pairs], expected)
+        self.assertEqual(self.state.pair_requests, len(TOKENS))
+        self.assertLessEqual(self.state.max_in_flight, 6)
+        self.assertGreater(self.state.max_in_flight, 1)
+        # Serial would be 12 * 0.2s; two waves of six is ~0.4s.
+        self.assertLess(elapsed, len(TOKENS) * PAIR_DELAY_SECONDS / 2)
+
+    def test_serial_mode_keeps_single_request_in_flight(self) -> None:
+        client = DexscreenerClient(timeout_seconds=5, max_concurrency=1, base_url=self.base_url)
+
+        pair_lists = client.fetch_pairs_for_tokens(chain_id="base", token_addresses=TOKENS[:3])
+
+        self.assertEqual([len(pairs) for pairs in pair_lists], [1, 1, 1])
+        self.assertEqual(self.state.max_in_flight, 1)
+
+
+class MultiChainTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state = StubState()
+        self.base_url = serve(self, build_handler(self.state))
+
+    def test_chains_share_one_profiles_request_and_fetch_in_parallel(self) -> None:
+        client = DexscreenerClient(timeout_seconds=5, max_concurrency=4, base_url=self.base_url, chain_count=2)
+
+        pairs_by_chain = client.fetch_new_pairs_by_chain(["base", "solana"], max_tokens=40)
+
+        self.assertEqual(
+            [pair.pair_address for pair in pairs_by_chain["base"]],
+            [f"pair-{token}" for token in TOKENS if not token.endswith("05")],
+        )
+        self.assertEqual([pair.pair_address for pair in pairs_by_chain["solana"]], [f"pair-{t}" for t in SOLANA_TOKENS])
+        self.assertEqual({pair.chain_id for pair in pairs_by_chain["solana"]}, {"solana"})
+        self.assertEqual(self.state.profile_requests, 1)
+        # Each chain has its own budget of four, so both run at once.
+        self.assertGreater(self.state.max_in_flight, 4)
+        self.assertLessEqual(self.state.max_in_flight, 8)
+
+    def test_pipeline_reports_per_chain_stats(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings = replace(
+                build_settings(Path(tmpdir) / "dog_scout.db", llm_enabled=False),
+                use_mock_data=False,
+                chain_ids={"solana", "base"},
+                top_n=20,
+            )
+            db = Database(settings.db_path)
+            db.ensure_initialized()
+            try:
+                client = DexscreenerClient(timeout_seconds=5, max_concurrency=4, base_url=self.base_url)
+                result = ScoutPipeline(settings=settings, db=db, client=client).run_once()
+            finally:
+                db.close()
+
+        self.assertEqual(list(result.per_chain), ["base", "solana"])
+        self.assertEqual((result.per_chain["base"].fetched_pairs, result.per_chain["solana"].fetched_pairs), (11, 4))
+        self.assertEqual(result.fetched_pairs, 15)
+        for name in ("passed_filters", "selected"):
+            self.assertEqual(sum(getattr(stats, name) for stats in result.per_chain.values()), getattr(result, name))
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state = StubState()
+        self.base_url = serve(self, build_handler(self.state))
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _client(self, cache, ttl: float) -> DexscreenerClient:  # noqa: ANN001
+        return DexscreenerClient(
+            timeout_seconds=5,
+            max_concurrency=4,
+            base_url=self.base_url,
+            cache=cache,
+            cache_ttl_seconds={DexscreenerClient.TOKEN_PAIRS: ttl},
+        )
+
+    def test_repeat_tokens_within_ttl_skip_the_network(self) -> None:
+        client = self._client(MemoryResponseCache(), ttl=300)
+
+        first = client.fetch_pairs_for_tokens("base", TOKENS[:4])
+        second = client.fetch_pairs_for_tokens("base", [token.upper() for token in TOKENS[:4]])
+
+        self.assertEqual(
+            [[pair.pair_address for pair in pairs] for pairs in second],
+            [[pair.pair_address for pair in pairs] for pairs in first],
+        )
+        self.assertEqual(self.state.pair_requests, 4)
+        self.assertEqual(client.cache_stats.snapshot(), {"hits": 4, "revalidated": 0, "misses": 4})
+
+    def test_stale_entries_are_revalidated_with_etag(self) -> None:
+        client = self._client(MemoryResponseCache(), ttl=0)
+
+        client.fetch_token_pairs("base", TOKENS[0])
+        pairs = client.fetch_token_pairs("base", TOKENS[0])
+        # An explicit max age bypasses a long TTL, as rechecks do.
+        client.cache_ttl_seconds[DexscreenerClient.TOKEN_PAIRS] = 300
+        client.fetch_token_pairs("base", TOKENS[0], max_age_seconds=0)
+
+        self.assertEqual([pair.pair_address for pair in pairs], [f"pair-{TOKENS[0]}"])
+        self.assertEqual(self.state.pair_requests, 3)
+        self.assertEqual(self.state.not_modified, 2)
+        self.assertEqual(client.cache_stats.snapshot(), {"hits": 0, "revalidated": 2, "misses": 1})
+
+    def test_disk_tier_survives_a_new_client(self) -> None:
+        path = Path(self.tmpdir.name) / "http_cache.db"
+        self._client(build_response_cache(16, path), ttl=300).fetch_token_pairs("base", TOKENS[1])
+
+        fresh = self._client(build_response_cache(16, path), ttl=300)
+        pairs = fresh.fetch_token_pairs("base", TOKENS[1])
+
+        self.assertEqual([pair.pair_address for pair in pairs], [f"pair-{TOKENS[1]}"])
+        self.assertEqual(self.state.pair_requests, 1)
+        self.assertEqual(fresh.cache_stats.hits, 1)
+
+    def test_memory_cache_evicts_least_recently_used(self) -> None:
+        cache = MemoryResponseCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.put(key, CachedResponse(payload=[key], stored_at=0.0))
+        cache.get("a")
+        cache.put("c", CachedResponse(payload=["c"], stored_at=0.0))
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a").payload, ["a"])
+        self.assertEqual(len(cache), 2)
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_bucket_allows_burst_then_throttles(self) -> None:
+        bucket = TokenBucket(rate_per_second=20.0, burst=2)
+
+        started = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        elapsed = time.monotonic() - started
+
+        # Two tokens are free, four more need ~0.2s of refill.
+        self.assertGreaterEqual(elapsed, 0.15)
+
+    def test_disabled_bucket_never_waits(self) -> None:
+        bucket = TokenBucket(rate_per_second=0.0)
+        self.assertEqual(sum(bucket.acquire() for _ in range(100)), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from dog_scout.features import FeatureEngine
+from dog_scout.models import TrendFeatures
+from dog_scout.pipeline import ScoutPipeline
+from dog_scout.scoring import score_pair
+from dog_scout.storage import Database
+
+from test_day2_features import build_settings
+from test_storage import build_candidate
+
+T = 1_772_366_400.0
+
+
+def feed(engine: FeatureEngine, points: list[tuple[float, float, float, int, int]]) -> TrendFeatures:
+    features = None
+    for ts, liquidity, price, buys, sells in points:
+        features = engine.observe("0xpair", ts, liquidity, price, buys, sells)
+    return features
+
+
+class FeatureEngineTests(unittest.TestCase):
+    def test_rising_pair_has_positive_trend_features(self) -> None:
+        engine = FeatureEngine(halflife_seconds=600, max_age_seconds=3600)
+
+        features = feed(
+            engine,
+            [
+                (T, 50_000, 1.00, 20, 20),
+                (T + 120, 51_000, 1.10, 30, 20),
+                (T + 240, 52_020, 1.20, 45, 15),
+            ],
+        )
+
+        self.assertEqual(features.samples, 3)
+        self.assertAlmostEqual(features.liquidity_slope, 0.01)
+        self.assertGreater(features.txn_acceleration, 0)
+        self.assertAlmostEqual(features.buy_sell_imbalance, 0.5)
+        self.assertTrue(1.00 < features.price_ewma < 1.20)
+        self.assertGreater(features.price_vs_ewma, 0)
+
+    def test_duplicates_are_ignored_and_stale_pairs_restart(self) -> None:
+        engine = FeatureEngine(halflife_seconds=600, max_age_seconds=600)
+        feed(engine, [(T, 50_000, 1.0, 10, 10), (T + 60, 55_000, 1.0, 10, 10)])
+
+        self.assertEqual(engine.observe("0xpair", T + 60, 90_000, 2.0, 1, 1).samples, 2)
+        restarted = engine.observe("0xpair", T + 60 + 601, 40_000, 0.5, 10, 10)
+        self.assertEqual((restarted.samples, restarted.liquidity_slope, restarted.price_ewma), (1, 0.0, 0.5))
+
+    def test_rebuild_from_snapshots_matches_live_state(self) -> None:
+        points = [(T + 90 * step, 40_000 + 900 * step, 1.0 + 0.03 * step, 10 + step, 12) for step in range(6)]
+        live = FeatureEngine()
+        expected = feed(live, points)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = Database(Path(tmpdir) / "dog_scout.db")
+            db.ensure_initialized()
+            try:
+                with db.connect() as conn:
+                    conn.executemany(
+                        """
+                        INSERT INTO pair_snapshots (
+                            pair_address, fetched_at, chain_id, liquidity_usd, price_usd, volume_h24,
+                            txns_h1_buys, txns_h1_sells
+                        )
+                        VALUES ('0xpair', ?, 'base', ?, ?, 0, ?, ?)
+                        """,
+                        points + [(T - 7200, 1.0, 1.0, 0, 0)],
+                    )
+                rebuilt = FeatureEngine()
+                rows = rebuilt.rebuild(db, now=T + 600)
+            finally:
+                db.close()
+
+        # The snapshot older than max_age is not replayed.
+        self.assertEqual(rows, len(points))
+        self.assertEqual(rebuilt.get("0xpair"), expected)
+
+
+class TrendScoringTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pair = build_candidate(1).pair
+        self.bullish = TrendFeatures(
+            samples=4,
+            liquidity_slope=0.02,
+            txn_acceleration=20.0,
+            buy_sell_imbalance=0.6,
+            price_ewma=0.0009,
+            price_vs_ewma=0.11,
+        )
+
+    def test_trend_component_is_off_by_default(self) -> None:
+        settings = build_settings(Path("./unused.db"))
+
+        self.assertEqual(score_pair(self.pair, settings, self.bullish), score_pair(self.pair, settings))
+        self.assertIsNone(score_pair(self.pair, settings).trend_score)
+
+    def test_trend_weight_blends_trend_score(self) -> None:
+        settings = replace(build_settings(Path("./unused.db")), trend_weight=0.25)
+        base = score_pair(self.pair, settings)
+
+        scored = score_pair(self.pair, settings, self.bullish)
+        cold = score_pair(self.pair, settings, replace(self.bullish, samples=1))
+
+        self.assertEqual(scored.trend_score, 96.0)
+        self.assertAlmostEqual(scored.final_score, round(base.final_score * 0.75 + 96.0 * 0.25, 2))
+        self.assertEqual(scored.rule_score, scored.final_score)
+        self.assertEqual(cold, base)
+
+    def test_pipeline_feeds_and_rebuilds_feature_state(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings = replace(build_settings(Path(tmpdir) / "dog_scout.db", llm_enabled=False), trend_weight=0.2)
+            db = Database(settings.db_path)
+            db.ensure_initialized()
+            try:
+                pipeline = ScoutPipeline(settings=settings, db=db)
+                first = pipeline.run_once()
+                pipeline.run_once()
+                restarted = ScoutPipeline(settings=settings, db=db)
+            finally:
+                db.close()
+
+        self.assertEqual(len(pipeline.features), first.fetched_pairs)
+        self.assertEqual(len(restarted.features), first.fetched_pairs)
+        for pair_address in pipeline.features._states:
+            self.assertEqual(restarted.features.get(pair_address).samples, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import json
+import tempfile
+import unittest
+import urllib.request
+from dataclasses import replace
+from pathlib import Path
+
+from dog_scout.metrics import MetricsRegistry, MetricsServer, RollingSummary
+from dog_scout.pipeline import ScoutPipeline
+from dog_scout.storage import Database
+
+from test_day2_features import build_settings
+
+
+class RollingSummaryTests(unittest.TestCase):
+    def test_nearest_rank_quantiles_over_window(self) -> None:
+        summary = RollingSummary(window=100)
+        for value in range(1, 201):
+            summary.observe(float(value))
+
+        # Only the last 100 observations (101..200) feed the quantiles.
+        self.assertEqual(summary.quantile(0.5), 150.0)
+        self.assertEqual(summary.quantile(0.95), 195.0)
+        self.assertEqual(summary.quantile(0.99), 199.0)
+        self.assertEqual(summary.count, 200)
+        self.assertEqual(summary.total, sum(range(1, 201)))
+
+
+class MetricsRegistryTests(unittest.TestCase):
+    def test_prometheus_text_is_served_over_http(self) -> None:
+        registry = MetricsRegistry()
+        registry.observe_stages({"fetch": 0.5, "notify": 0.1})
+        registry.observe_stages({"fetch": 1.5})
+        server = MetricsServer(registry, port=0).start()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+                body = response.read().decode("utf-8")
+        finally:
+            server.stop()
+
+        self.assertIn("# TYPE dog_scout_stage_seconds summary", body)
+        self.assertIn('dog_scout_stage_seconds{stage="fetch",quantile="0.99"} 1.500000', body)
+        self.assertIn('dog_scout_stage_seconds_count{stage="fetch"} 2', body)
+        self.assertIn('dog_scout_stage_seconds_sum{stage="notify"} 0.100000', body)
+
+
+class PipelineTimingTests(unittest.TestCase):
+    def test_run_once_reports_stage_timings_and_writes_jsonl(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            metrics_path = Path(tmpdir) / "metrics" / "cycles.jsonl"
+            settings = replace(
+                build_settings(Path(tmpdir) / "dog_scout.db"),
+                metrics_jsonl_path=str(metrics_path),
+            )
+            db = Database(settings.db_path)
+            db.ensure_initialized()
+            try:
+                pipeline = ScoutPipeline(settings=settings, db=db)
+                first = pipeline.run_once()
+                pipeline.run_once()
+            finally:
+                db.close()
+
+            records = [json.loads(line) for line in metrics_path.read_text(encoding="utf-8").splitlines()]
+
+        expected_stages = {
+            "rechecks",
+            "fetch",
+            "risk",
+            "filters",
+            "rule_score",
+            "analyzer",
+            "db_writes",
+            "select",
+            "notify",
+            "total",
+        }
+        self.assertEqual(set(first.stage_timings), expected_stages)
+        self.assertGreaterEqual(first.stage_timings["total"], first.stage_timings["fetch"])
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["selected"], first.selected)
+        self.assertEqual(set(records[0]["stage_seconds"]), expected_stages)
+
+        totals = {item["labels"]["stage"]: item for item in pipeline.metrics.snapshot()["dog_scout_stage_seconds"]}
+        self.assertEqual(totals["total"]["count"], 2)
+        self.assertIn("p95", totals["analyzer"])
+
+
+if __name__ == "__main__":
+    unittest.main()
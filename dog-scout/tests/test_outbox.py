@@ -0,0 +1,145 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+from dog_scout.notifier import TelegramNotifier
+from dog_scout.outbox import TELEGRAM_MAX_MESSAGE_CHARS, OutboxSender
+from dog_scout.pipeline import ScoutPipeline
+from dog_scout.storage import Database
+
+from stub_server import serve
+from test_day2_features import build_settings
+
+
+class TelegramStub:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.posts: list[dict] = []
+        self.post_times: list[float] = []
+        # (status, body) served in order; 200 once exhausted.
+        self.responses: list[tuple[int, dict]] = []
+
+
+def build_handler(stub: TelegramStub) -> type[BaseHTTPRequestHandler]:
+    class StubHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # noqa: A002, ANN001
+            return
+
+        def do_POST(self) -> None:  # noqa: N802
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with stub.lock:
+                stub.posts.append(payload)
+                stub.post_times.append(time.monotonic())
+                status, body = stub.responses.pop(0) if stub.responses else (200, {"ok": True})
+            encoded = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+    return StubHandler
+
+
+class OutboxTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stub = TelegramStub()
+        base_url = serve(self, build_handler(self.stub))
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.settings = replace(
+            build_settings(Path(self.tmpdir.name) / "dog_scout.db", llm_enabled=False),
+            dry_run=False,
+            telegram_enabled=True,
+            telegram_bot_token="TOKEN",
+            telegram_chat_id="42",
+            notify_mode="outbox",
+        )
+        self.db = Database(self.settings.db_path)
+        self.db.ensure_initialized()
+        self.notifier = TelegramNotifier(self.settings, base_url=base_url)
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def _sender(self, **overrides) -> OutboxSender:  # noqa: ANN003
+        options = {"rate_limit_per_second": 0.0, "backoff_seconds": 1.0}
+        options.update(overrides)
+        return OutboxSender(self.db, self.notifier, **options)
+
+    def _rows(self, sql: str) -> list[tuple]:
+        with self.db.connect() as conn:
+            return [tuple(row) for row in conn.execute(sql).fetchall()]
+
+    def test_scan_only_queues_and_sender_coalesces_the_cycle(self) -> None:
+        result = ScoutPipeline(settings=self.settings, db=self.db, notifier=self.notifier).run_once()
+
+        self.assertEqual(result.selected, 3)
+        self.assertEqual(self.stub.posts, [])
+        self.assertEqual(self._rows("SELECT DISTINCT status FROM alerts"), [("queued",)])
+
+        posted = self._sender(coalesce=True).run_once()
+
+        self.assertEqual(posted, 1)
+        self.assertEqual(self.stub.posts[0]["chat_id"], "42")
+        self.assertEqual(self.stub.posts[0]["text"], "\n\n".join(result.messages))
+        self.assertEqual(self._rows("SELECT DISTINCT status FROM notification_outbox"), [("sent",)])
+        self.assertEqual(self._rows("SELECT status, sent_at IS NOT NULL FROM alerts GROUP BY 1, 2"), [("sent", 1)])
+
+    def test_coalesced_batches_split_at_telegram_length_limit(self) -> None:
+        for _ in range(3):
+            self.db.enqueue_notification("42", "x" * (TELEGRAM_MAX_MESSAGE_CHARS // 2 - 48), batch_key="cycle")
+
+        self.assertEqual(self._sender(coalesce=True).run_once(), 2)
+        self.assertEqual([len(post["text"]) for post in self.stub.posts], [2000 + 2 + 2000, 2000])
+
+    def test_429_pauses_the_chat_without_spending_attempts(self) -> None:
+        self.stub.responses = [(429, {"ok": False, "parameters": {"retry_after": 30}})]
+        for index in range(3):
+            self.db.enqueue_notification("42", f"alert {index}")
+        self.db.enqueue_notification("7", "other chat")
+
+        posted = self._sender().run_once()
+
+        self.assertEqual(posted, 1)
+        self.assertEqual([post["chat_id"] for post in self.stub.posts], ["42", "7"])
+        pending = self._rows(
+            "SELECT attempts, (julianday(next_attempt_at) - julianday('now')) * 86400 > 25 "
+            "FROM notification_outbox WHERE status = 'pending'"
+        )
+        self.assertEqual(pending, [(0, 1)] * 3)
+
+    def test_failures_back_off_then_give_up(self) -> None:
+        self.stub.responses = [(500, {"ok": False})] * 2
+        self.db.enqueue_notification("42", "alert")
+        sender = self._sender(max_attempts=2)
+
+        sender.run_once()
+        self.assertEqual(self._rows("SELECT status, attempts FROM notification_outbox"), [("pending", 1)])
+        self.assertEqual(sender.run_once(), 0)  # not due yet
+
+        with self.db.connect() as conn:
+            conn.execute("UPDATE notification_outbox SET next_attempt_at = '2000-01-01 00:00:00'")
+        sender.run_once()
+
+        self.assertEqual(len(self.stub.posts), 2)
+        self.assertEqual(self._rows("SELECT status, attempts FROM notification_outbox"), [("failed", 2)])
+
+    def test_sends_are_paced_per_chat(self) -> None:
+        for index in range(4):
+            self.db.enqueue_notification("42", f"alert {index}")
+
+        self._sender(rate_limit_per_second=10.0, rate_limit_burst=1).run_once()
+
+        # One token up front, three refills at 10/s.
+
+        self.assertGreaterEqual(self.stub.post_times[-1] - self.stub.post_times[0], 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
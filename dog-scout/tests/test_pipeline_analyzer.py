@@ -0,0 +1,117 @@
+import tempfile
+import threading
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from dog_scout.analyzer import AnalyzerInput, AnalyzerOutput, MockAnalyzer
+from dog_scout.pipeline import ScoutPipeline
+from dog_scout.storage import Database
+
+from test_day2_features import build_settings
+
+
+class RecordingAnalyzer:
+    provider = "mock"
+    model = "mock-v1"
+
+    def __init__(self, latency_seconds: float = 0.0) -> None:
+        self.inner = MockAnalyzer(latency_seconds=latency_seconds)
+        self.lock = threading.Lock()
+        self.tokens: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def analyze(self, payload: AnalyzerInput) -> AnalyzerOutput:
+        with self.lock:
+            self.tokens.append(payload.token_address)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return self.inner.analyze(payload)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class ConcurrentAnalyzerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.base_settings = build_settings(Path(self.tmpdir.name) / "unused.db")
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _run(self, analyzer: RecordingAnalyzer, name: str, **overrides) -> tuple[object, list[dict]]:  # noqa: ANN003
+        settings = replace(self.base_settings, db_path=Path(self.tmpdir.name) / f"{name}.db", **overrides)
+        db = Database(settings.db_path)
+        db.ensure_initialized()
+        pipeline = ScoutPipeline(settings=settings, db=db, analyzer=analyzer)
+        try:
+            result = pipeline.run_once()
+            with db.connect() as conn:
+                rows = [
+                    dict(row)
+                    for row in conn.execute(
+                        """
+                        SELECT p.token_address, s.final_score, s.rule_score, s.llm_score, s.llm_failed
+                        FROM signals s JOIN pairs_raw p ON p.id = s.pair_raw_id
+                        ORDER BY s.id
+                        """
+                    )
+                ]
+        finally:
+            pipeline.close()
+            db.close()
+        return result, rows
+
+    def test_parallel_calls_are_capped_and_merge_like_serial(self) -> None:
+        serial_analyzer = RecordingAnalyzer(latency_seconds=0.05)
+        parallel_analyzer = RecordingAnalyzer(latency_seconds=0.2)
+
+        _, serial_rows = self._run(serial_analyzer, "serial", llm_max_in_flight=1)
+        result, parallel_rows = self._run(parallel_analyzer, "parallel", llm_max_in_flight=3)
+
+        self.assertEqual(parallel_rows, serial_rows)
+        self.assertEqual(serial_analyzer.max_in_flight, 1)
+        self.assertEqual(parallel_analyzer.max_in_flight, 3)
+        # Six pairs in two waves of three instead of six sequential calls.
+        self.assertLess(result.stage_timings["analyzer"], 6 * 0.2 * 0.75)
+
+    def test_deadline_falls_back_to_rule_score(self) -> None:
+        analyzer = RecordingAnalyzer(latency_seconds=0.3)
+
+        result, rows = self._run(analyzer, "deadline", llm_max_in_flight=2, llm_cycle_deadline_seconds=0.1)
+
+        self.assertLess(result.stage_timings["analyzer"], 0.3)
+        self.assertGreater(result.selected, 0)
+        self.assertTrue(all(row["llm_failed"] == 1 for row in rows))
+        self.assertTrue(all(row["final_score"] == row["rule_score"] for row in rows))
+        # Queued calls were cancelled rather than sent after the deadline.
+        self.assertEqual(len(analyzer.tokens), 2)
+
+    def test_passed_gate_skips_filtered_pairs(self) -> None:
+        analyzer = RecordingAnalyzer()
+
+        result, rows = self._run(analyzer, "passed", llm_gate="passed")
+
+        analyzed = {row["token_address"] for row in rows if row["llm_score"] is not None}
+        self.assertEqual(set(analyzer.tokens), analyzed)
+        self.assertEqual(len(analyzed), result.passed_filters)
+        self.assertLess(len(analyzed), len(rows))
+        self.assertTrue(all(row["llm_failed"] == 0 for row in rows))
+
+    def test_top_k_gate_analyzes_best_rule_scores_only(self) -> None:
+        analyzer = RecordingAnalyzer()
+
+        _, rows = self._run(analyzer, "top_k", llm_gate="top_k", llm_top_k=2)
+
+        self.assertEqual(len(analyzer.tokens), 2)
+        analyzed = [row for row in rows if row["llm_score"] is not None]
+        skipped_rule_scores = [row["rule_score"] for row in rows if row["llm_score"] is None]
+        self.assertEqual({row["token_address"] for row in analyzed}, set(analyzer.tokens))
+        self.assertGreaterEqual(min(row["rule_score"] for row in analyzed), max(skipped_rule_scores))
+
+
+if __name__ == "__main__":
+    unittest.main()
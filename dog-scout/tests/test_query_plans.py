@@ -0,0 +1,224 @@
+import inspect
+import re
+import tempfile
+import time
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+from dog_scout.models import ScoreTimeline
+from dog_scout.storage import Database
+
+from test_storage import build_candidate
+
+TOKENS = 400
+SIGHTINGS_PER_TOKEN = 10
+
+# Queries that read a whole table by design; any other full scan is a regression.
+ALLOWED_SCANS = {
+    "ensure_initialized": {"applied_migrations"},
+    "list_trade_feedback": {"f"},
+    "iter_pair_snapshots_since": {"pair_snapshots"},
+}
+# Methods that only run pragmas/maintenance statements.
+NOT_QUERIES = {"enable_incremental_vacuum", "incremental_vacuum"}
+# Per-alert/per-token lookups on the scan and recheck paths must not touch the table at all.
+COVERED = {
+    "has_recent_alert": "alerts",
+    "load_recheck_context": "rr",
+}
+
+_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW)(\w+)")
+
+
+def seed_database(db: Database) -> None:
+    """A few thousand rows per hot table, with repeat sightings and mostly finished queues."""
+    candidates = [
+        build_candidate(token + TOKENS * sighting)
+        for sighting in range(SIGHTINGS_PER_TOKEN)
+        for token in range(TOKENS)
+    ]
+    for candidate in candidates:
+        # Repeat sightings of the same token/pair, as successive scans produce.
+        index = candidate.pair.raw["index"] % TOKENS
+        candidate.pair = replace(
+            candidate.pair,
+            pair_address=f"0xpair{index}",
+            base_token_address=f"0xtoken{index}",
+        )
+    for start in range(0, len(candidates), 500):
+        db.insert_scan_results(candidates[start : start + 500])
+
+    with db.batch():
+        alerts = [
+            (db.insert_alert(candidate, "alert", True, "dry_run", False), candidate) for candidate in candidates[::4]
+        ]
+        for alert_id, candidate in alerts:
+            db.enqueue_recheck_jobs(candidate, alert_id, (5, 15))
+            db.enqueue_notification("chat", "alert", alert_id=alert_id)
+        # Most of the outbox has been delivered, as in a long-running database.
+        db.complete_notifications(range(1, len(alerts) - 20), "sent", True)
+        for alert_id, _ in alerts[::3]:
+            db.put_llm_cache(f"key{alert_id}", "mock", "mock", "{}", ttl_seconds=3600)
+    with db.connect() as conn:
+        conn.execute("UPDATE recheck_jobs SET due_at = datetime('now', '-1 minutes')")
+        conn.executemany(
+            "INSERT INTO trade_feedback (alert_id, outcome, pnl_pct, holding_minutes) VALUES (?, 'win', 12.5, 30)",
+            [(alert_id,) for alert_id, _ in alerts[::5]],
+        )
+
+    by_signal = {candidate.signal_id: candidate for candidate in candidates}
+    jobs = db.claim_due_recheck_jobs(limit=len(alerts))
+    with db.batch():
+        for job in jobs:
+            candidate = by_signal[job.source_signal_id]
+            timeline = ScoreTimeline(initial_score=candidate.score.final_score)
+            db.insert_recheck_result(job, candidate, "stable", timeline, 0.0, 0.0, "recheck")
+            db.mark_recheck_job_done(job.id)
+
+
+class QueryPlanTests(unittest.TestCase):
+    """Plans as a live database sees them: dog_scout never runs ANALYZE, so there are no statistics."""
+
+    analyze = False
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.db = Database(Path(cls.tmpdir.name) / "dog_scout.db")
+        cls.db.ensure_initialized()
+        seed_database(cls.db)
+        if cls.analyze:
+            with cls.db.connect() as conn:
+                conn.execute("ANALYZE")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.db.close()
+        cls.tmpdir.cleanup()
+
+    def _calls(self) -> dict[str, Callable[[], object]]:
+        db = self.db
+        now = datetime.now(timezone.utc)
+        candidate = build_candidate(7)
+        candidate.signal_id = 1
+        job = db.claim_due_recheck_jobs(limit=1)[0]
+        outbox = db.claim_due_notifications(limit=1)[0].id
+        return {
+            "ensure_initialized": db.ensure_initialized,
+            "warm_alert_index": lambda: db.warm_alert_index(ttl_minutes=60),
+            "refresh_alert_index": db.refresh_alert_index,
+            "insert_pair_raw": lambda: db.insert_pair_raw(candidate.pair),
+            "insert_signal": lambda: db.insert_signal(
+                1, candidate.pair, candidate.risk, candidate.filter_outcome, candidate.score
+            ),
+            "insert_scan_results": lambda: db.insert_scan_results([build_candidate(TOKENS + 1)]),
+            "has_recent_alert": lambda: self._without_alert_index(
+                lambda: db.has_recent_alert("0xtoken7", "0xpair7", cooldown_minutes=30)
+            ),
+            "insert_alert": lambda: db.insert_alert(candidate, "alert", True, "dry_run", False),
+            "enqueue_notification": lambda: db.enqueue_notification("chat", "alert", alert_id=1),
+            "claim_due_notifications": lambda: db.claim_due_notifications(limit=10),
+            "complete_notifications": lambda: db.complete_notifications([outbox], "sent", True),
+            "retry_notifications": lambda: db.retry_notifications([outbox], 30.0, "error"),
+            "fail_notifications": lambda: db.fail_notifications([outbox], "error"),
+            "release_claimed_notifications": db.release_claimed_notifications,
+            "enqueue_recheck_jobs": lambda: db.enqueue_recheck_jobs(candidate, 1, (1,)),
+            "claim_due_recheck_jobs": lambda: db.claim_due_recheck_jobs(limit=10),
+            "claim_recheck_jobs": lambda: db.claim_recheck_jobs([job.id + 1, job.id + 2]),
+            "list_pending_recheck_jobs": lambda: db.list_pending_recheck_jobs(after_id=job.id),
+            "mark_recheck_job_done": lambda: db.mark_recheck_job_done(job.id),
+            "mark_recheck_job_failed": lambda: db.mark_recheck_job_failed(job.id, "error"),
+            "retry_recheck_job": lambda: db.retry_recheck_job(job.id, 30.0, "error"),
+            "reap_expired_recheck_leases": lambda: db.reap_expired_recheck_leases(max_attempts=3),
+            "insert_recheck_result": lambda: db.insert_recheck_result(
+                job, candidate, "stable", ScoreTimeline(initial_score=60.0), 0.0, 0.0, "recheck"
+            ),
+            "load_recheck_context": lambda: db.load_recheck_context([job.id, job.id + 1, job.id + 2]),
+            "iter_replay_rows": lambda: list(db.iter_replay_rows(now - timedelta(minutes=5), now)),
+            "list_initial_alerts": lambda: db.list_initial_alerts(now - timedelta(minutes=5), now),
+            "list_trade_feedback": db.list_trade_feedback,
+            "get_llm_cache": lambda: db.get_llm_cache("key1"),
+            "put_llm_cache": lambda: db.put_llm_cache("key1", "mock", "mock", "{}", ttl_seconds=60),
+            "prune_llm_cache": db.prune_llm_cache,
+            "list_pairs_raw_before": lambda: db.list_pairs_raw_before(now, after_id=100, limit=50),
+            "delete_pairs_raw": lambda: db.delete_pairs_raw([1, 2]),
+            "list_pair_snapshots": lambda: db.list_pair_snapshots(["0xpair1"], time.time() - 60, time.time()),
+            "iter_pair_snapshots_since": lambda: list(db.iter_pair_snapshots_since(time.time() - 60)),
+        }
+
+    def _without_alert_index(self, call: Callable[[], object]) -> object:
+        index, self.db.alert_index = self.db.alert_index, None
+        try:
+            return call()
+        finally:
+            self.db.alert_index = index
+
+    def _trace(self, call: Callable[[], object]) -> list[str]:
+        statements: list[str] = []
+        with self.db.connect() as conn, self.db.reader() as read_conn:
+            for connection in (conn, read_conn):
+                connection.set_trace_callback(statements.append)
+            try:
+                result = call()
+                if inspect.isgenerator(result):
+                    list(result)
+            finally:
+                for connection in (conn, read_conn):
+                    connection.set_trace_callback(None)
+        return [
+            statement
+            for statement in statements
+            if re.match(r"\s*(SELECT|UPDATE|DELETE|INSERT|WITH)\b", statement, re.IGNORECASE)
+        ]
+
+    def _plan(self, statement: str) -> list[str]:
+        with self.db.reader() as conn:
+            return [row["detail"] for row in conn.execute(f"EXPLAIN QUERY PLAN {statement}")]
+
+    def _full_scans(self, statement: str) -> set[str]:
+        return {match.group(1) for detail in self._plan(statement) if (match := _SCAN.match(detail))}
+
+    def test_every_storage_query_is_covered(self) -> None:
+        query_methods = {
+            name
+            for name, member in inspect.getmembers(Database, inspect.isfunction)
+            if not name.startswith("_") and "conn.execute" in inspect.getsource(member)
+        }
+
+        self.assertEqual(query_methods - NOT_QUERIES - set(self._calls()), set())
+
+    def test_no_unexpected_full_table_scans(self) -> None:
+        for name, call in self._calls().items():
+            with self.subTest(method=name):
+                statements = self._trace(call)
+                self.assertTrue(statements, f"{name} ran no SQL")
+                for statement in statements:
+                    scans = self._full_scans(statement) - ALLOWED_SCANS.get(name, set())
+                    self.assertEqual(scans, set(), f"{name} scans {sorted(scans)}:\n{statement}")
+
+    def test_hot_lookups_use_covering_indexes(self) -> None:
+        calls = self._calls()
+        for name, table in COVERED.items():
+            with self.subTest(method=name):
+                searches = [
+                    detail
+                    for statement in self._trace(calls[name])
+                    for detail in self._plan(statement)
+                    if detail.startswith(f"SEARCH {table} ")
+                ]
+                self.assertTrue(searches)
+                for detail in searches:
+                    self.assertIn("USING COVERING INDEX", detail)
+
+
+class AnalyzedQueryPlanTests(QueryPlanTests):
+    """Same checks once the planner has statistics (e.g. after a manual ANALYZE)."""
+
+    analyze = True
+
+
+if __name__ == "__main__":
+    unittest.main()
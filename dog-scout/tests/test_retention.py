@@ -0,0 +1,142 @@
+import itertools
+import tempfile
+import unittest
+from dataclasses import replace
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from dog_scout.backtest import iter_archive_replay_rows, iter_db_replay_rows, run_backtest
+from dog_scout.models import Candidate
+from dog_scout.retention import archive_pairs_raw, iter_archive_records, pa, run_retention
+from dog_scout.storage import Database
+
+from test_backtest import T0, build_candidate, build_settings
+
+
+class RetentionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.archive_dir = Path(self.tmpdir.name) / "archive"
+        self.db_path = Path(self.tmpdir.name) / "dog_scout.db"
+        self.db = Database(self.db_path)
+        self.db.ensure_initialized()
+        self.settings = build_settings(self.db_path)
+
+        self._insert_cycle(T0, [build_candidate(name, 90_000 - i * 20_000, 60) for i, name in enumerate("ABCD")])
+        self._insert_cycle(T0 + timedelta(minutes=2), [build_candidate("C", 26_000, 12)])
+        self._insert_cycle(T0 + timedelta(minutes=6), [build_candidate("A", 120_000, 90)])
+        # Next day, so archives span two date partitions; stays in the live DB.
+        self._insert_cycle(T0 + timedelta(days=1), [build_candidate("E", 30_000, 20)])
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def _insert_cycle(self, fetched_at: datetime, candidates: list[Candidate]) -> None:
+        self.db.insert_scan_results(candidates)
+        with self.db.connect() as conn:
+            conn.executemany(
+                "UPDATE pairs_raw SET fetched_at = ? WHERE id = ?",
+                [(fetched_at.strftime("%Y-%m-%d %H:%M:%S"), c.pair_raw_id) for c in candidates],
+            )
+
+    def _pairs_raw_count(self) -> int:
+        with self.db.connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM pairs_raw").fetchone()[0]
+
+    def test_archive_moves_old_rows_and_replay_is_unchanged(self) -> None:
+        expected_alerts = []
+        expected = run_backtest(self.db, self.settings, alert_sink=expected_alerts.append)
+
+        report = archive_pairs_raw(
+            self.db,
+            self.archive_dir,
+            older_than_days=1,
+            chunk_rows=4,
+            now=T0 + timedelta(days=1, minutes=10),
+        )
+
+        self.assertEqual((report.archived_rows, report.deleted_rows), (6, 6))
+        self.assertEqual(self._pairs_raw_count(), 1)
+        self.assertEqual(len(report.files), 2)
+        self.assertTrue(all("date=2026-03-01" in path and path.endswith(".jsonl.gz") for path in report.files))
+
+        alerts = []
+        replayed = run_backtest(
+            self.db,
+            self.settings,
+            alert_sink=alerts.append,
+            rows=itertools.chain(iter_archive_replay_rows(self.archive_dir), iter_db_replay_rows(self.db)),
+        )
+        self.assertEqual(replayed.to_dict(), expected.to_dict())
+        self.assertEqual([alert.to_dict() for alert in alerts], [alert.to_dict() for alert in expected_alerts])
+
+        again = archive_pairs_raw(self.db, self.archive_dir, older_than_days=1, now=T0 + timedelta(days=1))
+        self.assertEqual(again.archived_rows, 0)
+
+    def test_rescored_snapshot_is_replayed_and_archived_once(self) -> None:
+        with self.db.connect() as conn:
+            pair_raw_id = conn.execute("SELECT id FROM pairs_raw WHERE token_address = '0xtokenB'").fetchone()[0]
+        rescored = build_candidate("B", 70_000, 60)
+        rescored.pair_raw_id = pair_raw_id
+        self.db.insert_scan_results([rescored])
+
+        ids = [row["id"] for row in self.db.iter_replay_rows()]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(ids.count(pair_raw_id), 1)
+        self.assertEqual(run_backtest(self.db, self.settings).rows_read, self._pairs_raw_count())
+
+        report = archive_pairs_raw(self.db, self.archive_dir, older_than_days=1, now=T0 + timedelta(days=1, minutes=10))
+
+        self.assertEqual((report.archived_rows, report.deleted_rows), (6, 6))
+        archived = [record["id"] for record in iter_archive_records(self.archive_dir)]
+        self.assertEqual(archived.count(pair_raw_id), 1)
+
+    def test_reader_filters_by_time_range_in_fetch_order(self) -> None:
+        archive_pairs_raw(self.db, self.archive_dir, older_than_days=0, chunk_rows=3, now=T0 + timedelta(days=2))
+
+        records = list(iter_archive_records(self.archive_dir, start=T0 + timedelta(minutes=1)))
+
+        self.assertEqual(
+            [(record["token_address"], record["fetched_at"]) for record in records],
+            [
+                ("0xtokenC", "2026-03-01 12:02:00"),
+                ("0xtokenA", "2026-03-01 12:06:00"),
+                ("0xtokenE", "2026-03-02 12:00:00"),
+            ],
+        )
+
+    def test_run_retention_reclaims_free_pages(self) -> None:
+        self.assertFalse(self.db.enable_incremental_vacuum())
+        bulky = []
+        for index in range(200):
+            candidate = build_candidate(f"X{index}", 50_000, 30)
+            candidate.pair.raw["padding"] = "x" * 2_000
+            bulky.append(candidate)
+        self._insert_cycle(T0, bulky)
+
+        settings = replace(
+            self.settings,
+            retention_days=1,
+            retention_archive_dir=str(self.archive_dir),
+            retention_vacuum_pages=0,
+        )
+        report = run_retention(self.db, settings, now=T0 + timedelta(days=1, minutes=10))
+
+        self.assertEqual(report.archived_rows, 206)
+        self.assertGreater(report.vacuumed_pages, 0)
+        with self.db.connect() as conn:
+            self.assertEqual(conn.execute("PRAGMA freelist_count").fetchone()[0], 0)
+
+    @unittest.skipIf(pa is None, "pyarrow not installed")
+    def test_parquet_archives_round_trip(self) -> None:
+        report = archive_pairs_raw(
+            self.db, self.archive_dir, older_than_days=1, fmt="parquet", now=T0 + timedelta(days=1, minutes=10)
+        )
+
+        self.assertTrue(all(path.endswith(".parquet") for path in report.files))
+        self.assertEqual(len(list(iter_archive_records(self.archive_dir))), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
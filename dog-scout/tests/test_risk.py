@@ -0,0 +1,149 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from dog_scout.clients.risk_apis import GoPlusBackend, HoneypotIsBackend
+from dog_scout.filters import apply_hard_filters
+from dog_scout.risk import CompositeRiskProvider
+
+from stub_server import serve
+from test_day2_features import build_settings
+from test_storage import build_candidate
+
+DELAY_SECONDS = 0.2
+
+
+class RiskStubState:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.requests: list[str] = []
+        self.slow_honeypot_tokens: set[str] = set()
+        self.honeypots: set[str] = set()
+
+
+def build_handler(state: RiskStubState) -> type[BaseHTTPRequestHandler]:
+    class StubHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):  # noqa: A002, ANN001
+            return
+
+        def _write_json(self, payload) -> None:  # noqa: ANN001
+            body = json.dumps(payload).encode("utf-8")
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                return  # the client already timed out
+
+        def do_GET(self) -> None:  # noqa: N802
+            url = urlsplit(self.path)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            with state.lock:
+                state.requests.append(url.path)
+            if url.path == "/v2/IsHoneypot":
+                token = query["address"]
+                time.sleep(DELAY_SECONDS * (4 if token in state.slow_honeypot_tokens else 1))
+                self._write_json(
+                    {
+                        "token": {"totalHolders": 900},
+                        "summary": {"risk": "low", "flags": ["high_tax"] if token.endswith("1") else []},
+                        "honeypotResult": {"isHoneypot": token in state.honeypots},
+                    }
+                )
+                return
+
+            token = query["contract_addresses"]
+            time.sleep(DELAY_SECONDS)
+            self._write_json(
+                {
+                    "code": 1,
+                    "result": {
+                        token.lower(): {
+                            "is_honeypot": "0",
+                            "is_mintable": "1",
+                            "holder_count": "420",
+                            "holders": [{"percent": "0.25"}, {"percent": "0.1"}, {"percent": "0.05"}],
+                        }
+                    },
+                }
+            )
+
+    return StubHandler
+
+
+class CompositeRiskProviderTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state = RiskStubState()
+        base_url = serve(self, build_handler(self.state))
+        self.provider = CompositeRiskProvider(
+            [
+                GoPlusBackend(timeout_seconds=2.0, base_url=base_url),
+                HoneypotIsBackend(timeout_seconds=0.5, base_url=base_url),
+            ],
+            denylist_tokens={"0xdenied"},
+            cache_ttl_seconds=300,
+            max_workers=8,
+        )
+
+    def tearDown(self) -> None:
+        self.provider.close()
+
+    def test_backends_run_in_parallel_and_merge(self) -> None:
+        tokens = [(f"0xtoken{index}", "base") for index in range(4)]
+
+        started = time.monotonic()
+        risks = self.provider.assess_tokens(tokens)
+        elapsed = time.monotonic() - started
+
+        # Eight calls of 0.2s each finish in roughly one round.
+        self.assertLess(elapsed, DELAY_SECONDS * 4)
+        first = risks[1]
+        self.assertFalse(first.is_honeypot)
+        self.assertEqual(first.holders, 420)  # first backend with a value wins
+        self.assertAlmostEqual(first.top10_concentration, 0.4)
+        self.assertEqual(first.risk_flags, ["goplus:is_mintable", "honeypot_is:high_tax"])
+        self.assertEqual(first.metadata["backends"], ["goplus", "honeypot_is"])
+
+    def test_results_are_cached_per_token(self) -> None:
+        self.provider.assess_tokens([("0xtoken0", "base"), ("0xTOKEN0", "base")])
+        self.provider.assess_token("0xtoken0", "base")
+
+        self.assertEqual(len(self.state.requests), 2)
+        self.assertEqual(self.provider.cache_stats.snapshot()["hits"], 1)
+
+    def test_slow_backend_times_out_without_blocking_the_rest(self) -> None:
+        self.state.slow_honeypot_tokens.add("0xtoken2")
+
+        risk = self.provider.assess_token("0xtoken2", "base")
+        self.provider.assess_token("0xtoken2", "base")
+
+        self.assertEqual(risk.holders, 420)
+        self.assertEqual(risk.metadata["failed_backends"], ["honeypot_is"])
+        self.assertIn("risk_backend_unavailable:honeypot_is", risk.risk_flags)
+        # Partial results are not cached.
+        self.assertEqual(len(self.state.requests), 4)
+
+    def test_verdicts_reach_the_hard_filters(self) -> None:
+        self.state.honeypots.add("0xtoken3")
+        settings = build_settings(Path("./unused.db"))
+        pair = build_candidate(3).pair
+
+        honeypot, denied, other_chain = self.provider.assess_tokens(
+            [("0xtoken3", "base"), ("0xDenied", "base"), ("SoLToken", "solana")]
+        )
+
+        self.assertIn("risk_provider_block", apply_hard_filters(pair, honeypot, settings).reasons)
+        self.assertTrue(denied.is_honeypot)
+        self.assertEqual((other_chain.holders, other_chain.risk_flags), (None, []))
+        # Only the honeypot token reached the backends.
+        self.assertEqual(len(self.state.requests), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import random
+import unittest
+from pathlib import Path
+
+from dog_scout.config import Settings
+from dog_scout.models import PairSnapshot
+from dog_scout.scoring import score_pair
+
+try:
+    import numpy as np
+
+    from dog_scout.scoring_batch import pair_columns, round2, score_pairs_batch
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+def build_settings() -> Settings:
+    return Settings(
+        db_path=Path("./test.db"),
+        chain_id="base",
+        loop_interval_seconds=120,
+        top_n=5,
+        dedup_cooldown_minutes=30,
+        dry_run=True,
+        use_mock_data=True,
+        request_timeout_seconds=10,
+        max_new_tokens=20,
+        min_liquidity_usd=20_000,
+        min_holders=200,
+        max_top10_concentration=0.45,
+        denylist_tokens=set(),
+        txn_target_h1=100,
+        momentum_blowoff_threshold=80.0,
+        llm_enabled=False,
+        llm_provider="deepseek",
+        llm_base_url="https://api.deepseek.com/v1",
+        llm_api_key="",
+        llm_model="deepseek-chat",
+        llm_timeout_seconds=12,
+        llm_weight=0.30,
+        rule_weight=0.70,
+        recheck_batch_size=20,
+        telegram_enabled=False,
+        telegram_bot_token="",
+        telegram_chat_id="",
+    )
+
+
+EDGE_CHANGES = [None, -60.0, -60.01, -12.0, 12.0, 12.0001, 20.0, 25.0, 45.0, 80.0, 80.01, 0.0, 250.0]
+
+
+def build_pairs(count: int, seed: int) -> list[PairSnapshot]:
+    rng = random.Random(seed)
+    pairs: list[PairSnapshot] = []
+    for index in range(count):
+        if index % 4 == 0:
+            h1 = rng.choice(EDGE_CHANGES)
+            h24 = rng.choice(EDGE_CHANGES)
+        else:
+            h1 = None if rng.random() < 0.05 else rng.uniform(-95, 300)
+            h24 = None if rng.random() < 0.05 else rng.uniform(-95, 500)
+        liquidity = rng.choice([0.0, 80_000.0, 1e9, round(rng.uniform(0, 150_000), 2), rng.lognormvariate(10, 2)])
+        pairs.append(
+            PairSnapshot(
+                chain_id="base",
+                pair_address=f"0xpair{index}",
+                dex_id="uniswap",
+                base_token_address=f"0xtoken{index}",
+                base_token_symbol="DOG",
+                quote_token_symbol="WETH",
+                price_usd=0.001,
+                liquidity_usd=liquidity,
+                volume_h24=100_000,
+                txns_h1_buys=rng.randint(-5, 400),
+                txns_h1_sells=rng.randint(-5, 400),
+                price_change_h1=h1,
+                price_change_h24=h24,
+                pair_created_at=None,
+                raw={},
+            )
+        )
+    return pairs
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class BatchScoringTests(unittest.TestCase):
+    def test_batch_matches_score_pair_bit_for_bit(self) -> None:
+        settings = build_settings()
+        for blowoff in (80.0, 45.0, 30.0):
+            settings.momentum_blowoff_threshold = blowoff
+            pairs = build_pairs(5_000, seed=int(blowoff))
+            batch = score_pairs_batch(settings=settings, **pair_columns(pairs))
+
+            for index, pair in enumerate(pairs):
+                expected = score_pair(pair, settings)
+                actual = batch.breakdown(index)
+                self.assertEqual(
+                    (
+                        actual.liquidity_score,
+                        actual.txn_activity_score,
+                        actual.momentum_score,
+                        actual.final_score,
+                        actual.rule_score,
+                    ),
+                    (
+                        expected.liquidity_score,
+                        expected.txn_activity_score,
+                        expected.momentum_score,
+                        expected.final_score,
+                        expected.rule_score,
+                    ),
+                    msg=f"pair #{index}: {pair}",
+                )
+
+    def test_round2_matches_builtin_round_on_ties(self) -> None:
+        values = np.array([0.125, 0.135, 2.675, 1.005, 33.345, 99.995, 0.0, 12.5], dtype=np.float64)
+        rng = random.Random(7)
+        values = np.concatenate([values, np.array([rng.randint(0, 10_000) / 1000 for _ in range(5_000)])])
+
+        rounded = round2(values)
+
+        self.assertEqual(rounded.tolist(), [round(float(value), 2) for value in values])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from dog_scout.clients.dexscreener import DexscreenerClient
+from dog_scout.models import TokenProfile
+from dog_scout.pipeline import ScoutPipeline
+from dog_scout.seen import FETCH, RESCORE, SKIP, SeenTokenIndex
+from dog_scout.storage import Database
+
+from stub_server import serve
+from test_day2_features import build_settings
+from test_dexscreener_client import TOKENS, StubState, build_handler
+from test_storage import build_candidate
+
+T = 1_772_366_400.0
+
+
+class SeenTokenIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = SeenTokenIndex(refetch_seconds=300)
+        self.profile = TokenProfile(chain_id="base", token_address="0xTokenA", fingerprint="v1")
+        self.pair = build_candidate(1).pair
+
+    def test_repeat_tokens_are_rescored_or_skipped_until_refetch(self) -> None:
+        self.assertEqual(self.index.decide(self.profile, now=T), FETCH)
+        self.index.record_fetch(self.profile, self.pair, now=T)
+        self.index.record_outcome(self.profile, pair_raw_id=7, passed_filters=True)
+
+        same_token = replace(self.profile, token_address="0xtokena")
+        self.assertEqual(self.index.decide(same_token, now=T + 120), RESCORE)
+        self.assertEqual(self.index.get(same_token).pair_raw_id, 7)
+        self.index.record_outcome(self.profile, pair_raw_id=7, passed_filters=False)
+        self.assertEqual(self.index.decide(self.profile, now=T + 120), SKIP)
+        self.assertEqual(self.index.decide(self.profile, now=T + 300), FETCH)
+
+    def test_changed_profile_or_other_chain_is_fetched(self) -> None:
+        self.index.record_fetch(self.profile, self.pair, now=T)
+
+        self.assertEqual(self.index.decide(replace(self.profile, fingerprint="v2"), now=T + 1), FETCH)
+        self.assertEqual(self.index.decide(replace(self.profile, chain_id="solana"), now=T + 1), FETCH)
+
+    def test_expired_entries_are_swept(self) -> None:
+        self.index.record_fetch(self.profile, self.pair, now=T)
+        self.index.record_fetch(replace(self.profile, token_address="0xtokenB"), self.pair, now=T + 200)
+        self.index.record_fetch(replace(self.profile, token_address="0xtokenC"), self.pair, now=T + 400)
+
+        self.assertEqual(len(self.index), 2)
+
+
+class SeenTokenPipelineTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.state = StubState()
+        self.base_url = serve(self, build_handler(self.state))
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_second_cycle_reuses_snapshots_without_upstream_calls(self) -> None:
+        settings = replace(
+            build_settings(Path(self.tmpdir.name) / "dog_scout.db", llm_enabled=False),
+            use_mock_data=False,
+            seen_token_refetch_seconds=600,
+            denylist_tokens={TOKENS[1], TOKENS[2]},
+        )
+        db = Database(settings.db_path)
+        db.ensure_initialized()
+        try:
+            client = DexscreenerClient(timeout_seconds=5, max_concurrency=6, base_url=self.base_url)
+            pipeline = ScoutPipeline(settings=settings, db=db, client=client)
+            first = pipeline.run_once()
+            second = pipeline.run_once()
+            with db.connect() as conn:
+                pairs_raw, signals = conn.execute(
+                    "SELECT (SELECT COUNT(*) FROM pairs_raw), (SELECT COUNT(*) FROM signals)"
+                ).fetchone()
+        finally:
+            db.close()
+
+        self.assertEqual((first.fetched_pairs, first.rescored_pairs, first.skipped_tokens), (11, 0, 0))
+        # The token without pairs is asked again; the two denylisted ones are skipped.
+        self.assertEqual(self.state.pair_requests, len(TOKENS) + 1)
+        self.assertEqual((second.fetched_pairs, second.rescored_pairs, second.skipped_tokens), (9, 9, 2))
+        self.assertEqual(second.per_chain["base"].skipped_tokens, 2)
+        # Re-scored candidates still compete for the slots the first cycle's alerts left open.
+        self.assertEqual(second.selected, 3)
+        self.assertEqual((pairs_raw, signals), (11, 20))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import tempfile
+import time
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from dog_scout.storage import Database
+
+from test_storage import build_candidate
+
+try:
+    import numpy as np
+
+    from dog_scout.snapshots import SnapshotStore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class SnapshotStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = Database(Path(self.tmpdir.name) / "dog_scout.db")
+        self.db.ensure_initialized()
+        self.store = SnapshotStore(self.db)
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def _scan(self, liquidity_by_index: dict[int, float]) -> None:
+        candidates = []
+        for index, liquidity in liquidity_by_index.items():
+            candidate = build_candidate(index)
+            candidate.pair = replace(candidate.pair, liquidity_usd=liquidity, price_change_h1=None if index == 2 else 8.0)
+            candidates.append(candidate)
+        self.db.insert_scan_results(candidates)
+
+    def test_histories_are_columnar_and_time_ordered(self) -> None:
+        started = time.time()
+        self._scan({1: 10_000, 2: 20_000})
+        time.sleep(0.01)
+        self._scan({1: 11_000})
+        time.sleep(0.01)
+        middle = time.time()
+        self._scan({1: 12_500, 2: 19_000})
+
+        histories = self.store.histories(["0xpair1", "0xpair2", "0xmissing"])
+
+        first = histories["0xpair1"]
+        self.assertEqual(first.liquidity_usd.dtype, np.float64)
+        np.testing.assert_array_equal(first.liquidity_usd, [10_000, 11_000, 12_500])
+        np.testing.assert_array_equal(first.txns_h1, [30, 30, 30])
+        self.assertTrue(np.all(np.diff(first.fetched_at) > 0))
+        self.assertGreaterEqual(first.fetched_at[0], started)
+        self.assertTrue(np.isnan(histories["0xpair2"].price_change_h1).all())
+        self.assertEqual(len(histories["0xmissing"]), 0)
+
+        recent = self.store.history("0xpair1", start=middle)
+        np.testing.assert_array_equal(recent.liquidity_usd, [12_500])
+
+    def test_migration_backfills_from_pairs_raw(self) -> None:
+        candidate = build_candidate(7)
+        candidate.pair.raw = {"priceChange": {"h1": 4.5, "h24": -3.0}}
+        self.db.insert_scan_results([candidate])
+        with self.db.connect() as conn:
+            conn.execute("DELETE FROM pair_snapshots")
+            conn.execute("DELETE FROM applied_migrations WHERE filename = '005_pair_snapshots.sql'")
+            conn.execute("UPDATE pairs_raw SET fetched_at = '2026-03-01 12:00:00'")
+
+        self.db.ensure_initialized()
+
+        history = self.store.history("0xpair7")
+        np.testing.assert_array_equal(history.fetched_at, [1772366400.0])
+        np.testing.assert_array_equal(history.price_change_h1, [4.5])
+        np.testing.assert_array_equal(history.price_change_h24, [-3.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from dog_scout.models import Candidate, FilterOutcome, PairSnapshot, RiskAssessment, ScoreBreakdown
+from dog_scout.storage import Database
+
+
+def build_candidate(index: int, passed: bool = True) -> Candidate:
+    pair = PairSnapshot(
+        chain_id="base",
+        pair_address=f"0xpair{index}",
+        dex_id="uniswap",
+        base_token_address=f"0xtoken{index}",
+        base_token_symbol=f"DOG{index}",
+        quote_token_symbol="WETH",
+        price_usd=0.001,
+        liquidity_usd=50_000 + index,
+        volume_h24=100_000,
+        txns_h1_buys=20,
+        txns_h1_sells=10,
+        price_change_h1=8.0,
+        price_change_h24=17.0,
+        pair_created_at=None,
+        raw={"index": index},
+    )
+    return Candidate(
+        pair=pair,
+        risk=RiskAssessment(is_honeypot=False, risk_flags=[]),
+        filter_outcome=FilterOutcome(passed=passed, reasons=[], skipped_checks=[]),
+        score=ScoreBreakdown(30.0, 20.0, 15.0, 65.0 + index, rule_score=65.0 + index),
+    )
+
+
+class StorageBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "dog_scout.db"
+        self.db = Database(self.db_path)
+        self.db.ensure_initialized()
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def _query(self, sql: str) -> list[sqlite3.Row]:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            return conn.execute(sql).fetchall()
+        finally:
+            conn.close()
+
+    def test_insert_scan_results_returns_matching_row_ids(self) -> None:
+        self.db.insert_pair_raw(build_candidate(99).pair)
+        candidates = [build_candidate(index) for index in range(5)]
+
+        ids = self.db.insert_scan_results(candidates)
+
+        self.assertEqual(len(ids), 5)
+        rows = self._query(
+            """
+            SELECT s.id AS signal_id, p.id AS pair_raw_id, p.pair_address, s.final_score
+            FROM signals s JOIN pairs_raw p ON p.id = s.pair_raw_id
+            ORDER BY s.id
+            """
+        )
+        for candidate, (pair_raw_id, signal_id), row in zip(candidates, ids, rows):
+            self.assertEqual(candidate.pair_raw_id, pair_raw_id)
+            self.assertEqual(candidate.signal_id, signal_id)
+            self.assertEqual(int(row["pair_raw_id"]), pair_raw_id)
+            self.assertEqual(int(row["signal_id"]), signal_id)
+            self.assertEqual(row["pair_address"], candidate.pair.pair_address)
+            self.assertAlmostEqual(float(row["final_score"]), candidate.score.final_score)
+
+    def test_signal_stores_trend_component(self) -> None:
+        trended = build_candidate(1)
+        trended.score.trend_score = 72.5
+        self.db.insert_scan_results([trended, build_candidate(2)])
+
+        rows = self._query("SELECT trend_score FROM signals ORDER BY id")
+
+        self.assertEqual([row["trend_score"] for row in rows], [72.5, None])
+
+    def test_batch_commits_once_and_rolls_back_on_error(self) -> None:
+        candidate = build_candidate(1)
+        self.db.insert_scan_results([candidate])
+        statements: list[str] = []
+        with self.db.connect() as conn:
+            conn.set_trace_callback(lambda statement: statements.append(statement.strip().upper()))
+
+        with self.assertRaises(RuntimeError):
+            with self.db.batch():
+                alert_id = self.db.insert_alert(candidate, "msg", dry_run=True, status="dry_run", sent=False)
+                self.db.enqueue_recheck_jobs(candidate, alert_id, (5, 15))
+                raise RuntimeError("boom")
+
+        self.assertEqual(self._query("SELECT COUNT(*) AS n FROM alerts")[0]["n"], 0)
+        self.assertEqual(self._query("SELECT COUNT(*) AS n FROM recheck_jobs")[0]["n"], 0)
+        self.assertEqual((statements.count("COMMIT"), statements.count("ROLLBACK")), (0, 1))
+
+        statements.clear()
+        with self.db.batch():
+            alert_id = self.db.insert_alert(candidate, "msg", dry_run=True, status="dry_run", sent=False)
+            self.db.enqueue_recheck_jobs(candidate, alert_id, (5, 15))
+
+        self.assertEqual((statements.count("COMMIT"), statements.count("ROLLBACK")), (1, 0))
+        self.assertEqual(self._query("SELECT COUNT(*) AS n FROM alerts")[0]["n"], 1)
+        self.assertEqual(self._query("SELECT COUNT(*) AS n FROM recheck_jobs")[0]["n"], 2)
+
+
+class StorageConnectionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "nested" / "dog_scout.db"
+        self.db = Database(self.db_path, cache_size_kib=4096, mmap_size_bytes=0)
+        self.db.ensure_initialized()
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_connection_is_reused_with_wal_pragmas(self) -> None:
+        with self.db.connect() as first:
+            journal_mode = first.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = first.execute("PRAGMA synchronous").fetchone()[0]
+            cache_size = first.execute("PRAGMA cache_size").fetchone()[0]
+        with self.db.connect() as second:
+            self.assertIs(first, second)
+
+        self.assertEqual(journal_mode, "wal")
+        self.assertEqual(synchronous, 1)  # NORMAL
+        self.assertEqual(cache_size, -4096)
+
+    def test_open_reader_does_not_block_writer(self) -> None:
+        self.db.insert_scan_results([build_candidate(0)])
+
+        with self.db.reader() as reader:
+            reader.execute("BEGIN")
+            before = reader.execute("SELECT COUNT(*) FROM pairs_raw").fetchone()[0]
+
+            started = time.monotonic()
+            self.db.insert_scan_results([build_candidate(1)])
+            self.assertLess(time.monotonic() - started, 1.0)
+
+            # Snapshot isolation: the open read transaction still sees the old state.
+            self.assertEqual(reader.execute("SELECT COUNT(*) FROM pairs_raw").fetchone()[0], before)
+            with self.assertRaises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM pairs_raw")
+
+        with self.db.reader() as reader:
+            self.assertEqual(reader.execute("SELECT COUNT(*) FROM pairs_raw").fetchone()[0], 2)
+
+    def test_threads_share_database_safely(self) -> None:
+        errors: list[BaseException] = []
+
+        def worker(offset: int) -> None:
+            try:
+                for index in range(10):
+                    self.db.insert_scan_results([build_candidate(offset * 100 + index)])
+            except BaseException as exc:  # noqa: BLE001
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        with self.db.connect() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0], 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+import random
+import tempfile
+import unittest
+from datetime import timedelta
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional analytics dependency
+    np = None
+
+from dog_scout.analyzer import AnalyzerOutput
+from dog_scout.backtest import BacktestEngine, ReplayRow, run_backtest
+from dog_scout.config import apply_setting_overrides
+from dog_scout.models import PairSnapshot, RiskAssessment
+from dog_scout.storage import Database
+
+from test_backtest import T0, build_candidate, build_settings
+
+if np is not None:
+    from dog_scout.sweep import build_dataset, evaluate_variant, expand_grid, load_dataset, parse_grid, run_sweep
+
+COMPARED_FIELDS = (
+    "alerts",
+    "unique_tokens",
+    "candidates_passed",
+    "recheck_status",
+    "matched_live_alerts",
+    "replay_only_alerts",
+    "feedback_matched",
+    "feedback_wins",
+    "feedback_avg_pnl_pct",
+)
+
+
+def synthetic_rows(seed: int = 7, cycles: int = 80, tokens: int = 25) -> list[ReplayRow]:
+    rng = random.Random(seed)
+    rows: list[ReplayRow] = []
+    row_id = 0
+    for cycle in range(cycles):
+        cycle_at = T0 + timedelta(minutes=2 * cycle)
+        for offset, index in enumerate(sorted(rng.sample(range(tokens), rng.randint(0, 6)))):
+            row_id += 1
+            h1 = None if rng.random() < 0.1 else round(rng.uniform(-70, 120), 2)
+            pair = PairSnapshot(
+                chain_id="base",
+                pair_address=f"0xpair{index}",
+                dex_id="uniswap",
+                base_token_address=f"0xTOKEN{index}",
+                base_token_symbol=f"T{index}",
+                quote_token_symbol="WETH",
+                price_usd=0.001,
+                liquidity_usd=round(rng.uniform(1_000, 150_000), 2),
+                volume_h24=100_000,
+                txns_h1_buys=rng.randint(0, 120),
+                txns_h1_sells=rng.randint(0, 120),
+                price_change_h1=h1,
+                price_change_h24=None if h1 is None else round(rng.uniform(-50, 150), 2),
+                pair_created_at=T0,
+            )
+            llm_output = None
+            if rng.random() < 0.5:
+                llm_output = AnalyzerOutput(
+                    narrative_score=round(rng.uniform(0, 100), 2),
+                    risk_comment="replay",
+                    action_hint="replay",
+                    confidence=0.5,
+                    reasons=["recorded_llm_score"],
+                )
+            rows.append(
+                ReplayRow(
+                    pair_raw_id=row_id,
+                    fetched_at=cycle_at + timedelta(seconds=offset),
+                    pair=pair,
+                    risk=RiskAssessment(
+                        is_honeypot=rng.random() < 0.05,
+                        risk_flags=[],
+                        holders=None if rng.random() < 0.3 else rng.randint(0, 400),
+                        top10_concentration=None if rng.random() < 0.3 else round(rng.uniform(0.1, 0.8), 4),
+                    ),
+                    llm_output=llm_output,
+                    is_recheck=rng.random() < 0.15,
+                )
+            )
+    return rows
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class SweepTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "dog_scout.db"
+        self.settings = build_settings(self.db_path)
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_variants_match_backtest_engine(self) -> None:
+        rows = synthetic_rows()
+        dataset = build_dataset(rows)
+        grid = {
+            "min_liquidity_usd": ["10000", "40000"],
+            "dedup_cooldown_minutes": ["4", "30"],
+            "rule_weight": ["0.5", "0.9"],
+            "top_n": ["1", "3"],
+            "denylist_tokens": ["", "0xtoken3,0xtoken4"],
+            "recheck_minutes": ["5,15", "1,30"],
+        }
+
+        for overrides in expand_grid(grid):
+            settings = apply_setting_overrides(self.settings, overrides)
+            expected = BacktestEngine(settings).run(rows)
+            actual = evaluate_variant(dataset, self.settings, overrides)
+            with self.subTest(overrides=overrides):
+                self.assertGreater(expected.alerts, 0)
+                for name in COMPARED_FIELDS:
+                    self.assertEqual(getattr(actual, name), getattr(expected, name), name)
+
+    def test_process_pool_matches_in_process_results(self) -> None:
+        dataset = build_dataset(synthetic_rows(seed=11))
+        variants = expand_grid(parse_grid(["min_liquidity_usd=5000,20000,60000", "top_n=2,4"]))
+
+        serial = run_sweep(dataset, self.settings, variants, max_workers=1)
+        pooled = run_sweep(dataset, self.settings, variants, max_workers=2)
+
+        self.assertEqual([item.to_dict() for item in pooled], [item.to_dict() for item in serial])
+        self.assertEqual([item.overrides for item in pooled], variants)
+
+    def test_recheck_schedule_axis_changes_results(self) -> None:
+        dataset = build_dataset(synthetic_rows(seed=5))
+
+        default, custom = run_sweep(dataset, self.settings, [{}, {"recheck_minutes": "1,5,60"}], max_workers=1)
+
+        self.assertEqual(sum(default.recheck_status.values()), default.alerts * 2)
+        self.assertEqual(sum(custom.recheck_status.values()), custom.alerts * 3)
+
+    def test_database_dataset_includes_live_alerts_and_feedback(self) -> None:
+        db = Database(self.db_path)
+        db.ensure_initialized()
+        try:
+            candidates = [build_candidate("A", 90_000, 60), build_candidate("B", 60_000, 40)]
+            db.insert_scan_results(candidates)
+            with db.connect() as conn:
+                conn.execute("UPDATE pairs_raw SET fetched_at = ?", (T0.strftime("%Y-%m-%d %H:%M:%S"),))
+            alert_id = db.insert_alert(candidates[0], "m", dry_run=True, status="dry_run", sent=False)
+            with db.connect() as conn:
+                conn.execute(
+                    "UPDATE alerts SET created_at = ? WHERE id = ?",
+                    (T0.strftime("%Y-%m-%d %H:%M:%S"), alert_id),
+                )
+                conn.execute(
+                    "INSERT INTO trade_feedback (alert_id, outcome, pnl_pct) VALUES (?, 'win', 12.5)",
+                    (alert_id,),
+                )
+
+            dataset = load_dataset(db)
+            expected = run_backtest(db, self.settings)
+        finally:
+            db.close()
+
+        result = evaluate_variant(dataset, self.settings, {})
+        for name in COMPARED_FIELDS:
+            self.assertEqual(getattr(result, name), getattr(expected, name), name)
+        self.assertEqual(result.matched_live_alerts, 1)
+        self.assertEqual(result.feedback_win_rate, 1.0)
+
+    def test_unknown_setting_fails_before_work_starts(self) -> None:
+        dataset = build_dataset(synthetic_rows(cycles=3))
+        with self.assertRaises(ValueError):
+            run_sweep(dataset, self.settings, [{"min_liquidity": "1"}, {"top_n": "2"}], max_workers=2)
+        with self.assertRaises(ValueError):
+            parse_grid(["top_n"])
+        with self.assertRaisesRegex(ValueError, "trend_weight"):
+            run_sweep(dataset, self.settings, [{"top_n": "2"}, {"trend_weight": "0.2"}], max_workers=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,317 @@
+import tempfile
+import threading
+import time
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from dog_scout.pipeline import ScoutPipeline
+from dog_scout.storage import Database
+from dog_scout.worker import RecheckScheduler, RecheckWorker
+
+from test_day2_features import build_settings
+
+
+class RecheckTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        db_path = Path(self.tmpdir.name) / "dog_scout.db"
+        self.settings = replace(build_settings(db_path, llm_enabled=False), recheck_mode="external")
+        self.db = Database(db_path)
+        self.db.ensure_initialized()
+        self.pipeline = ScoutPipeline(settings=self.settings, db=self.db)
+
+    def tearDown(self) -> None:
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def _make_jobs_due(self, minutes_ago: int = 2) -> int:
+        with self.db.connect() as conn:
+            conn.execute(
+                "UPDATE recheck_jobs SET due_at = datetime('now', ?) WHERE status = 'pending'",
+                (f"-{minutes_ago} minutes",),
+            )
+            return conn.execute("SELECT COUNT(*) FROM recheck_jobs WHERE status = 'pending'").fetchone()[0]
+
+    def _job_statuses(self) -> dict[str, int]:
+        with self.db.connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM recheck_jobs GROUP BY status").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+
+class RecheckWorkerTests(RecheckTestCase):
+    def test_scan_leaves_due_jobs_to_the_worker(self) -> None:
+        first = self.pipeline.run_once()
+        pending = self._make_jobs_due()
+
+        second = self.pipeline.run_once()
+
+        self.assertEqual(first.selected * 2, pending)
+        self.assertEqual(second.rechecked, 0)
+        # The second scan may enqueue more jobs, but none were claimed.
+        self.assertEqual(set(self._job_statuses()), {"pending"})
+        self.assertGreaterEqual(self._job_statuses()["pending"], pending)
+
+    def test_worker_processes_jobs_concurrently_and_reports_lateness(self) -> None:
+        self.pipeline.run_once()
+        pending = self._make_jobs_due(minutes_ago=2)
+
+        lock = threading.Lock()
+        in_flight = {"now": 0, "max": 0}
+        original = self.pipeline._refresh_pair_for_recheck
+
+        def slow_refresh(job):  # noqa: ANN001, ANN202
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            try:
+                time.sleep(0.05)
+                return original(job)
+            finally:
+                with lock:
+                    in_flight["now"] -= 1
+
+        self.pipeline._refresh_pair_for_recheck = slow_refresh
+        outcomes = RecheckWorker(self.pipeline, concurrency=3).run_once()
+
+        self.assertEqual(len(outcomes), pending)
+        self.assertTrue(all(outcome.succeeded for outcome in outcomes))
+        self.assertTrue(all(outcome.lateness_seconds >= 110 for outcome in outcomes))
+        self.assertGreater(in_flight["max"], 1)
+        self.assertLessEqual(in_flight["max"], 3)
+        self.assertEqual(self._job_statuses(), {"done": pending})
+        with self.db.connect() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM recheck_results").fetchone()[0], pending)
+
+    def test_background_thread_drains_jobs_and_stops(self) -> None:
+        self.pipeline.run_once()
+        pending = self._make_jobs_due()
+
+        worker = RecheckWorker(self.pipeline, concurrency=2, poll_seconds=0.1)
+        worker.start()
+        try:
+            deadline = time.monotonic() + 5
+            while self._job_statuses().get("done", 0) < pending and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            worker.stop(timeout=5)
+
+        self.assertEqual(self._job_statuses(), {"done": pending})
+
+    def test_inline_mode_still_drains_in_run_once(self) -> None:
+        pipeline = ScoutPipeline(settings=replace(self.settings, recheck_mode="inline"), db=self.db)
+        pipeline.run_once()
+        pending = self._make_jobs_due()
+
+        result = pipeline.run_once()
+
+        self.assertEqual(result.rechecked, pending)
+
+
+class RecheckSchedulerTests(RecheckTestCase):
+    def _set_due(self, sql_offset: str, where: str = "status = 'pending'") -> int:
+        with self.db.connect() as conn:
+            sql = f"UPDATE recheck_jobs SET due_at = datetime('now', ?) WHERE {where}"
+            return conn.execute(sql, (sql_offset,)).rowcount
+
+    def test_wakes_at_due_time_from_rehydrated_heap(self) -> None:
+        self.pipeline.run_once()
+        soon = self._set_due("+1 seconds", where="scheduled_minutes = 5")
+        scheduler = RecheckScheduler(self.pipeline, concurrency=2, refresh_seconds=30)
+        scheduler.start()
+        try:
+            deadline = time.monotonic() + 5
+            while self._job_statuses().get("done", 0) < soon and time.monotonic() < deadline:
+                time.sleep(0.05)
+        finally:
+            scheduler.stop(timeout=5)
+
+        self.assertEqual(self._job_statuses(), {"done": soon, "pending": soon})
+        lateness = self.pipeline.metrics.snapshot()["dog_scout_recheck_lateness_seconds"]
+        # Woken by the timer, not a 30s refresh; due_at has second resolution.
+        self.assertTrue(all(summary["p99"] < 1.5 for summary in lateness))
+
+    def test_new_jobs_are_picked_up_and_claims_stay_exclusive(self) -> None:
+        first = RecheckScheduler(self.pipeline, concurrency=2)
+        second = RecheckScheduler(self.pipeline, concurrency=2)
+        self.assertEqual((first.rehydrate(), second.rehydrate()), (0, 0))
+        self.pipeline.run_once()
+        pending = self._make_jobs_due()
+        self.assertEqual((first.refresh(), second.refresh()), (pending, pending))
+
+        # Both heaps hold every job; the DB claim lets each run exactly once.
+        outcomes = first.run_once() + second.run_once()
+
+        self.assertEqual(len(outcomes), pending)
+        self.assertEqual(self._job_statuses(), {"done": pending})
+        self.assertEqual(self.db.claim_recheck_jobs([outcome.job_id for outcome in outcomes]), [])
+
+    def test_configurable_schedule_reaches_jobs_and_timeline(self) -> None:
+        settings = replace(self.settings, recheck_minutes=(1, 5, 15, 60))
+        pipeline = ScoutPipeline(settings=settings, db=self.db)
+        result = pipeline.run_once()
+        self.assertIn("首发分 -> 1m分 -> 5m分 -> 15m分 -> 60m分：", result.messages[0])
+        with self.db.connect() as conn:
+            minutes = [row[0] for row in conn.execute("SELECT DISTINCT scheduled_minutes FROM recheck_jobs ORDER BY 1")]
+        self.assertEqual(minutes, [1, 5, 15, 60])
+
+        scheduler = RecheckScheduler(pipeline)
+        self._set_due("-1 seconds", where="scheduled_minutes = 1")
+        outcomes = scheduler.run_once()
+        self._set_due("-1 seconds", where="scheduled_minutes = 5")
+        outcomes += scheduler.run_once()
+
+        self.assertEqual(len(outcomes), result.selected * 2)
+        latest = outcomes[-1]
+        self.assertRegex(latest.message, r"60m分：[\d.]+ -> [\d.]+ -> [\d.]+ -> -- -> --")
+
+
+class RecheckRetryTests(RecheckTestCase):
+    def _expire_leases(self) -> None:
+        with self.db.connect() as conn:
+            conn.execute("UPDATE recheck_jobs SET lease_until = datetime('now', '-1 seconds') WHERE status = 'running'")
+
+    def test_expired_leases_are_requeued_until_attempts_run_out(self) -> None:
+        self.pipeline.run_once()
+        pending = self._make_jobs_due()
+        claimed = self.db.claim_due_recheck_jobs(limit=pending, lease_seconds=60)
+        with self.db.connect() as conn:
+            conn.execute("UPDATE recheck_jobs SET attempts = 3 WHERE id = ?", (claimed[0].id,))
+
+        # Leases still live: nothing to reap.
+        self.assertEqual(self.pipeline.reap_recheck_leases(), [])
+        self._expire_leases()
+        requeued = self.pipeline.reap_recheck_leases()
+
+        self.assertEqual(sorted(job_id for job_id, _ in requeued), sorted(job.id for job in claimed[1:]))
+        self.assertEqual(self._job_statuses(), {"pending": pending - 1, "failed": 1})
+        outcomes = RecheckWorker(self.pipeline).run_once()
+        self.assertEqual(len(outcomes), pending - 1)
+        self.assertEqual(self._job_statuses(), {"done": pending - 1, "failed": 1})
+
+    def test_failed_attempts_back_off_then_fail(self) -> None:
+        settings = replace(self.settings, recheck_max_attempts=2, recheck_backoff_seconds=30)
+        pipeline = ScoutPipeline(settings=settings, db=self.db)
+        pipeline.run_once()
+        pending = self._make_jobs_due()
+        pipeline._refresh_pair_for_recheck = lambda job: None  # noqa: ARG005
+
+        scheduler = RecheckScheduler(pipeline)
+        first = scheduler.run_once()
+
+        self.assertEqual(len(first), pending)
+        self.assertTrue(all(not outcome.succeeded and outcome.retry_at is not None for outcome in first))
+        self.assertEqual(self._job_statuses(), {"pending": pending})
+        with self.db.connect() as conn:
+            waits = conn.execute(
+                "SELECT MIN(strftime('%s', due_at) - strftime('%s', 'now')), MIN(last_error) FROM recheck_jobs"
+            ).fetchone()
+        self.assertTrue(28 <= waits[0] <= 30)
+        self.assertIn("No market data", waits[1])
+        self.assertEqual(scheduler.run_once(), [])  # not due yet
+
+        self._make_jobs_due()
+        second = scheduler.run_once()
+
+        self.assertTrue(all(outcome.retry_at is None for outcome in second))
+        self.assertEqual(self._job_statuses(), {"failed": pending})
+
+    def test_retry_after_recorded_result_does_not_resend(self) -> None:
+        self.pipeline.run_once()
+        pending = self._make_jobs_due()
+        outcomes = RecheckWorker(self.pipeline).run_once()
+        self.assertTrue(all(outcome.message for outcome in outcomes))
+        # Simulate workers that recorded the result but died before marking their jobs done.
+        with self.db.connect() as conn:
+            conn.execute("UPDATE recheck_jobs SET status = 'running', lease_until = datetime('now', '-1 seconds')")
+
+        retried = RecheckWorker(self.pipeline).run_once()
+
+        self.assertEqual(len(retried), pending)
+        self.assertTrue(all(outcome.succeeded and outcome.message is None for outcome in retried))
+        self.assertEqual(self._job_statuses(), {"done": pending})
+        with self.db.connect() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM recheck_results").fetchone()[0], pending)
+
+
+class RecheckContextTests(RecheckTestCase):
+    def test_inline_batch_loads_context_once_and_sees_earlier_results(self) -> None:
+        pipeline = ScoutPipeline(settings=replace(self.settings, recheck_mode="inline"), db=self.db)
+        pipeline.run_once()
+        pending = self._make_jobs_due()
+        batches: list[list[int]] = []
+        original = self.db.load_recheck_context
+
+        def counting_load(job_ids, minutes=(5, 15)):  # noqa: ANN001, ANN202
+            batches.append(list(job_ids))
+            return original(job_ids, minutes)
+
+        self.db.load_recheck_context = counting_load
+        result = pipeline.run_once()
+
+        self.assertEqual(result.rechecked, pending)
+        self.assertEqual([len(batch) for batch in batches], [pending])
+        self._assert_later_jobs_build_on_earlier(pending)
+
+    def test_worker_runs_jobs_of_one_alert_in_order_within_a_claim(self) -> None:
+        self.pipeline.run_once()
+        pending = self._make_jobs_due()
+        original = self.pipeline._refresh_pair_for_recheck
+
+        def slow_refresh(job):  # noqa: ANN001, ANN202
+            time.sleep(0.05)  # keep every job in flight long enough to overlap if they ran in parallel
+            return original(job)
+
+        self.pipeline._refresh_pair_for_recheck = slow_refresh
+        for dispatcher in (RecheckWorker(self.pipeline, concurrency=8), RecheckScheduler(self.pipeline, concurrency=8)):
+            with self.subTest(dispatcher=type(dispatcher).__name__):
+                with self.db.connect() as conn:
+                    conn.execute("DELETE FROM recheck_results")
+                    conn.execute("UPDATE recheck_jobs SET status = 'pending', attempts = 0")
+
+                # Both jobs of every alert are due, so they arrive in one claim.
+                outcomes = dispatcher.run_once()
+
+                self.assertEqual(len(outcomes), pending)
+                self.assertTrue(all(outcome.succeeded for outcome in outcomes))
+                self._assert_later_jobs_build_on_earlier(pending)
+
+    def _assert_later_jobs_build_on_earlier(self, pending: int) -> None:
+        with self.db.connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT late.delta_from_previous, late.current_score - early.current_score AS expected, late.message
+                FROM recheck_results late
+                JOIN recheck_results early
+                  ON early.source_alert_id = late.source_alert_id AND early.scheduled_minutes = 5
+                WHERE late.scheduled_minutes = 15
+                """
+            ).fetchall()
+        self.assertEqual(len(rows), pending // 2)
+        for row in rows:
+            # The 15m job ran after the 5m job of the same batch and built on its score.
+            self.assertAlmostEqual(row["delta_from_previous"], row["expected"], places=2)
+            self.assertNotIn("-> -- ->", row["message"])
+
+    def test_context_marks_recorded_results_and_skips_missing_alerts(self) -> None:
+        self.pipeline.run_once()
+        self._make_jobs_due()
+        outcomes = RecheckWorker(self.pipeline).run_once()
+        job_ids = [outcome.job_id for outcome in outcomes]
+        with self.db.connect() as conn:
+            gone = conn.execute("SELECT source_alert_id FROM recheck_jobs WHERE id = ?", (job_ids[0],)).fetchone()[0]
+            conn.execute("DELETE FROM alerts WHERE id = ?", (gone,))
+            kept = [row[0] for row in conn.execute("SELECT id FROM recheck_jobs WHERE source_alert_id != ?", (gone,))]
+
+        contexts = self.db.load_recheck_context(job_ids)
+
+        self.assertEqual(sorted(contexts), sorted(kept))
+        for context in contexts.values():
+            self.assertTrue(context.has_result)
+            self.assertEqual(set(context.timeline.scores), {5, 15})
+            expected = None if context.scheduled_minutes == 5 else context.timeline.scores[5]
+            self.assertEqual(context.previous_score, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()